@@ -0,0 +1,5 @@
+# mocks/__init__.py
+from mocks.restful_booker import RestfulBookerServer
+from mocks.shady_meadows import ShadyMeadowsServer
+
+__all__ = ["RestfulBookerServer", "ShadyMeadowsServer"]
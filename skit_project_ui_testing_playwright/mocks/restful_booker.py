@@ -0,0 +1,371 @@
+# mocks/restful_booker.py
+"""Локална (in-process, async) замена за https://restful-booker.herokuapp.com
+со истите рути и статуси и латенција/грешки по рута (`Fault`).
+
+    python -m mocks.restful_booker --port 3001 --latency lognormal:20:0.5 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import secrets
+import sys
+import threading
+from datetime import date
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from aiohttp import web
+
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "password123"
+BASIC_AUTH = "Basic " + base64.b64encode(f"{ADMIN_USERNAME}:{ADMIN_PASSWORD}".encode()).decode()
+
+ROUTES = ("ping", "auth", "list", "create", "get", "update", "partial", "delete")
+
+
+# ============================ LATENCY / ERRORS ===============================
+
+class Latency(NamedTuple):
+    """Распределба на додадена латенција во ms; `parse("uniform:10:50")` од CLI."""
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        kind, *params = spec.split(":")
+        if kind not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"unknown latency distribution {kind!r}")
+        values = [float(p) for p in params] + [0.0, 0.0]
+        return cls(kind, values[0], values[1])
+
+    def sample(self, rnd: random.Random) -> float:
+        if self.kind == "uniform":
+            return rnd.uniform(self.a, self.b)
+        if self.kind == "normal":                 # a = средина, b = стандардна девијација
+            return max(0.0, rnd.gauss(self.a, self.b))
+        if self.kind == "lognormal":              # a = медијана, b = sigma
+            return rnd.lognormvariate(0, self.b) * self.a if self.a else 0.0
+        return self.a
+
+
+class Fault(NamedTuple):
+    latency: Latency = Latency()
+    error_rate: float = 0.0
+    error_status: int = 503
+
+
+# ================================= STORE =====================================
+
+class Booking(NamedTuple):
+    firstname: str
+    lastname: str
+    totalprice: int
+    depositpaid: bool
+    checkin: int          # date.toordinal()
+    checkout: int
+    additionalneeds: str
+
+
+def booking_from_json(payload: Dict) -> Optional[Booking]:
+    """None ако недостига задолжително поле (оригиналот тогаш враќа 500)."""
+    try:
+        dates = payload["bookingdates"]
+        return Booking(
+            sys.intern(str(payload["firstname"])),
+            sys.intern(str(payload["lastname"])),
+            int(payload["totalprice"]),
+            bool(payload["depositpaid"]),
+            date.fromisoformat(dates["checkin"]).toordinal(),
+            date.fromisoformat(dates["checkout"]).toordinal(),
+            sys.intern(str(payload.get("additionalneeds", ""))),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def booking_json(booking: Booking) -> Dict:
+    data = {
+        "firstname": booking.firstname,
+        "lastname": booking.lastname,
+        "totalprice": booking.totalprice,
+        "depositpaid": booking.depositpaid,
+        "bookingdates": {
+            "checkin": date.fromordinal(booking.checkin).isoformat(),
+            "checkout": date.fromordinal(booking.checkout).isoformat(),
+        },
+    }
+    if booking.additionalneeds:
+        data["additionalneeds"] = booking.additionalneeds
+    return data
+
+
+class BookingStore:
+    """Резервации и токени; пристап само од event loop-от на серверот (без lock)."""
+
+    def __init__(self):
+        self.bookings: Dict[int, Booking] = {}
+        self.tokens = set()
+        self._next_id = 1
+
+    def reset(self) -> None:
+        self.bookings.clear()
+        self.tokens.clear()
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self.bookings)
+
+    def add(self, booking: Booking) -> int:
+        booking_id = self._next_id
+        self._next_id += 1
+        self.bookings[booking_id] = booking
+        return booking_id
+
+    def seed(self, count: int, rnd: Optional[random.Random] = None) -> None:
+        """Пополнува `count` случајни резервации (за list/get под товар)."""
+        rnd = rnd or random.Random(0)
+        today = date.today().toordinal()
+        names = [sys.intern(f"User{i}") for i in range(1000)]
+        for _ in range(count):
+            checkin = today + rnd.randint(1, 365)
+            self.add(Booking(rnd.choice(names), rnd.choice(names), rnd.randint(50, 499), rnd.random() < 0.5,
+                             checkin, checkin + rnd.randint(1, 4), "Breakfast"))
+
+    def filter(self, firstname: Optional[str] = None, lastname: Optional[str] = None,
+               checkin: Optional[int] = None, checkout: Optional[int] = None) -> Iterator[int]:
+        for booking_id, b in self.bookings.items():
+            if firstname is not None and b.firstname != firstname:
+                continue
+            if lastname is not None and b.lastname != lastname:
+                continue
+            if checkin is not None and b.checkin < checkin:
+                continue
+            if checkout is not None and b.checkout > checkout:
+                continue
+            yield booking_id
+
+    def login(self, username: str, password: str) -> Optional[str]:
+        if username != ADMIN_USERNAME or password != ADMIN_PASSWORD:
+            return None
+        token = secrets.token_hex(8)[:15]
+        self.tokens.add(token)
+        return token
+
+
+# ================================== APP ======================================
+
+class _Api:
+    def __init__(self, store: BookingStore, faults: Dict[str, Fault], rnd: random.Random):
+        self.store = store
+        self.faults = faults
+        self.rnd = rnd
+
+    def routes(self) -> List[web.RouteDef]:
+        return [
+            web.get("/ping", self._wrap("ping", self.ping)),
+            web.post("/auth", self._wrap("auth", self.auth)),
+            web.get("/booking", self._wrap("list", self.list_bookings)),
+            web.post("/booking", self._wrap("create", self.create)),
+            web.get("/booking/{id:\\d+}", self._wrap("get", self.get)),
+            web.put("/booking/{id:\\d+}", self._wrap("update", self.update)),
+            web.patch("/booking/{id:\\d+}", self._wrap("partial", self.partial)),
+            web.delete("/booking/{id:\\d+}", self._wrap("delete", self.delete)),
+        ]
+
+    def _wrap(self, route: str, handler):
+        async def _handler(request: web.Request) -> web.StreamResponse:
+            fault = self.faults.get(route) or self.faults.get("*")
+            if fault is not None:
+                delay = fault.latency.sample(self.rnd)
+                if delay > 0:
+                    await asyncio.sleep(delay / 1000)
+                if fault.error_rate and self.rnd.random() < fault.error_rate:
+                    return web.Response(status=fault.error_status, text="Service Unavailable")
+            return await handler(request)
+        return _handler
+
+    def _authorized(self, request: web.Request) -> bool:
+        return (request.cookies.get("token") in self.store.tokens
+                or request.headers.get("Authorization") == BASIC_AUTH)
+
+    @staticmethod
+    async def _json_body(request: web.Request) -> Dict:
+        try:
+            payload = json.loads(await request.read() or b"{}")
+        except ValueError:
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    # --------------------------------------------------------------- handlers
+
+    async def ping(self, request):
+        return web.Response(status=201, text="Created")
+
+    async def auth(self, request):
+        payload = await self._json_body(request)
+        token = self.store.login(payload.get("username"), payload.get("password"))
+        if token is None:
+            return web.json_response({"reason": "Bad credentials"})
+        return web.json_response({"token": token})
+
+    async def list_bookings(self, request):
+        q = request.query
+        try:
+            checkin = date.fromisoformat(q["checkin"]).toordinal() if "checkin" in q else None
+            checkout = date.fromisoformat(q["checkout"]).toordinal() if "checkout" in q else None
+        except ValueError:
+            return web.Response(status=500, text="Internal Server Error")
+        ids = self.store.filter(q.get("firstname"), q.get("lastname"), checkin, checkout)
+        return web.json_response([{"bookingid": i} for i in ids])
+
+    async def create(self, request):
+        booking = booking_from_json(await self._json_body(request))
+        if booking is None:
+            return web.Response(status=500, text="Internal Server Error")
+        booking_id = self.store.add(booking)
+        return web.json_response({"bookingid": booking_id, "booking": booking_json(booking)})
+
+    async def get(self, request):
+        booking = self.store.bookings.get(int(request.match_info["id"]))
+        if booking is None:
+            return web.Response(status=404, text="Not Found")
+        return web.json_response(booking_json(booking))
+
+    async def update(self, request):
+        return await self._modify(request, partial=False)
+
+    async def partial(self, request):
+        return await self._modify(request, partial=True)
+
+    async def _modify(self, request, partial: bool):
+        if not self._authorized(request):
+            return web.Response(status=403, text="Forbidden")
+        booking_id = int(request.match_info["id"])
+        current = self.store.bookings.get(booking_id)
+        if current is None:
+            return web.Response(status=405, text="Method Not Allowed")
+        payload = await self._json_body(request)
+        if partial:
+            merged = booking_json(current)
+            merged.update({k: v for k, v in payload.items() if k != "bookingdates"})
+            merged["bookingdates"].update(payload.get("bookingdates") or {})
+            payload = merged
+        booking = booking_from_json(payload)
+        if booking is None:
+            return web.Response(status=400, text="Bad Request")
+        self.store.bookings[booking_id] = booking
+        return web.json_response(booking_json(booking))
+
+    async def delete(self, request):
+        if not self._authorized(request):
+            return web.Response(status=403, text="Forbidden")
+        if self.store.bookings.pop(int(request.match_info["id"]), None) is None:
+            return web.Response(status=405, text="Method Not Allowed")
+        return web.Response(status=201, text="Created")
+
+
+def create_app(store: Optional[BookingStore] = None, faults: Optional[Dict[str, Fault]] = None,
+               seed: Optional[int] = None) -> web.Application:
+    """aiohttp апликација – за `aiohttp.web.run_app` или сопствен runner."""
+    unknown = set(faults or {}) - set(ROUTES) - {"*"}
+    if unknown:
+        raise ValueError(f"unknown fault routes {sorted(unknown)}; expected {ROUTES} or '*'")
+    app = web.Application()
+    store = store if store is not None else BookingStore()   # празен store е falsy (__len__)
+    app.add_routes(_Api(store, dict(faults or {}), random.Random(seed)).routes())
+    return app
+
+
+# ================================= SERVER ====================================
+
+class RestfulBookerServer:
+    """
+    In-process restful-booker. `port=0` → слободна порта; адресата е во `url`
+    по `start()`. Серверот има свој event loop во позадинска нишка, па може
+    да се користи и од sync тестови и од друг asyncio loop (perf/crud_load.py).
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 faults: Optional[Dict[str, Fault]] = None, seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.store = BookingStore()
+        self.app = create_app(self.store, faults, seed)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "RestfulBookerServer":
+        if self._thread is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="restful-booker", daemon=True)
+            self._thread.start()
+            asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    async def _start(self) -> None:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._thread = self._loop = self._runner = None
+
+    def reset(self) -> None:
+        self._call(self.store.reset)
+
+    def seed(self, count: int, rnd: Optional[random.Random] = None) -> None:
+        self._call(self.store.seed, count, rnd)
+
+    def _call(self, fn, *args) -> None:
+        # store-от го менува само event loop-от на серверот
+        if self._loop is None:
+            fn(*args)
+            return
+
+        async def _run():
+            fn(*args)
+        asyncio.run_coroutine_threadsafe(_run(), self._loop).result()
+
+    def __enter__(self) -> "RestfulBookerServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local restful-booker stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--latency", type=Latency.parse, default=Latency(),
+                        help="added latency, e.g. fixed:20, uniform:10:50, normal:30:5, lognormal:20:0.5 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--seed-bookings", type=int, default=0, help="pre-populate N random bookings")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for latency/error injection")
+    args = parser.parse_args()
+
+    store = BookingStore()
+    store.seed(args.seed_bookings)
+    app = create_app(store, {"*": Fault(args.latency, args.error_rate)}, args.seed)
+    print(f"Serving restful-booker on http://{args.host}:{args.port} (Ctrl+C to stop)")
+    web.run_app(app, host=args.host, port=args.port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1019 @@
+# mocks/shady_meadows.py
+"""Локална (in-process, stdlib) замена за https://automationintesting.online – истите
+рути, JSON API-ја и DOM id/класи што ги користи MainPage, со валидацијата на
+restful-booker-platform; состојбата е во меморија (`reset()`).
+
+    python -m mocks.shady_meadows --port 8080     # рачно, во browser
+"""
+
+import argparse
+import html
+import json
+import re
+import secrets
+import threading
+from datetime import date, timedelta
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "password"
+
+ROOMS: List[Dict] = [
+    {
+        "roomid": 1,
+        "roomName": "101",
+        "type": "Single",
+        "accessible": True,
+        "image": "/images/room1.svg",
+        "description": "Aenean porttitor mauris sit amet lacinia molestie. In posuere accumsan aliquet.",
+        "features": ["TV", "WiFi", "Safe"],
+        "roomPrice": 100,
+    },
+    {
+        "roomid": 2,
+        "roomName": "102",
+        "type": "Double",
+        "accessible": True,
+        "image": "/images/room2.svg",
+        "description": "Vestibulum sollicitudin, lectus ac mollis consequat, lorem orci ultrices tellus.",
+        "features": ["TV", "Radio", "WiFi", "Safe"],
+        "roomPrice": 150,
+    },
+    {
+        "roomid": 3,
+        "roomName": "103",
+        "type": "Suite",
+        "accessible": False,
+        "image": "/images/room3.svg",
+        "description": "Etiam metus metus, fringilla ac sagittis id, consequat vel neque.",
+        "features": ["TV", "Radio", "WiFi", "Safe", "Views"],
+        "roomPrice": 225,
+    },
+]
+
+# Hibernate @Email: локален дел + домен од лабели одделени со ЕДНА точка
+# (TLD не е задолжителен → `mila@domain` се прифаќа, како на демото).
+_EMAIL_RE = re.compile(
+    r"^[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+    r"@[A-Za-z0-9]([A-Za-z0-9-]*[A-Za-z0-9])?(\.[A-Za-z0-9]([A-Za-z0-9-]*[A-Za-z0-9])?)*$"
+)
+_PHONE_RE = re.compile(r"^[0-9+()\-\s]+$")
+
+
+# ============================ VALIDATION =====================================
+
+def _length_error(value: str, low: int, high: int, label: str) -> Optional[str]:
+    if not value:
+        return f"{label} may not be blank"
+    if not low <= len(value) <= high:
+        return f"{label} must be between {low} and {high} characters."
+    return None
+
+
+def _email_error(value: str) -> Optional[str]:
+    if not value:
+        return "Email may not be blank"
+    if not _EMAIL_RE.match(value):
+        return "must be a well-formed email address"
+    return None
+
+
+def _phone_error(value: str) -> Optional[str]:
+    error = _length_error(value, 11, 21, "Phone")
+    if error:
+        return error
+    if not _PHONE_RE.match(value):
+        return "Phone may only contain digits, spaces and + - ( )"
+    return None
+
+
+def validate_message(payload: Dict) -> Tuple[Dict[str, str], List[str]]:
+    """Trim + валидација на contact порака. Враќа (чисти податоци, грешки)."""
+    data = {k: str(payload.get(k) or "").strip()
+            for k in ("name", "email", "phone", "subject", "description")}
+    errors = [e for e in (
+        None if data["name"] else "Name may not be blank",
+        _email_error(data["email"]),
+        _phone_error(data["phone"]),
+        _length_error(data["subject"], 5, 100, "Subject"),
+        _length_error(data["description"], 20, 2000, "Message"),
+    ) if e]
+    return data, errors
+
+
+def _parse_iso(value: str) -> Optional[date]:
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def validate_booking(payload: Dict) -> Tuple[Dict, List[str]]:
+    """Trim + валидација на резервација. Датумите се враќаат како `date`."""
+    dates = payload.get("bookingdates")
+    if not isinstance(dates, dict):
+        dates = {}                     # "2030-01-10" / [..] → иста грешка како без датуми
+    data = {k: str(payload.get(k) or "").strip()
+            for k in ("firstname", "lastname", "email", "phone")}
+    data["roomid"] = payload.get("roomid")
+    data["checkin"] = _parse_iso(dates.get("checkin", ""))
+    data["checkout"] = _parse_iso(dates.get("checkout", ""))
+
+    errors = [e for e in (
+        _length_error(data["firstname"], 3, 18, "Firstname"),
+        _length_error(data["lastname"], 3, 30, "Lastname"),
+        _email_error(data["email"]),
+        _phone_error(data["phone"]),
+    ) if e]
+    if data["checkin"] is None or data["checkout"] is None:
+        errors.append("Booking dates must be valid dates (YYYY-MM-DD)")
+    elif data["checkout"] <= data["checkin"]:
+        errors.append("Checkout must be after checkin")
+    return data, errors
+
+
+def _overlaps(a_in: date, a_out: date, b_in: date, b_out: date) -> bool:
+    return a_in < b_out and b_in < a_out
+
+
+# ============================== STATE ========================================
+
+class SiteState:
+    """Целата „база“ на сајтот. Сите пристапи одат под `lock`."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.rooms: Dict[int, Dict] = {r["roomid"]: dict(r) for r in ROOMS}
+            self.bookings: Dict[int, Dict] = {}
+            self.messages: Dict[int, Dict] = {}
+            self.tokens: set = set()
+            self._next_booking = 1
+            self._next_message = 1
+
+    # -- rooms / bookings --
+
+    def is_free(self, room_id: int, checkin: date, checkout: date) -> bool:
+        return not any(
+            b["roomid"] == room_id and _overlaps(checkin, checkout, b["checkin"], b["checkout"])
+            for b in self.bookings.values()
+        )
+
+    def available_rooms(self, checkin: Optional[date], checkout: Optional[date]) -> List[Dict]:
+        with self.lock:
+            rooms = list(self.rooms.values())
+            if checkin and checkout and checkout > checkin:
+                rooms = [r for r in rooms if self.is_free(r["roomid"], checkin, checkout)]
+            return rooms
+
+    def add_booking(self, data: Dict) -> Tuple[int, Dict]:
+        """Враќа (HTTP статус, тело) – 201, 404 или 409 при преклопување."""
+        with self.lock:
+            try:
+                room_id = int(data["roomid"])
+            except (TypeError, ValueError):
+                return 400, {"errors": ["Room id must be a number"]}
+            if room_id not in self.rooms:
+                return 404, {"error": f"Room {room_id} not found"}
+            if not self.is_free(room_id, data["checkin"], data["checkout"]):
+                return 409, {"error": "The room dates are either invalid or are already booked "
+                                      "for one or more of the dates that you have selected."}
+            booking = {**data, "roomid": room_id, "bookingid": self._next_booking}
+            self.bookings[booking["bookingid"]] = booking
+            self._next_booking += 1
+            return 201, booking_json(booking)
+
+    def unavailable(self, room_id: int) -> List[Dict]:
+        with self.lock:
+            return [
+                {"start": b["checkin"].isoformat(), "end": b["checkout"].isoformat(), "title": "Unavailable"}
+                for b in sorted(self.bookings.values(), key=lambda b: b["checkin"])
+                if b["roomid"] == room_id
+            ]
+
+    # -- messages / auth --
+
+    def add_message(self, data: Dict[str, str]) -> Dict:
+        with self.lock:
+            message = {**data, "messageid": self._next_message, "read": False}
+            self.messages[message["messageid"]] = message
+            self._next_message += 1
+            return message
+
+    def login(self, username: str, password: str) -> Optional[str]:
+        if username != ADMIN_USERNAME or password != ADMIN_PASSWORD:
+            return None
+        token = secrets.token_hex(8)
+        with self.lock:
+            self.tokens.add(token)
+        return token
+
+    def is_authenticated(self, token: Optional[str]) -> bool:
+        with self.lock:
+            return bool(token) and token in self.tokens
+
+    def logout(self, token: Optional[str]) -> None:
+        with self.lock:
+            self.tokens.discard(token)
+
+
+def booking_json(booking: Dict) -> Dict:
+    return {
+        "bookingid": booking["bookingid"],
+        "roomid": booking["roomid"],
+        "firstname": booking["firstname"],
+        "lastname": booking["lastname"],
+        "depositpaid": False,
+        "email": booking["email"],
+        "phone": booking["phone"],
+        "bookingdates": {
+            "checkin": booking["checkin"].isoformat(),
+            "checkout": booking["checkout"].isoformat(),
+        },
+    }
+
+
+# ============================== HTML =========================================
+
+_STYLE = """
+* { box-sizing: border-box; }
+body { margin: 0; font-family: Arial, Helvetica, sans-serif; color: #212529; background: #fff; }
+a { color: #0d6efd; }
+.container { width: 100%; max-width: 1140px; margin: 0 auto; padding: 0 12px; }
+.row { display: flex; flex-wrap: wrap; margin: 0 -12px; }
+.row > * { width: 100%; padding: 0 12px; }
+.navbar { background: #fff; border-bottom: 1px solid #dee2e6; padding: 8px 0; }
+.navbar .container { display: flex; flex-wrap: wrap; align-items: center; justify-content: space-between; }
+.navbar-brand { font-size: 1.25rem; font-weight: bold; text-decoration: none; color: #212529; }
+.navbar-toggler { display: none; background: none; border: 1px solid #ced4da; border-radius: 4px; padding: 4px 8px; }
+.navbar-collapse { display: flex; }
+.navbar-nav { display: flex; list-style: none; margin: 0; padding: 0; }
+.nav-link { display: block; padding: 8px 12px; text-decoration: none; color: #495057; }
+section { padding: 32px 0; }
+.hero { background: #e9ecef; padding: 48px 0; }
+.card { border: 1px solid #dee2e6; border-radius: 6px; margin-bottom: 16px; background: #fff; }
+.card-body { padding: 16px; }
+.card-footer { padding: 12px 16px; border-top: 1px solid #dee2e6; display: flex; justify-content: space-between; align-items: center; }
+.card-img-top { width: 100%; height: 160px; object-fit: cover; display: block; }
+.form-control { display: block; width: 100%; padding: 8px 12px; margin-bottom: 12px; border: 1px solid #ced4da; border-radius: 4px; font-size: 1rem; }
+textarea.form-control { min-height: 120px; }
+.btn { display: inline-block; padding: 8px 16px; border: 1px solid transparent; border-radius: 4px; cursor: pointer; font-size: 1rem; text-decoration: none; }
+.btn-primary { background: #0d6efd; color: #fff; }
+.btn-outline-primary { background: #fff; color: #0d6efd; border-color: #0d6efd; }
+.alert { padding: 12px 16px; border-radius: 4px; margin-bottom: 12px; }
+.alert-danger { background: #f8d7da; color: #842029; border: 1px solid #f5c2c7; }
+.alert p { margin: 0; }
+.map { width: 100%; height: 240px; background: #dfe7ef; display: block; }
+table { width: 100%; border-collapse: collapse; }
+td, th { border-bottom: 1px solid #dee2e6; padding: 6px; text-align: left; }
+@media (min-width: 768px) { .col-md-4 { width: 33.3333%; } .col-md-6 { width: 50%; } }
+@media (min-width: 992px) { .col-lg-8 { width: 66.6667%; } .col-lg-4 { width: 33.3333%; } }
+@media (max-width: 991.98px) {
+  .navbar-toggler { display: inline-block; }
+  .navbar-collapse { display: none; width: 100%; }
+  .navbar-collapse.show { display: block; }
+  .navbar-nav { flex-direction: column; }
+}
+"""
+
+# hamburger-от е ЕДИНСТВЕНОТО копче со <svg> (MainPage.nav_toggler го бара така)
+_NAVBAR = """
+<nav class="navbar">
+  <div class="container">
+    <a class="navbar-brand" href="/">Shady Meadows B&amp;B</a>
+    <button class="navbar-toggler" type="button" aria-label="Toggle navigation">
+      <svg width="20" height="16" viewBox="0 0 20 16" aria-hidden="true">
+        <path d="M0 1h20M0 8h20M0 15h20" stroke="#495057" stroke-width="2"/>
+      </svg>
+    </button>
+    <div class="navbar-collapse" id="navbarNav">
+      <ul class="navbar-nav">
+        <li><a class="nav-link" href="/#/rooms">Rooms</a></li>
+        <li><a class="nav-link" href="/#/booking">Booking</a></li>
+        <li><a class="nav-link" href="/#/amenities">Amenities</a></li>
+        <li><a class="nav-link" href="/#/location">Location</a></li>
+        <li><a class="nav-link" href="/#/contact">Contact</a></li>
+        <li><a class="nav-link" href="/admin">Admin</a></li>
+      </ul>
+    </div>
+  </div>
+</nav>
+"""
+
+_COMMON_JS = """
+function esc(value) {
+  var d = document.createElement('div');
+  d.textContent = value == null ? '' : String(value);
+  return d.innerHTML;
+}
+function showErrors(container, errors) {
+  var box = document.createElement('div');
+  box.className = 'alert alert-danger';
+  box.setAttribute('role', 'alert');
+  errors.forEach(function (e) { var p = document.createElement('p'); p.textContent = e; box.appendChild(p); });
+  var old = container.querySelector('.alert-danger');
+  if (old) { old.remove(); }
+  container.insertBefore(box, container.firstChild);
+}
+function errorsOf(body) {
+  if (body && body.errors) { return body.errors; }
+  if (body && body.error) { return [body.error]; }
+  return ['Something went wrong'];
+}
+function postJson(url, payload) {
+  return fetch(url, {
+    method: 'POST', headers: {'Content-Type': 'application/json'}, body: JSON.stringify(payload)
+  }).then(function (r) {
+    return r.text().then(function (t) { return {status: r.status, body: t ? JSON.parse(t) : {}}; });
+  });
+}
+(function () {
+  var toggler = document.querySelector('.navbar-toggler');
+  var nav = document.getElementById('navbarNav');
+  if (!toggler || !nav) { return; }
+  toggler.addEventListener('click', function () { nav.classList.toggle('show'); });
+  nav.querySelectorAll('a').forEach(function (a) {
+    a.addEventListener('click', function () { nav.classList.remove('show'); });
+  });
+})();
+"""
+
+_HOME_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Restful-booker-platform demo</title>
+<style>""" + _STYLE + """</style>
+</head>
+<body>
+""" + _NAVBAR + """
+<section class="hero">
+  <div class="container">
+    <h1>Welcome to Shady Meadows B&amp;B</h1>
+    <p>Welcome to Shady Meadows, a delightful Bed &amp; Breakfast nestled in the hills.</p>
+  </div>
+</section>
+
+<section id="booking">
+  <div class="container">
+    <div class="card">
+      <div class="card-body">
+        <h3>Check Availability &amp; Book Your Stay</h3>
+        <form>
+          <div class="row">
+            <div class="col-md-4"><label for="checkin">Check In</label>
+              <input type="text" class="form-control" id="checkin" autocomplete="off"></div>
+            <div class="col-md-4"><label for="checkout">Check Out</label>
+              <input type="text" class="form-control" id="checkout" autocomplete="off"></div>
+            <div class="col-md-4"><label>&nbsp;</label>
+              <button type="button" class="btn btn-primary" id="checkAvailability">Check Availability</button></div>
+          </div>
+        </form>
+      </div>
+    </div>
+  </div>
+</section>
+
+<section id="rooms">
+  <div class="container">
+    <h2>Our Rooms</h2>
+    <p>Comfortable beds and delightful breakfast from locally sourced ingredients.</p>
+    <div class="row" id="room-list"></div>
+  </div>
+</section>
+
+<section id="amenities">
+  <div class="container">
+    <h2>Amenities</h2>
+    <ul><li>Free WiFi</li><li>Breakfast included</li><li>Free parking</li></ul>
+  </div>
+</section>
+
+<section id="location">
+  <div class="container">
+    <h2>Location</h2>
+    <img class="map" src="/images/map.svg" alt="Map">
+    <p>The Old Farmhouse, Shady Street, Newfordburyshire, NE1 410S</p>
+  </div>
+</section>
+
+<section id="contact">
+  <div class="container">
+    <div class="card">
+      <div class="card-body contact-body">
+        <h2>Send Us a Message</h2>
+        <form novalidate>
+          <label for="name">Name</label>
+          <input type="text" class="form-control" id="name" data-testid="ContactName">
+          <label for="email">Email</label>
+          <input type="email" class="form-control" id="email" data-testid="ContactEmail">
+          <label for="phone">Phone</label>
+          <input type="tel" class="form-control" id="phone" data-testid="ContactPhone">
+          <label for="subject">Subject</label>
+          <input type="text" class="form-control" id="subject" data-testid="ContactSubject">
+          <label for="description">Message</label>
+          <textarea class="form-control" id="description" data-testid="ContactDescription"></textarea>
+          <button type="submit" class="btn btn-primary">Submit</button>
+        </form>
+      </div>
+    </div>
+  </div>
+</section>
+
+<footer class="container"><p>&copy; Shady Meadows B&amp;B 2025</p></footer>
+
+<script>""" + _COMMON_JS + """
+function pad(n) { return (n < 10 ? '0' : '') + n; }
+function ddmmyyyy(d) { return pad(d.getDate()) + '/' + pad(d.getMonth() + 1) + '/' + d.getFullYear(); }
+function toIso(value) {
+  var m = /^(\\d{2})\\/(\\d{2})\\/(\\d{4})$/.exec((value || '').trim());
+  return m ? m[3] + '-' + m[2] + '-' + m[1] : '';
+}
+
+var checkin = document.getElementById('checkin');
+var checkout = document.getElementById('checkout');
+var today = new Date();
+checkin.value = ddmmyyyy(new Date(today.getTime() + 86400000));
+checkout.value = ddmmyyyy(new Date(today.getTime() + 2 * 86400000));
+
+function renderRooms(rooms, ci, co) {
+  var list = document.getElementById('room-list');
+  list.innerHTML = '';
+  if (!rooms.length) {
+    list.innerHTML = '<p class="no-rooms">No rooms free for the selected dates.</p>';
+    return;
+  }
+  rooms.forEach(function (r) {
+    var col = document.createElement('div');
+    col.className = 'col-md-4';
+    col.innerHTML =
+      '<div class="card room-card">' +
+        '<img class="card-img-top" src="' + esc(r.image) + '" alt="Room ' + esc(r.roomName) + '">' +
+        '<div class="card-body"><h5 class="card-title">' + esc(r.type) + '</h5>' +
+        '<p class="card-text">' + esc(r.description) + '</p>' +
+        '<p class="features">' + r.features.map(esc).join(', ') + '</p></div>' +
+        '<div class="card-footer"><span class="price">&pound;' + r.roomPrice + ' per night</span>' +
+        '<a class="btn btn-primary" href="/reservation/' + r.roomid +
+          '?checkin=' + ci + '&checkout=' + co + '">Book now</a></div>' +
+      '</div>';
+    list.appendChild(col);
+  });
+}
+
+function loadRooms() {
+  var ci = toIso(checkin.value), co = toIso(checkout.value);
+  document.getElementById('room-list').innerHTML = '';
+  return fetch('/api/room?checkin=' + ci + '&checkout=' + co)
+    .then(function (r) { return r.json(); })
+    .then(function (body) { renderRooms(body.rooms, ci, co); });
+}
+
+document.getElementById('checkAvailability').addEventListener('click', function () {
+  loadRooms();
+  document.getElementById('rooms').scrollIntoView();
+});
+document.querySelector('#booking form').addEventListener('submit', function (ev) {
+  ev.preventDefault();
+  loadRooms();
+});
+
+var form = document.querySelector('#contact form');
+var sending = false;
+form.addEventListener('submit', function (ev) {
+  ev.preventDefault();
+  if (sending) { return; }
+  sending = true;
+  var payload = {};
+  ['name', 'email', 'phone', 'subject', 'description'].forEach(function (k) {
+    payload[k] = document.getElementById(k).value;
+  });
+  postJson('/api/message', payload).then(function (res) {
+    sending = false;
+    var body = document.querySelector('#contact .contact-body');
+    if (res.status === 201) {
+      body.innerHTML =
+        '<h3>Thanks for getting in touch ' + esc(res.body.name) + '!</h3>' +
+        '<p>We\\'ll get back to you about</p><p><strong>' + esc(res.body.subject) + '</strong></p>' +
+        '<p>as soon as possible.</p>';
+    } else {
+      showErrors(form, errorsOf(res.body));
+    }
+  });
+});
+
+function route() {
+  var target = location.hash.replace(/^#\\/?/, '');
+  var el = target && document.getElementById(target);
+  if (el && el.tagName === 'SECTION') { el.scrollIntoView(); }
+}
+window.addEventListener('hashchange', route);
+loadRooms().then(route);
+</script>
+</body>
+</html>
+"""
+
+_RESERVATION_PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Restful-booker-platform demo</title>
+<style>""" + _STYLE.replace("$", "$$") + """</style>
+</head>
+<body>
+""" + _NAVBAR + """
+<section id="reservation">
+  <div class="container">
+    <div class="row">
+      <div class="col-lg-8">
+        <h1>$room_type Room</h1>
+        <img class="card-img-top" src="$image" alt="Room $room_name">
+        <p>$description</p>
+        <div class="card">
+          <div class="card-body" id="booking-panel">
+            <h3>Book This Room</h3>
+            <form class="room-booking-form" novalidate>
+              <input type="text" class="form-control room-firstname" name="firstname" placeholder="Firstname">
+              <input type="text" class="form-control room-lastname" name="lastname" placeholder="Lastname">
+              <input type="email" class="form-control room-email" name="email" placeholder="Email">
+              <input type="tel" class="form-control room-phone" name="phone" placeholder="Phone">
+              <button type="button" class="btn btn-primary" id="doReservation">Reserve Now</button>
+              <a class="btn btn-outline-primary" href="/">Cancel</a>
+            </form>
+          </div>
+        </div>
+      </div>
+      <div class="col-lg-4">
+        <div class="card">
+          <div class="card-body">
+            <h3>Price Summary</h3>
+            <p>$checkin &ndash; $checkout</p>
+            <p>&pound;$price x $nights nights</p>
+            <p><strong>Total &pound;$total</strong></p>
+          </div>
+        </div>
+      </div>
+    </div>
+  </div>
+</section>
+<script>""" + _COMMON_JS.replace("$", "$$") + """
+var sending = false;
+document.getElementById('doReservation').addEventListener('click', function () {
+  if (sending) { return; }
+  sending = true;
+  var form = document.querySelector('.room-booking-form');
+  var payload = {
+    roomid: $room_id,
+    firstname: form.firstname.value,
+    lastname: form.lastname.value,
+    email: form.email.value,
+    phone: form.phone.value,
+    bookingdates: {checkin: '$checkin', checkout: '$checkout'}
+  };
+  postJson('/api/booking', payload).then(function (res) {
+    sending = false;
+    if (res.status === 201) {
+      document.getElementById('booking-panel').innerHTML =
+        '<h2>Booking Confirmed</h2>' +
+        '<p>Your booking has been confirmed for the following dates:</p>' +
+        '<p><strong>$checkin - $checkout</strong></p>' +
+        '<a class="btn btn-primary" href="/">Return home</a>';
+    } else {
+      showErrors(form, errorsOf(res.body));
+    }
+  });
+});
+</script>
+</body>
+</html>
+""")
+
+# Login страната намерно НЕМА линкови „Rooms“/„Branding“ ниту зборови како
+# „error“/„invalid“ – тестовите ги користат како сигнал за успех/грешка.
+_ADMIN_LOGIN_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Restful-booker-platform demo</title>
+<style>""" + _STYLE + """</style>
+</head>
+<body>
+<nav class="navbar">
+  <div class="container">
+    <a class="navbar-brand" href="/admin">Restful Booker Platform Demo</a>
+    <a class="nav-link" href="/">Front Page</a>
+  </div>
+</nav>
+<section>
+  <div class="container">
+    <div class="row"><div class="col-lg-4">
+      <h2>Login</h2>
+      <form id="login-form" novalidate>
+        <label for="username">Username</label>
+        <input type="text" class="form-control" id="username" placeholder="Enter username">
+        <label for="password">Password</label>
+        <input type="password" class="form-control" id="password" placeholder="Password">
+        <button type="submit" class="btn btn-primary" id="doLogin">Login</button>
+      </form>
+    </div></div>
+  </div>
+</section>
+<script>""" + _COMMON_JS + """
+var form = document.getElementById('login-form');
+form.addEventListener('submit', function (ev) {
+  ev.preventDefault();
+  postJson('/api/auth/login', {
+    username: document.getElementById('username').value,
+    password: document.getElementById('password').value
+  }).then(function (res) {
+    if (res.status === 200) {
+      window.location.href = '/admin/rooms';
+    } else {
+      showErrors(form, ['Invalid credentials']);
+    }
+  });
+});
+</script>
+</body>
+</html>
+"""
+
+_ADMIN_PAGE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Restful-booker-platform demo</title>
+<style>""" + _STYLE.replace("$", "$$") + """</style>
+</head>
+<body>
+<nav class="navbar">
+  <div class="container">
+    <a class="navbar-brand" href="/admin/rooms">B&amp;B Booking Management</a>
+    <ul class="navbar-nav">
+      <li><a class="nav-link" href="/admin/rooms">Rooms</a></li>
+      <li><a class="nav-link" href="/admin/report">Report</a></li>
+      <li><a class="nav-link" href="/admin/branding">Branding</a></li>
+      <li><a class="nav-link" href="/admin/message">Messages</a></li>
+      <li><a class="nav-link" href="/">Front Page</a></li>
+      <li><a class="nav-link" href="/admin/logout">Logout</a></li>
+    </ul>
+  </div>
+</nav>
+<section>
+  <div class="container">
+    <h2>$heading</h2>
+    $content
+  </div>
+</section>
+</body>
+</html>
+""")
+
+
+def _room_svg(label: str, color: str) -> bytes:
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="640" height="320">'
+        f'<rect width="640" height="320" fill="{color}"/>'
+        f'<text x="320" y="170" font-size="48" text-anchor="middle" fill="#fff">{html.escape(label)}</text>'
+        "</svg>"
+    ).encode()
+
+
+IMAGES: Dict[str, bytes] = {
+    "room1.svg": _room_svg("Single", "#6c8ebf"),
+    "room2.svg": _room_svg("Double", "#82b366"),
+    "room3.svg": _room_svg("Suite", "#b85450"),
+    "map.svg": _room_svg("Newfordburyshire", "#9aa7b4"),
+}
+
+
+def render_reservation(room: Dict, checkin: date, checkout: date) -> str:
+    nights = max((checkout - checkin).days, 1)
+    return _RESERVATION_PAGE.substitute(
+        room_id=room["roomid"],
+        room_name=html.escape(room["roomName"]),
+        room_type=html.escape(room["type"]),
+        image=html.escape(room["image"]),
+        description=html.escape(room["description"]),
+        checkin=checkin.isoformat(),
+        checkout=checkout.isoformat(),
+        price=room["roomPrice"],
+        nights=nights,
+        total=room["roomPrice"] * nights,
+    )
+
+
+def render_admin(state: SiteState, section: str) -> str:
+    with state.lock:
+        rooms = list(state.rooms.values())
+        bookings = sorted(state.bookings.values(), key=lambda b: b["checkin"])
+        messages = list(state.messages.values())
+
+    if section == "message":
+        rows = "".join(
+            f"<tr><td>{html.escape(m['name'])}</td><td>{html.escape(m['subject'])}</td></tr>"
+            for m in messages
+        )
+        return _ADMIN_PAGE.substitute(
+            heading="Messages",
+            content=f'<table class="messages"><tr><th>Name</th><th>Subject</th></tr>{rows}</table>',
+        )
+    if section in ("report", "branding"):
+        return _ADMIN_PAGE.substitute(heading=section.capitalize(), content="")
+
+    room_rows = "".join(
+        f"<tr><td>{html.escape(r['roomName'])}</td><td>{html.escape(r['type'])}</td>"
+        f"<td>{r['roomPrice']}</td></tr>"
+        for r in rooms
+    )
+    booking_rows = "".join(
+        f"<tr><td>{b['roomid']}</td><td>{html.escape(b['firstname'])} {html.escape(b['lastname'])}</td>"
+        f"<td>{b['checkin'].isoformat()}</td><td>{b['checkout'].isoformat()}</td></tr>"
+        for b in bookings
+    )
+    content = (
+        '<table class="rooms"><tr><th>Room #</th><th>Type</th><th>Price</th></tr>'
+        f"{room_rows}</table>"
+        '<div class="reservations"><h3>Reservations</h3>'
+        '<table><tr><th>Room</th><th>Guest</th><th>Check in</th><th>Check out</th></tr>'
+        f"{booking_rows}</table></div>"
+    )
+    return _ADMIN_PAGE.substitute(heading="Rooms", content=content)
+
+
+# ============================== HTTP =========================================
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive → без нов TCP handshake по барање
+    server_version = "ShadyMeadows/1.0"
+
+    # тивко – без лог линија по секое барање
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self) -> SiteState:
+        return self.server.state
+
+    # ------------------------------ helpers ----------------------------------
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _json(self, status: int, payload, headers: Optional[Dict[str, str]] = None):
+        self._send(status, json.dumps(payload).encode(), "application/json", headers)
+
+    def _html(self, text: str, status: int = 200):
+        self._send(status, text.encode(), "text/html; charset=utf-8")
+
+    def _redirect(self, location: str, headers: Optional[Dict[str, str]] = None):
+        self._send(302, b"", "text/plain", {"Location": location, **(headers or {})})
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(raw or b"{}")
+        except ValueError:
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _token(self) -> Optional[str]:
+        cookie = SimpleCookie(self.headers.get("Cookie") or "")
+        return cookie["token"].value if "token" in cookie else None
+
+    def _authed(self) -> bool:
+        return self.state.is_authenticated(self._token())
+
+    # ------------------------------ routing ----------------------------------
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        for route_method, pattern, handler in _ROUTES:
+            match = pattern.fullmatch(url.path)
+            if route_method == method and match:
+                return handler(self, query, *match.groups())
+        if url.path.startswith("/api/"):
+            return self._json(404, {"error": "Not found"})
+        self._html("<h1>Not found</h1>", status=404)
+
+    # ------------------------------- pages -----------------------------------
+
+    def page_home(self, query):
+        self._html(_HOME_PAGE)
+
+    def page_reservation(self, query, room_id):
+        with self.state.lock:
+            room = self.state.rooms.get(int(room_id))
+        if room is None:
+            return self._html("<h1>Room not found</h1>", status=404)
+        checkin = _parse_iso(query.get("checkin", "")) or date.today() + timedelta(days=1)
+        checkout = _parse_iso(query.get("checkout", "")) or checkin + timedelta(days=1)
+        self._html(render_reservation(room, checkin, checkout))
+
+    def page_admin(self, query):
+        if self._authed():
+            return self._redirect("/admin/rooms")
+        self._html(_ADMIN_LOGIN_PAGE)
+
+    def page_admin_section(self, query, section):
+        if section == "logout":
+            self.state.logout(self._token())
+            return self._redirect("/admin", {"Set-Cookie": "token=; Path=/; Max-Age=0"})
+        if not self._authed():
+            return self._redirect("/admin")
+        self._html(render_admin(self.state, section))
+
+    def image(self, query, name):
+        body = IMAGES.get(name)
+        if body is None:
+            return self._send(404, b"", "image/svg+xml")
+        self._send(200, body, "image/svg+xml", {"Cache-Control": "max-age=3600"})
+
+    # -------------------------------- API ------------------------------------
+
+    def api_rooms(self, query):
+        rooms = self.state.available_rooms(
+            _parse_iso(query.get("checkin", "")), _parse_iso(query.get("checkout", ""))
+        )
+        self._json(200, {"rooms": rooms})
+
+    def api_room(self, query, room_id):
+        with self.state.lock:
+            room = self.state.rooms.get(int(room_id))
+        if room is None:
+            return self._json(404, {"error": f"Room {room_id} not found"})
+        self._json(200, room)
+
+    def api_report(self, query, room_id):
+        self._json(200, {"report": self.state.unavailable(int(room_id))})
+
+    def api_create_booking(self, query):
+        data, errors = validate_booking(self._read_json())
+        if errors:
+            return self._json(400, {"errors": errors})
+        self._json(*self.state.add_booking(data))
+
+    def api_list_bookings(self, query):
+        if not self._authed():
+            return self._json(403, {"error": "Forbidden"})
+        with self.state.lock:
+            bookings = [booking_json(b) for b in self.state.bookings.values()
+                        if "roomid" not in query or str(b["roomid"]) == query["roomid"]]
+        self._json(200, {"bookings": bookings})
+
+    def api_delete_booking(self, query, booking_id):
+        if not self._authed():
+            return self._json(403, {"error": "Forbidden"})
+        with self.state.lock:
+            removed = self.state.bookings.pop(int(booking_id), None)
+        self._json(202 if removed else 404, {})
+
+    def api_create_message(self, query):
+        data, errors = validate_message(self._read_json())
+        if errors:
+            return self._json(400, {"errors": errors})
+        message = self.state.add_message(data)
+        self._json(201, {k: message[k] for k in ("messageid", "name", "email", "phone", "subject", "description")})
+
+    def api_list_messages(self, query):
+        if not self._authed():
+            return self._json(403, {"error": "Forbidden"})
+        with self.state.lock:
+            messages = [{k: m[k] for k in ("messageid", "name", "subject", "read")}
+                        for m in self.state.messages.values()]
+        self._json(200, {"messages": messages})
+
+    def api_login(self, query):
+        payload = self._read_json()
+        token = self.state.login(str(payload.get("username", "")), str(payload.get("password", "")))
+        if token is None:
+            return self._json(401, {"error": "Invalid credentials"})
+        self._json(200, {"token": token}, {"Set-Cookie": f"token={token}; Path=/; SameSite=Lax"})
+
+    def api_validate(self, query):
+        token = self._read_json().get("token") or self._token()
+        self._json(200 if self.state.is_authenticated(token) else 403, {"valid": self.state.is_authenticated(token)})
+
+    def api_logout(self, query):
+        self.state.logout(self._token())
+        self._json(200, {}, {"Set-Cookie": "token=; Path=/; Max-Age=0"})
+
+
+_ROUTES = [
+    (method, re.compile(pattern), handler)
+    for method, pattern, handler in [
+        ("GET", r"/", _Handler.page_home),
+        ("GET", r"/reservation/(\d+)", _Handler.page_reservation),
+        ("GET", r"/admin/?", _Handler.page_admin),
+        ("GET", r"/admin/(rooms|report|branding|message|logout)", _Handler.page_admin_section),
+        ("GET", r"/images/([\w.-]+)", _Handler.image),
+        ("GET", r"/api/room/?", _Handler.api_rooms),
+        ("GET", r"/api/room/(\d+)", _Handler.api_room),
+        ("GET", r"/api/report/room/(\d+)", _Handler.api_report),
+        ("GET", r"/api/booking/?", _Handler.api_list_bookings),
+        ("POST", r"/api/booking/?", _Handler.api_create_booking),
+        ("DELETE", r"/api/booking/(\d+)", _Handler.api_delete_booking),
+        ("GET", r"/api/message/?", _Handler.api_list_messages),
+        ("POST", r"/api/message/?", _Handler.api_create_message),
+        ("POST", r"/api/auth/login", _Handler.api_login),
+        ("POST", r"/api/auth/validate", _Handler.api_validate),
+        ("POST", r"/api/auth/logout", _Handler.api_logout),
+    ]
+]
+
+
+class ShadyMeadowsServer:
+    """
+    In-process HTTP сервер што го глуми Shady Meadows демото.
+
+    `port=0` → оперативниот систем избира слободна порта (безбедно за паралелни
+    pytest процеси); вистинската адреса е во `url` по `start()`.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.state = SiteState()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = self.state
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ShadyMeadowsServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="shady-meadows", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def reset(self) -> None:
+        self.state.reset()
+
+    def __enter__(self) -> "ShadyMeadowsServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Shady Meadows stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    server = ShadyMeadowsServer(args.host, args.port)
+    print(f"Serving Shady Meadows on {server.url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
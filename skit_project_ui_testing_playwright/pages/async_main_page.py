@@ -0,0 +1,315 @@
+# pages/async_main_page.py
+"""Async близнак на MainPage (playwright.async_api) – истите селектори (од
+pages/main_page.py) и методи како корутини, за perf/ui_runner.py."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple, Union
+
+from playwright.async_api import Error as PlaywrightError, Locator, Page, TimeoutError as PlaywrightTimeoutError
+
+from perf import page_metrics
+from perf.step_timing import timed_methods
+from perf.timeouts import adaptive_timeouts
+from pages.main_page import (
+    ADMIN_DASHBOARD_SELECTORS,
+    ADMIN_PASSWORD,
+    ADMIN_USERNAME,
+    BASE_URL,
+    BOOKING_API,
+    CONTACT_API,
+    GENERIC_WAITS,
+    LOGIN_ERROR_SELECTORS,
+    LOGIN_ERROR_TEXTS,
+    QUERY_ELEMENTS_JS,
+    ElementState,
+    SubmitResult,
+    SubmitWatch,
+    element_states,
+    query_args,
+)
+
+Candidate = Union[str, Locator]
+
+
+@timed_methods
+@adaptive_timeouts(skip=GENERIC_WAITS)
+class AsyncMainPage:
+    def __init__(self, page: Page, base_url: Optional[str] = None):
+        self.page = page
+        self.base_url = (base_url or BASE_URL).rstrip("/")
+
+        # ---------------- CONTACT ----------------
+        self.name_input = self.page.locator("#name")
+        self.email_input = self.page.locator("#email")
+        self.phone_input = self.page.locator("#phone")
+        self.subject_input = self.page.locator("#subject")
+        self.description_input = self.page.locator("#description")
+        self.submit_button = self.page.locator("#contact button:has-text('Submit')")
+        self.success_alert = self.page.locator("h3:has-text('Thanks for getting in touch')")
+
+        # ---------------- LOGIN ----------------
+        self.login_username_input = self.page.locator("#username")
+        self.login_password_input = self.page.locator("#password")
+        self.login_button = self.page.locator("button[type='submit']")
+
+        # ---------------- NAVBAR / NAVIGATION ----------------
+        self.brand_link   = self.page.get_by_role("link", name="Shady Meadows B&B")
+        self.nav_rooms    = self.page.get_by_role("link", name="Rooms")
+        self.nav_booking  = self.page.get_by_role("link", name="Booking")
+        self.nav_amen     = self.page.get_by_role("link", name="Amenities")
+        self.nav_location = self.page.get_by_role("link", name="Location")
+        self.nav_contact  = self.page.get_by_role("link", name="Contact")
+        self.nav_admin    = self.page.get_by_role("link", name="Admin")
+        self.nav_toggler  = self.page.locator("button.navbar-toggler, button:has(svg)")
+
+    # ============================ NAVIGATION ============================
+
+    async def goto_home(self) -> None:
+        await self.page.goto(f"{self.base_url}")
+        await self.page.wait_for_load_state("domcontentloaded")
+        await page_metrics.capture_async(self.page, "home")
+
+    async def goto_booking(self) -> None:
+        await self.page.goto(f"{self.base_url}/#/booking")
+        await self.page.wait_for_load_state("domcontentloaded")
+        await page_metrics.capture_async(self.page, "booking")
+
+    async def goto_contact(self) -> None:
+        await self.page.goto(f"{self.base_url}/#/contact")
+        await self.page.wait_for_load_state("domcontentloaded")
+        await page_metrics.capture_async(self.page, "contact")
+
+    async def goto_admin(self) -> None:
+        await self.page.goto(f"{self.base_url}/admin")
+        await self.page.wait_for_load_state("domcontentloaded")
+        await page_metrics.capture_async(self.page, "admin")
+
+    async def goto_reservation(self, room_id: int, checkin_iso: str, checkout_iso: str) -> None:
+        await self.page.goto(f"{self.base_url}/reservation/{room_id}?checkin={checkin_iso}&checkout={checkout_iso}")
+        await self.page.wait_for_load_state("domcontentloaded")
+        await page_metrics.capture_async(self.page, "reservation")
+
+    async def open_nav(self, item: str) -> None:
+        mapping = {
+            "Rooms": self.nav_rooms,
+            "Booking": self.nav_booking,
+            "Amenities": self.nav_amen,
+            "Location": self.nav_location,
+            "Contact": self.nav_contact,
+            "Admin": self.nav_admin,
+        }
+        loc = mapping[item]
+        try:
+            if await self.nav_toggler.is_visible():
+                await self.nav_toggler.click()
+        except Exception:
+            pass
+        await loc.click()
+
+    def _candidate(self, candidate: Candidate) -> Locator:
+        loc = self.page.locator(candidate) if isinstance(candidate, str) else candidate
+        return loc.locator("visible=true")
+
+    async def wait_any(self, selectors: list[str], timeout: int = 15000) -> str:
+        try:
+            return await self.wait_first(selectors, timeout=timeout)
+        except PlaywrightTimeoutError as e:
+            raise RuntimeError(f"None of expected selectors appeared. Last: {e}")
+
+    async def wait_first(self, candidates: Sequence[Candidate], timeout: int = 15000) -> Candidate:
+        return (await self.wait_outcome({"match": candidates}, timeout=timeout))[1]
+
+    async def wait_outcome(self, outcomes: Dict[str, Sequence[Candidate]],
+                           timeout: int = 15000) -> Tuple[str, Candidate]:
+        """Исто како MainPage.wait_outcome – едно `or_` чекање за сите кандидати."""
+        flat = [(name, c) for name, group in outcomes.items() for c in group]
+        if not flat:
+            raise ValueError(f"wait_outcome needs at least one candidate, got {outcomes!r}")
+        union = self._candidate(flat[0][1])
+        for _, c in flat[1:]:
+            union = union.or_(self._candidate(c))
+
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining = int((deadline - time.monotonic()) * 1000)
+            try:
+                await union.first.wait_for(state="visible", timeout=max(remaining, 1))
+            except PlaywrightTimeoutError:
+                raise PlaywrightTimeoutError(
+                    f"None of {[c for _, c in flat]} appeared within {timeout} ms"
+                )
+            for name, c in flat:
+                if await self._candidate(c).count():
+                    return name, c
+            if remaining <= 0:
+                raise PlaywrightTimeoutError(f"None of {[c for _, c in flat]} stayed visible")
+
+    async def query_elements(self, selectors: Dict[str, str], attributes: Sequence[str] = (),
+                             wait: Union[bool, Sequence[str]] = False, timeout: int = 15000) -> Dict[str, ElementState]:
+        """Исто како MainPage.query_elements – една евалуација за сите селектори."""
+        args = query_args(selectors, attributes, wait, timeout)
+        return element_states(await self.page.evaluate(QUERY_ELEMENTS_JS, args), args["wait"], timeout)
+
+    # ============================= CONTACT =============================
+
+    async def fill_contact_form(self, name: str, email: str, phone: str, subject: str, description: str) -> None:
+        await self.name_input.fill(name)
+        await self.email_input.fill(email)
+        await self.phone_input.fill(phone)
+        await self.subject_input.fill(subject)
+        await self.description_input.fill(description)
+
+    async def submit_contact_form(self) -> None:
+        await self.submit_button.click()
+
+    async def submit_contact_form_checked(self, timeout: int = 5000) -> SubmitResult:
+        return await self._submit_and_capture(self.submit_contact_form, CONTACT_API, "#contact form", timeout)
+
+    async def _submit_and_capture(self, submit: Callable[[], Awaitable[None]], api_path: str,
+                                  form_selector: str, timeout: int) -> SubmitResult:
+        watch = SubmitWatch(api_path)
+        watch.attach(self.page)
+        try:
+            await submit()
+            started = time.monotonic()
+            while True:
+                elapsed_ms = (time.monotonic() - started) * 1000
+                result = watch.outcome(elapsed_ms, timeout)
+                if result is not None:
+                    return result
+                if watch.may_check_client(elapsed_ms) and await self._rejected_client_side(form_selector):
+                    return SubmitResult(False, None, "client-validation")
+                await asyncio.sleep(0.025)
+        finally:
+            watch.detach(self.page)
+
+    async def _rejected_client_side(self, form_selector: str) -> bool:
+        form = self.page.locator(form_selector).first
+        try:
+            if await form.count() and not await form.evaluate("f => f.checkValidity()"):
+                return True
+        except PlaywrightError:
+            pass
+        return await self.page.locator(".alert-danger >> visible=true").count() > 0
+
+    async def wait_success_contact(self, timeout: int = 20000) -> str:
+        await self.success_alert.wait_for(state="visible", timeout=timeout)
+        return await self.success_alert.inner_text()
+
+    # ============================== LOGIN ==============================
+
+    async def login(self, username: str, password: str) -> None:
+        await self.login_username_input.fill(username)
+        await self.login_password_input.fill(password)
+        await self.login_button.click()
+
+    async def login_as_admin(self, timeout: int = 15000) -> None:
+        await self.goto_admin()
+        await self.login(ADMIN_USERNAME, ADMIN_PASSWORD)
+        await self.wait_any(ADMIN_DASHBOARD_SELECTORS, timeout=timeout)
+
+    def login_error_candidates(self) -> list:
+        return LOGIN_ERROR_SELECTORS + [self.page.get_by_text(t, exact=False) for t in LOGIN_ERROR_TEXTS]
+
+    async def wait_login_outcome(self, timeout: int = 15000) -> str:
+        outcome, _ = await self.wait_outcome(
+            {"success": ADMIN_DASHBOARD_SELECTORS, "error": self.login_error_candidates()},
+            timeout=timeout,
+        )
+        return outcome
+
+    # ============================ BOOKING FLOW =========================
+
+    async def _get_check_inputs(self):
+        wrapper = self.page.locator("section#booking form").first
+        inputs = wrapper.locator("input.form-control")
+        await inputs.first.wait_for(timeout=15000)
+        return inputs.nth(0), inputs.nth(1)
+
+    async def set_dates(self, checkin_ddmmyyyy: str, checkout_ddmmyyyy: str) -> None:
+        ci, co = await self._get_check_inputs()
+        await ci.click()
+        await ci.fill(checkin_ddmmyyyy)
+        await co.click()
+        await co.fill(checkout_ddmmyyyy)
+
+    async def click_check_availability(self) -> None:
+        await self.page.locator("section#booking button:has-text('Check Availability')").click()
+
+    async def _wait_rooms_section(self, timeout: int = 30000) -> None:
+        try:
+            await self.page.get_by_role("heading", name="Our Rooms").first.wait_for(timeout=timeout)
+        except Exception:
+            await self.page.locator("section#rooms").first.wait_for(timeout=timeout)
+        await self.page.locator("section#rooms").first.scroll_into_view_if_needed()
+
+    async def click_first_book_now(self, timeout: int = 30000) -> None:
+        await self._wait_rooms_section(timeout=timeout)
+        book_now = self.page.locator(
+            "section#rooms a.btn.btn-primary:has-text('Book now'), "
+            "section#rooms a:has-text('Book now'), "
+            "a.btn.btn-primary:has-text('Book now'), "
+            "a:has-text('Book now')"
+        ).first
+        await book_now.wait_for(state="visible", timeout=timeout)
+        await book_now.scroll_into_view_if_needed()
+        await book_now.click()
+        await self.page.wait_for_url("**/reservation/**", timeout=timeout)
+
+    async def click_book_now(self, room_id: int, timeout: int = 30000) -> None:
+        await self._wait_rooms_section(timeout=timeout)
+        book_now = self.page.locator(f"section#rooms a[href*='/reservation/{room_id}?']").first
+        await book_now.wait_for(state="visible", timeout=timeout)
+        await book_now.scroll_into_view_if_needed()
+        await book_now.click()
+        await self.page.wait_for_url(f"**/reservation/{room_id}**", timeout=timeout)
+
+    async def maybe_click_sidebar_reserve_now(self, timeout: int = 15000) -> None:
+        if await self.page.locator("#doReservation").first.is_visible():
+            return
+        sidebar_reserve = self.page.locator("button:has-text('Reserve Now')").first
+        await sidebar_reserve.wait_for(state="visible", timeout=timeout)
+        await sidebar_reserve.scroll_into_view_if_needed()
+        await sidebar_reserve.click()
+        await self.page.locator("#doReservation").wait_for(timeout=timeout)
+
+    @property
+    def firstname_input(self):
+        return self.page.locator("input[name='firstname'], input.room-firstname")
+
+    @property
+    def lastname_input(self):
+        return self.page.locator("input[name='lastname'], input.room-lastname")
+
+    @property
+    def booking_email_input(self):
+        return self.page.locator("input[name='email'], input.room-email")
+
+    @property
+    def booking_phone_input(self):
+        return self.page.locator("input[name='phone'], input.room-phone")
+
+    async def wait_booking_form(self, timeout: int = 15000) -> None:
+        await self.firstname_input.first.wait_for(timeout=timeout)
+        await self.lastname_input.first.wait_for(timeout=timeout)
+        await self.booking_email_input.first.wait_for(timeout=timeout)
+        await self.booking_phone_input.first.wait_for(timeout=timeout)
+
+    async def fill_booking_form(self, firstname: str, lastname: str, email: str, phone: str) -> None:
+        await self.firstname_input.fill(firstname)
+        await self.lastname_input.fill(lastname)
+        await self.booking_email_input.fill(email)
+        await self.booking_phone_input.fill(phone)
+
+    async def click_final_reserve(self, timeout: int = 20000) -> None:
+        await self.page.locator("#doReservation").wait_for(timeout=timeout)
+        await self.page.locator("#doReservation").scroll_into_view_if_needed()
+        await self.page.locator("#doReservation").click()
+
+    async def click_final_reserve_checked(self, timeout: int = 5000) -> SubmitResult:
+        return await self._submit_and_capture(
+            self.click_final_reserve, BOOKING_API, "#doReservation >> xpath=ancestor::form", timeout
+        )
+
+    async def wait_booking_confirmed(self, timeout: int = 25000) -> None:
+        await self.page.get_by_role("heading", name="Booking Confirmed").first.wait_for(timeout=timeout)
@@ -1,12 +1,202 @@
 # pages/main_page.py
-from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+import time
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
 
-BASE_URL = "https://automationintesting.online"
+from playwright.sync_api import Error as PlaywrightError, Locator, Page, TimeoutError as PlaywrightTimeoutError
+
+from perf import page_metrics
+from perf.cpu_profile import cpu_profiled
+from perf.step_timing import timed_methods
+from perf.timeouts import adaptive_timeouts
 
+# Live демото; тестовите стандардно одат на локалниот stand-in (mocks/),
+# а ова се користи само со `pytest --base-url https://automationintesting.online`.
+BASE_URL = "https://automationintesting.online"
 
+ADMIN_USERNAME = "admin"
+ADMIN_PASSWORD = "password"
+
+# индикатори дека сме внатре во админ (dashboard/менито)
+ADMIN_DASHBOARD_SELECTORS = [
+    ".reservations",                      # најчесто присутно по успешен login
+    "text=Reservations",                  # текст fallback
+    "a:has-text('Rooms')",                # линк во менито
+    "a:has-text('Branding')",             # линк во менито
+]
+
+# визуелен сигнал за неуспешен login: CSS alert-и + текстови (case-insensitive)
+LOGIN_ERROR_SELECTORS = [".alert-danger", ".alert", "[role='alert']"]
+LOGIN_ERROR_TEXTS = ["invalid", "unauthorized", "error", "wrong", "fail"]
+
+Candidate = Union[str, Locator]
+
+# backend endpoints на формите (исти на демото и на локалниот stand-in)
+CONTACT_API = "/api/message"
+BOOKING_API = "/api/booking"
+# колку се чека POST пред да се провери клиентска валидација (ms)
+CLIENT_VALIDATION_GRACE_MS = 500
+
+# генерички wait-ови (повеќе намени) – без адаптивен timeout (perf/timeouts.py)
+GENERIC_WAITS = ("wait_any", "wait_first", "wait_outcome", "query_elements")
+
+# Селектор што се евалуира ВО страницата (query_elements, perf/layout.py):
+# CSS, или "text=Price Summary" / "nav >> text=Rooms" (најдлабокиот елемент
+# што го содржи текстот, case-insensitive). Враќа листа елементи.
+FIND_ELEMENTS_JS = """
+selector => {
+  const parts = selector.split(/(?:^|\\s*>>\\s*)text=/);
+  if (parts.length === 1) return [...document.querySelectorAll(selector)];
+  const scopes = parts[0] ? [...document.querySelectorAll(parts[0])] : [document];
+  const all = scopes.flatMap(scope => [...scope.querySelectorAll('*')]);
+  const needle = parts[1].replace(/^["']|["']$/g, '').toLowerCase();
+  const hits = all.filter(el => !el.closest('head, script, style, template')
+                                && (el.textContent || '').toLowerCase().includes(needle));
+  return hits.filter(el => !hits.some(other => other !== el && el.contains(other)));
+}
+"""
+
+# видлив = непразен bounding box и не visibility:hidden (како Playwright)
+VISIBLE_JS = """
+el => {
+  const rect = el.getBoundingClientRect();
+  return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+}
+"""
+
+# query_elements: сите селектори во ЕДНА евалуација во страницата (наместо
+# по еден round trip за is_visible/bounding_box/inner_text/get_attribute).
+# Со `wait` промисот се повторува на секој frame додека бараните не станат
+# видливи или до timeout.
+QUERY_ELEMENTS_JS = """
+async ({selectors, attributes, wait, timeout}) => {
+  const visible = """ + VISIBLE_JS.strip() + """;
+  const find = """ + FIND_ELEMENTS_JS.strip() + """;
+  const snapshot = () => {
+    const out = {};
+    for (const [name, selector] of Object.entries(selectors)) {
+      const els = find(selector);
+      const el = els.find(visible) || els[0];
+      if (!el) { out[name] = {count: 0, visible: false, text: null, attrs: {}, box: null}; continue; }
+      const rect = el.getBoundingClientRect();
+      const attrs = {};
+      for (const a of attributes) attrs[a] = a === 'value' && 'value' in el ? el.value : el.getAttribute(a);
+      out[name] = {
+        count: els.length, visible: visible(el), text: (el.innerText ?? el.textContent ?? '').trim(), attrs,
+        box: visible(el) ? {x: rect.x, y: rect.y, width: rect.width, height: rect.height} : null,
+      };
+    }
+    return out;
+  };
+  const deadline = performance.now() + timeout;
+  let out = snapshot();
+  while (wait.some(name => !out[name].visible) && performance.now() < deadline) {
+    await new Promise(resolve => requestAnimationFrame(() => setTimeout(resolve, 0)));
+    out = snapshot();
+  }
+  return out;
+}
+"""
+
+
+class ElementState(NamedTuple):
+    """Едно име од query_elements. box е како Locator.bounding_box() (None ако не е видлив)."""
+    count: int
+    visible: bool
+    text: Optional[str]
+    attrs: Dict[str, Optional[str]]
+    box: Optional[Dict[str, float]]
+
+
+def query_args(selectors: Dict[str, str], attributes: Sequence[str],
+               wait: Union[bool, Sequence[str]], timeout: int) -> Dict:
+    names = list(selectors) if wait is True else list(wait or ())
+    unknown = set(names) - set(selectors)
+    if unknown:
+        raise KeyError(f"wait names not in selectors: {sorted(unknown)}")
+    return {"selectors": dict(selectors), "attributes": list(attributes), "wait": names, "timeout": timeout}
+
+
+def element_states(raw: Dict, wait: Sequence[str], timeout: int) -> Dict[str, ElementState]:
+    states = {name: ElementState(**value) for name, value in raw.items()}
+    missing = [name for name in wait if not states[name].visible]
+    if missing:
+        raise PlaywrightTimeoutError(f"Not visible within {timeout} ms: {missing}")
+    return states
+
+
+class SubmitResult(NamedTuple):
+    """Исход од submit на форма.
+    source: "response" (backend статус) или "client-validation" (browser/JS не
+    испрати барање). Без одговор до timeout-от нема резултат – PlaywrightTimeoutError."""
+    accepted: bool
+    status: Optional[int]
+    source: str
+
+
+class SubmitWatch:
+    """
+    Ги следи POST барањата на `api_path` за време на еден submit (page events:
+    request/response/requestfailed). Двете форми се `novalidate` и JS секогаш
+    праќа POST, па штом барањето тргне одлучува САМО одговорот од backend-от;
+    клиентска валидација се проверува само ако до CLIENT_VALIDATION_GRACE_MS
+    не тргнало ниту едно барање.
+    """
+
+    def __init__(self, api_path: str):
+        self.api_path = api_path
+        self.sent = 0
+        self.statuses = []
+        self.failures = []
+
+    def _ours(self, request) -> bool:
+        return request.method == "POST" and urlparse(request.url).path.rstrip("/") == self.api_path
+
+    def on_request(self, request) -> None:
+        if self._ours(request):
+            self.sent += 1
+
+    def on_response(self, response) -> None:
+        if self._ours(response.request):
+            self.statuses.append(response.status)
+
+    def on_request_failed(self, request) -> None:
+        if self._ours(request):
+            self.failures.append(request.failure)
+
+    def attach(self, page) -> None:
+        page.on("request", self.on_request)
+        page.on("response", self.on_response)
+        page.on("requestfailed", self.on_request_failed)
+
+    def detach(self, page) -> None:
+        page.remove_listener("request", self.on_request)
+        page.remove_listener("response", self.on_response)
+        page.remove_listener("requestfailed", self.on_request_failed)
+
+    def outcome(self, elapsed_ms: float, timeout: int) -> Optional[SubmitResult]:
+        """Одговор од backend-от → резултат; неуспешно барање/timeout → исклучок; инаку None (чекај)."""
+        if self.statuses:
+            status = self.statuses[0]
+            return SubmitResult(200 <= status < 300, status, "response")
+        if self.failures:
+            raise PlaywrightError(f"POST {self.api_path} failed: {self.failures[0]}")
+        if elapsed_ms >= timeout:
+            waiting = "no response to POST" if self.sent else "no POST and no client-side validation error for"
+            raise PlaywrightTimeoutError(f"Submit inconclusive: {waiting} {self.api_path} within {timeout} ms")
+        return None
+
+    def may_check_client(self, elapsed_ms: float) -> bool:
+        return not self.sent and elapsed_ms >= CLIENT_VALIDATION_GRACE_MS
+
+
+@cpu_profiled
+@timed_methods
+@adaptive_timeouts(skip=GENERIC_WAITS)
 class MainPage:
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, base_url: Optional[str] = None):
         self.page = page
+        self.base_url = (base_url or BASE_URL).rstrip("/")
 
         # ---------------- CONTACT ----------------
         self.name_input = self.page.locator("#name")
@@ -36,20 +226,30 @@ class MainPage:
     # ============================ NAVIGATION ============================
 
     def goto_home(self) -> None:
-        self.page.goto(f"{BASE_URL}")
+        self.page.goto(f"{self.base_url}")
         self.page.wait_for_load_state("domcontentloaded")
+        page_metrics.capture(self.page, "home")
 
     def goto_booking(self) -> None:
-        self.page.goto(f"{BASE_URL}/#/booking")
+        self.page.goto(f"{self.base_url}/#/booking")
         self.page.wait_for_load_state("domcontentloaded")
+        page_metrics.capture(self.page, "booking")
 
     def goto_contact(self) -> None:
-        self.page.goto(f"{BASE_URL}/#/contact")
+        self.page.goto(f"{self.base_url}/#/contact")
         self.page.wait_for_load_state("domcontentloaded")
+        page_metrics.capture(self.page, "contact")
 
     def goto_admin(self) -> None:
-        self.page.goto(f"{BASE_URL}/admin")
+        self.page.goto(f"{self.base_url}/admin")
+        self.page.wait_for_load_state("domcontentloaded")
+        page_metrics.capture(self.page, "admin")
+
+    def goto_reservation(self, room_id: int, checkin_iso: str, checkout_iso: str) -> None:
+        """Директно на /reservation/<id> со датуми во ISO формат (YYYY-MM-DD)."""
+        self.page.goto(f"{self.base_url}/reservation/{room_id}?checkin={checkin_iso}&checkout={checkout_iso}")
         self.page.wait_for_load_state("domcontentloaded")
+        page_metrics.capture(self.page, "reservation")
 
     def open_nav(self, item: str) -> None:
         """Click на линк од горното мени по име ('Rooms','Booking','Amenities','Location','Contact','Admin')."""
@@ -70,17 +270,69 @@ class MainPage:
             pass
         loc.click()
 
-    def wait_any(self, selectors: list[str], timeout: int = 15000) -> None:
-        """Чека првиот што ќе се појави од група селектори (робусно за SPA/различни наслови)."""
-        last = None
-        slice_timeout = max(int(timeout / max(len(selectors), 1)), 2000)
-        for s in selectors:
+    def wait_any(self, selectors: list[str], timeout: int = 15000) -> str:
+        """Чека првиот што ќе се појави од група селектори (робусно за SPA/различни наслови).
+        Враќа кој селектор се совпадна."""
+        try:
+            return self.wait_first(selectors, timeout=timeout)
+        except PlaywrightTimeoutError as e:
+            raise RuntimeError(f"None of expected selectors appeared. Last: {e}")
+
+    def _candidate(self, candidate: Candidate) -> Locator:
+        loc = self.page.locator(candidate) if isinstance(candidate, str) else candidate
+        # само ВИДЛИВИ совпаѓања – скриен .alert темплејт не смее да „победи“
+        return loc.locator("visible=true")
+
+    def wait_first(self, candidates: Sequence[Candidate], timeout: int = 15000) -> Candidate:
+        """
+        Ги следи СИТЕ кандидати истовремено (еден `or_` локатор → едно чекање
+        во browser-от, без делење на timeout по селектор) и враќа кој се појави.
+        Кандидатите се селектори (str) или готови Locator-и (на пр. get_by_text).
+        """
+        return self.wait_outcome({"match": candidates}, timeout=timeout)[1]
+
+    def wait_outcome(self, outcomes: Dict[str, Sequence[Candidate]],
+                     timeout: int = 15000) -> Tuple[str, Candidate]:
+        """
+        Трка меѓу исходи, на пр. {"success": [...], "error": [...]} – еден повик
+        завршува штом се појави БИЛО КОЈ кандидат и враќа (исход, кандидат).
+        Внимание: видлив „стар“ кандидат (alert од претходен обид) веднаш победува.
+        """
+        flat = [(name, c) for name, group in outcomes.items() for c in group]
+        if not flat:
+            raise ValueError(f"wait_outcome needs at least one candidate, got {outcomes!r}")
+        union = self._candidate(flat[0][1])
+        for _, c in flat[1:]:
+            union = union.or_(self._candidate(c))
+
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining = int((deadline - time.monotonic()) * 1000)
             try:
-                self.page.locator(s).first.wait_for(timeout=slice_timeout, state="visible")
-                return
-            except Exception as e:
-                last = e
-        raise RuntimeError(f"None of expected selectors appeared. Last: {last}")
+                union.first.wait_for(state="visible", timeout=max(remaining, 1))
+            except PlaywrightTimeoutError:
+                raise PlaywrightTimeoutError(
+                    f"None of {[c for _, c in flat]} appeared within {timeout} ms"
+                )
+            # кој од нив? (count() е моментален – без чекање)
+            for name, c in flat:
+                if self._candidate(c).count():
+                    return name, c
+            # исчезна меѓу двата чекора (re-render) → чекај повторно до deadline
+            if remaining <= 0:
+                raise PlaywrightTimeoutError(f"None of {[c for _, c in flat]} stayed visible")
+
+    def query_elements(self, selectors: Dict[str, str], attributes: Sequence[str] = (),
+                       wait: Union[bool, Sequence[str]] = False, timeout: int = 15000) -> Dict[str, ElementState]:
+        """
+        Видливост, текст, атрибути и bounding box за сите именувани селектори
+        од една евалуација во страницата: {"price": "text=Price Summary", ...}
+        → {"price": ElementState(...), ...}. `wait=True` (или листа имиња) –
+        истиот повик прво чека тие да станат видливи (PlaywrightTimeoutError
+        со имињата што фалат).
+        """
+        args = query_args(selectors, attributes, wait, timeout)
+        return element_states(self.page.evaluate(QUERY_ELEMENTS_JS, args), args["wait"], timeout)
 
     # ============================= CONTACT =============================
 
@@ -94,6 +346,43 @@ class MainPage:
     def submit_contact_form(self) -> None:
         self.submit_button.click()
 
+    def submit_contact_form_checked(self, timeout: int = 5000) -> SubmitResult:
+        """Submit + одлука веднаш штом backend-от одговори (наместо 5s чекање на success)."""
+        return self._submit_and_capture(self.submit_contact_form, CONTACT_API, "#contact form", timeout)
+
+    def _submit_and_capture(self, submit: Callable[[], None], api_path: str,
+                            form_selector: str, timeout: int) -> SubmitResult:
+        """
+        Submit + одлука штом е позната (SubmitWatch): ако POST на `api_path`
+        тргне – статусот од backend-от; ако не тргне ниту едно барање –
+        HTML5/JS валидација (невалидна форма или видлив .alert-danger).
+        Ништо од тоа до `timeout` → PlaywrightTimeoutError (не „одбиено“).
+        """
+        watch = SubmitWatch(api_path)
+        watch.attach(self.page)
+        try:
+            submit()
+            started = time.monotonic()
+            while True:
+                elapsed_ms = (time.monotonic() - started) * 1000
+                result = watch.outcome(elapsed_ms, timeout)
+                if result is not None:
+                    return result
+                if watch.may_check_client(elapsed_ms) and self._rejected_client_side(form_selector):
+                    return SubmitResult(False, None, "client-validation")
+                self.page.wait_for_timeout(25)   # ги процесира event-ите на sync API-то
+        finally:
+            watch.detach(self.page)
+
+    def _rejected_client_side(self, form_selector: str) -> bool:
+        form = self.page.locator(form_selector).first
+        try:
+            if form.count() and not form.evaluate("f => f.checkValidity()"):
+                return True
+        except PlaywrightError:
+            pass   # формата се детачира (success re-render) – одлучува одговорот
+        return self.page.locator(".alert-danger >> visible=true").count() > 0
+
     def wait_success_contact(self, timeout: int = 20000) -> str:
         self.success_alert.wait_for(state="visible", timeout=timeout)
         return self.success_alert.inner_text()
@@ -105,6 +394,23 @@ class MainPage:
         self.login_password_input.fill(password)
         self.login_button.click()
 
+    def login_as_admin(self, timeout: int = 15000) -> None:
+        """Цел login преку формата (admin/password) + чекање на админ UI."""
+        self.goto_admin()
+        self.login(ADMIN_USERNAME, ADMIN_PASSWORD)
+        self.wait_any(ADMIN_DASHBOARD_SELECTORS, timeout=timeout)
+
+    def login_error_candidates(self) -> list:
+        return LOGIN_ERROR_SELECTORS + [self.page.get_by_text(t, exact=False) for t in LOGIN_ERROR_TEXTS]
+
+    def wait_login_outcome(self, timeout: int = 15000) -> str:
+        """По submit: "success" (админ UI) или "error" (alert/текст) – што ќе дојде прво."""
+        outcome, _ = self.wait_outcome(
+            {"success": ADMIN_DASHBOARD_SELECTORS, "error": self.login_error_candidates()},
+            timeout=timeout,
+        )
+        return outcome
+
     # ============================ BOOKING FLOW =========================
     # Ако ги користиш booking тестовите – остави ги следниве методи.
     # Ако не – можеш да ги игнорираш. (Ги вклучувам за комплетност.)
@@ -145,6 +451,15 @@ class MainPage:
         book_now.click()
         self.page.wait_for_url("**/reservation/**", timeout=timeout)
 
+    def click_book_now(self, room_id: int, timeout: int = 30000) -> None:
+        """'Book now' на конкретна соба (слот од perf/slots.py), не на првата во листата."""
+        self._wait_rooms_section(timeout=timeout)
+        book_now = self.page.locator(f"section#rooms a[href*='/reservation/{room_id}?']").first
+        book_now.wait_for(state="visible", timeout=timeout)
+        book_now.scroll_into_view_if_needed()
+        book_now.click()
+        self.page.wait_for_url(f"**/reservation/{room_id}**", timeout=timeout)
+
     def maybe_click_sidebar_reserve_now(self, timeout: int = 15000) -> None:
         if self.page.locator("#doReservation").first.is_visible(timeout=1000):
             return
@@ -187,5 +502,11 @@ class MainPage:
         self.page.locator("#doReservation").scroll_into_view_if_needed()
         self.page.locator("#doReservation").click()
 
+    def click_final_reserve_checked(self, timeout: int = 5000) -> SubmitResult:
+        """Финален 'Reserve Now' + одлука по одговорот од /api/booking."""
+        return self._submit_and_capture(
+            self.click_final_reserve, BOOKING_API, "#doReservation >> xpath=ancestor::form", timeout
+        )
+
     def wait_booking_confirmed(self, timeout: int = 25000) -> None:
         self.page.get_by_role("heading", name="Booking Confirmed").first.wait_for(timeout=timeout)
@@ -0,0 +1,273 @@
+# perf/arrivals.py
+"""Open-model injection профили (ramp_users, constant_users_per_sec, ...,
+како во Gatling) и token-bucket RPS cap. Времињата се апсолутни од почетокот
+на профилот – задоцнетите корисници тргнуваат веднаш, а доцнењето е lag.
+"""
+
+import asyncio
+import math
+import time
+from typing import Awaitable, Callable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from perf.histogram import LatencyHistogram
+
+
+class Segment(NamedTuple):
+    start_rate: float     # корисници/барања во секунда на почетокот
+    end_rate: float       # ... на крајот (линеарно помеѓу)
+    duration: float       # секунди; 0 + count → сите одеднаш
+    count: int = 0        # само за импулс (at_once_users)
+
+    @property
+    def total(self) -> float:
+        if self.count:
+            return float(self.count)
+        return (self.start_rate + self.end_rate) / 2 * self.duration
+
+    def time_of(self, k: float) -> float:
+        """Секунди од почетокот на сегментот кога N = k (0 <= k < total)."""
+        if self.count or self.duration <= 0:
+            return 0.0
+        slope = (self.end_rate - self.start_rate) / self.duration
+        if abs(slope) < 1e-12:
+            return k / self.start_rate
+        # slope/2·t² + start·t − k = 0
+        disc = self.start_rate ** 2 + 2 * slope * k
+        return (-self.start_rate + math.sqrt(max(disc, 0.0))) / slope
+
+
+class RateProfile:
+    """Низа сегменти; `a + b` ги надоврзува (како injectOpen(a, b))."""
+
+    def __init__(self, segments: Sequence[Segment]):
+        self.segments: List[Segment] = list(segments)
+
+    def __add__(self, other: "RateProfile") -> "RateProfile":
+        return RateProfile(self.segments + other.segments)
+
+    @property
+    def duration(self) -> float:
+        return sum(s.duration for s in self.segments)
+
+    @property
+    def total(self) -> int:
+        """Број на пристигнувања (корисници/дозволи) во целиот профил."""
+        return int(math.floor(sum(s.total for s in self.segments) + 1e-9))
+
+    def cumulative(self, t: float) -> float:
+        """N(t) – колку пристигнувања се планирани до момент t."""
+        done, offset = 0.0, 0.0
+        for s in self.segments:
+            if t < offset:
+                break
+            if s.count:
+                done += s.count
+            elif t >= offset + s.duration:
+                done += s.total
+            else:
+                dt = t - offset
+                done += s.start_rate * dt + (s.end_rate - s.start_rate) / s.duration * dt * dt / 2
+                break
+            offset += s.duration
+        return done
+
+    def time_of(self, k: float) -> Optional[float]:
+        """Момент (секунди од почетокот) на k-тото пристигнување; None ако е надвор од профилот."""
+        offset = 0.0
+        for s in self.segments:
+            if k < s.total - 1e-9:
+                return offset + s.time_of(k)
+            k -= s.total
+            offset += s.duration
+        return None
+
+    def arrivals(self, first: int = 0, step: int = 1) -> Iterator[float]:
+        """Времињата на пристигнувањата first, first+step, ... (step > 1 → еден shard)."""
+        k = first
+        while True:
+            at = self.time_of(k)
+            if at is None:
+                return
+            yield at
+            k += step
+
+    def scaled(self, factor: float) -> "RateProfile":
+        """Истиот облик со `factor` пати брзина (дел од RPS cap за еден worker)."""
+        return RateProfile([Segment(s.start_rate * factor, s.end_rate * factor, s.duration,
+                                    math.ceil(s.count * factor)) for s in self.segments])
+
+
+# ================================ PROFILES ===================================
+
+def constant_users_per_sec(rate: float, during: float) -> RateProfile:
+    return RateProfile([Segment(rate, rate, during)])
+
+
+def ramp_users(users: int, during: float) -> RateProfile:
+    """Gatling rampUsers: `users` рамномерно распоредени низ `during` секунди."""
+    if during <= 0:
+        return at_once_users(users)
+    return constant_users_per_sec(users / during, during)
+
+
+def ramp_users_per_sec(start_rate: float, end_rate: float, during: float) -> RateProfile:
+    return RateProfile([Segment(start_rate, end_rate, during)])
+
+
+def at_once_users(users: int) -> RateProfile:
+    return RateProfile([Segment(0, 0, 0, users)])
+
+
+def nothing_for(during: float) -> RateProfile:
+    return RateProfile([Segment(0, 0, during)])
+
+
+def stepped(start_rate: float, step: float, levels: int, level_during: float,
+            ramp_during: float = 0) -> RateProfile:
+    """incrementUsersPerSec(step).times(levels).eachLevelLasting(level_during).startingFrom(start_rate)."""
+    segments = []
+    for level in range(levels):
+        rate = start_rate + level * step
+        if level and ramp_during:
+            segments.append(Segment(rate - step, rate, ramp_during))
+        segments.append(Segment(rate, rate, level_during))
+    return RateProfile(segments)
+
+
+def spike(base_rate: float, peak_rate: float, during: float, spike_at: float,
+          spike_during: float) -> RateProfile:
+    """Константна `base_rate`, а од `spike_at` во траење `spike_during` – `peak_rate`."""
+    after = max(0.0, during - spike_at - spike_during)
+    return (constant_users_per_sec(base_rate, spike_at)
+            + constant_users_per_sec(peak_rate, spike_during)
+            + constant_users_per_sec(base_rate, after))
+
+
+def reach_rps(target_rps: float, in_sec: float, hold_for: float) -> RateProfile:
+    """throttle(reachRps(target).in(in_sec), holdFor(hold_for)) – профил на дозволи."""
+    return ramp_users_per_sec(0, target_rps, in_sec) + constant_users_per_sec(target_rps, hold_for)
+
+
+_PROFILE_KINDS = {
+    "constant": constant_users_per_sec,
+    "ramp": ramp_users,
+    "ramp_rate": ramp_users_per_sec,
+    "at_once": at_once_users,
+    "nothing": nothing_for,
+    "stepped": stepped,
+    "spike": spike,
+}
+
+
+def parse_profile(spec: str) -> RateProfile:
+    """
+    CLI запис: делови `вид:аргументи` споени со '+', на пр.
+    `nothing:5+ramp_rate:1:20:60+constant:20:120` или `spike:2:40:120:60:10`.
+    Аргументите се истите како кај функциите погоре, по ред.
+    """
+    profile = RateProfile([])
+    for part in spec.split("+"):
+        kind, *args = part.strip().split(":")
+        if kind not in _PROFILE_KINDS:
+            raise ValueError(f"unknown profile {kind!r}; expected one of {sorted(_PROFILE_KINDS)}")
+        values = [int(a) if kind in ("at_once", "ramp") and i == 0 else float(a) for i, a in enumerate(args)]
+        if kind == "stepped" and len(values) > 2:
+            values[2] = int(values[2])
+        profile = profile + _PROFILE_KINDS[kind](*values)
+    return profile
+
+
+# ============================== TOKEN BUCKET =================================
+
+class TokenBucket:
+    """
+    Глобален RPS cap. Токените се полнат по `profile` (N(t) токени до момент
+    t), корпата собира најмногу `burst`. Дозволите се резервираат по ред, па
+    секоја има точен планиран момент – се враќа за coordinated-omission мерење.
+    По крајот на профилот дозволи нема (како крајот на Gatling throttle).
+    """
+
+    def __init__(self, profile: RateProfile, burst: int = 1, clock=time.monotonic,
+                 started: Optional[float] = None):
+        self.profile = profile
+        self.burst = max(1, burst)
+        self.clock = clock
+        self.started = clock() if started is None else started
+        self.ends = self.started + profile.duration
+        self.issued = 0
+
+    def reserve(self) -> Optional[float]:
+        """Резервира дозвола; апсолутниот планиран момент (clock) или None ако профилот истекол."""
+        now = self.clock()
+        # до момент t се дозволени burst + N(t); неискористените над `burst` пропаѓаат
+        self.issued = max(self.issued, math.floor(self.profile.cumulative(now - self.started)))
+        at = self.profile.time_of(max(0, self.issued + 1 - self.burst))
+        if at is None or self.started + at >= self.ends:
+            return None
+        self.issued += 1
+        return max(self.started + at, now)
+
+    async def acquire(self) -> Optional[float]:
+        """Чека до дозволата; го враќа планираниот момент на праќање."""
+        intended = self.reserve()
+        if intended is None:
+            return None
+        delay = intended - self.clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return intended
+
+
+# =============================== SCHEDULER ===================================
+
+class ScheduleReport(NamedTuple):
+    arrivals: int
+    late: int                    # тргнати подоцна од `late_after_ms`
+    lag: LatencyHistogram        # доцнење по пристигнување (ms)
+    elapsed: float               # секунди
+
+    def summary(self) -> str:
+        return (f"arrivals={self.arrivals} late={self.late} "
+                f"lag p50={self.lag.percentile(50):.1f}ms p99={self.lag.percentile(99):.1f}ms "
+                f"max={self.lag.max:.1f}ms in {self.elapsed:.2f}s")
+
+
+Arrival = Callable[[int, float], Awaitable[None]]
+
+
+async def run_profile(profile: RateProfile, on_arrival: Arrival, late_after_ms: float = 5.0,
+                      lag: Optional[LatencyHistogram] = None, shard: Tuple[int, int] = (0, 1),
+                      started: Optional[float] = None, clock=time.monotonic,
+                      sleep=asyncio.sleep) -> ScheduleReport:
+    """
+    За секое пристигнување стартува `on_arrival(index, intended)` како посебен
+    task (open model – не се чека претходниот). Еден „будилник“ спие до
+    следното планирано време и ги пушта СИТЕ што веќе доспеале; сите времиња
+    се од еден апсолутен почеток, па нема акумулирано поместување.
+    `lag` – заеднички хистограм (останува пополнет и ако task-от се откаже).
+    `shard=(i, n)` – само пристигнувањата i, i+n, i+2n, ... (worker i од n,
+    perf/distributed.py); `started` – заеднички почеток (clock) за сите shards.
+    `clock`/`sleep` – за тестови со виртуелно време (распоред без wall-clock).
+    """
+    started = clock() if started is None else started
+    lag = lag if lag is not None else LatencyHistogram(highest_ms=600_000)
+    tasks = set()
+    late = count = 0
+    index, workers = shard
+    for at in profile.arrivals(index, workers):
+        intended = started + at
+        delay = intended - clock()
+        if delay > 0:
+            await sleep(delay)
+        elif count % 256 == 255:
+            await sleep(0)   # при стигнување на заостаток – да тргнат и пуштените
+        lag_ms = max(0.0, (clock() - intended) * 1000)
+        lag.record(lag_ms)
+        late += lag_ms > late_after_ms
+        task = asyncio.ensure_future(on_arrival(index + count * workers, intended))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        count += 1
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return ScheduleReport(count, late, lag, clock() - started)
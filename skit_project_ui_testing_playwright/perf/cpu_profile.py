@@ -0,0 +1,242 @@
+# perf/cpu_profile.py
+"""Frontend CPU profiling околу избрани MainPage акции (Chromium CDP): CPU profile
+(self-time по функција) и trace (long tasks) – дали бавната акција е JavaScript
+или чекање на мрежа. Суровите .cpuprofile/.trace.json се за DevTools/Perfetto.
+Без CDP → "unsupported", несобран профил → "lost". Вклучување: plugins/cpu_profile.py.
+"""
+
+import functools
+import inspect
+import json
+import re
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_DIR = Path(".perf") / "cpu-profiles"
+DEFAULT_ACTIONS = ("click_book_now", "click_first_book_now", "set_dates")
+LONG_TASK_MS = 50.0
+TRACE_CATEGORIES = "devtools.timeline,disabled-by-default-devtools.timeline,v8.execute"
+# не се „работа“ на страницата
+_IDLE_NODES = {"(idle)", "(root)"}
+
+
+class FunctionTime(NamedTuple):
+    function: str          # име (или "(anonymous)")
+    location: str          # url:line
+    self_ms: float
+
+
+class ActionProfile(NamedTuple):
+    test: Optional[str]
+    action: str
+    wall_ms: float
+    busy_ms: float                 # CPU семплови без idle
+    long_tasks: List[float]        # траења во ms, >= LONG_TASK_MS
+    top: List[FunctionTime]
+    files: List[str]               # зачувани сурови фајлови
+
+    def as_dict(self) -> Dict:
+        """За xdist workeroutput / JSON (вгнездените NamedTuple → dict)."""
+        return {**self._asdict(), "top": [row._asdict() for row in self.top]}
+
+
+# ============================== ANALYSIS =====================================
+
+def self_times(profile: Dict) -> List[FunctionTime]:
+    """
+    Self-time по функција од CDP `Profiler.Profile`. Семплот i трае
+    timeDeltas[i + 1] µs (времето до следниот семпл); ист callFrame во
+    различни call paths (повеќе nodes) се собира. Сортирано опаѓачки, без idle.
+    """
+    samples = np.asarray(profile.get("samples", []), dtype=np.int64)
+    if samples.size == 0:
+        return []
+    deltas = np.asarray(profile.get("timeDeltas", []), dtype=np.float64)
+    durations = np.append(deltas[1:], 0.0)[: samples.size]
+    per_node = np.bincount(samples, weights=durations)
+
+    totals: Dict[tuple, float] = defaultdict(float)
+    for node in profile["nodes"]:
+        node_id = node["id"]
+        if node_id >= per_node.size or not per_node[node_id]:
+            continue
+        frame = node["callFrame"]
+        name = frame.get("functionName") or "(anonymous)"
+        if name in _IDLE_NODES:
+            continue
+        url = frame.get("url") or ""
+        location = f"{url.rsplit('/', 1)[-1]}:{frame.get('lineNumber', -1) + 1}" if url else ""
+        totals[(name, location)] += float(per_node[node_id]) / 1000
+    return sorted((FunctionTime(name, location, ms) for (name, location), ms in totals.items()),
+                  key=lambda row: row.self_ms, reverse=True)
+
+
+def long_tasks(events: Iterable[Dict], threshold_ms: float = LONG_TASK_MS) -> List[float]:
+    """Траења (ms) на RunTask задачи на renderer main thread-от над прагот."""
+    events = list(events)
+    main_threads = {(e.get("pid"), e.get("tid")) for e in events
+                    if e.get("ph") == "M" and e.get("name") == "thread_name"
+                    and e.get("args", {}).get("name") == "CrRendererMain"}
+    return [e["dur"] / 1000 for e in events
+            if e.get("ph") == "X" and e.get("name") in ("RunTask", "ThreadControllerImpl::RunTask")
+            and (e.get("pid"), e.get("tid")) in main_threads and e.get("dur", 0) / 1000 >= threshold_ms]
+
+
+def slug(nodeid: Optional[str]) -> str:
+    return re.sub(r"[^\w.-]", "_", (nodeid or "no-test").replace("::", "__"))
+
+
+# =============================== CAPTURE =====================================
+
+class CpuProfiler:
+    """Сите профили од еден pytest процес; `records` се резимеа (JSON-серијализабилни)."""
+
+    def __init__(self, actions: Sequence[str] = DEFAULT_ACTIONS, out_dir: Path = DEFAULT_DIR,
+                 interval_us: int = 100, top: int = 5, tracing: bool = True):
+        self.actions = set(actions)
+        self.out_dir = Path(out_dir)
+        self.interval_us = interval_us
+        self.top = top
+        self.tracing = tracing
+        self.test: Optional[str] = None
+        self.records: List[ActionProfile] = []
+        self.unsupported = 0
+        self.lost = 0                  # профилот не се собрал (затворена страница, CDP грешка)
+        self._busy = False
+        self._counter = 0
+
+    def wants(self, action: str) -> bool:
+        return action in self.actions and not self._busy
+
+    def run(self, page, action: str, call):
+        """Ја извршува `call()` со CPU profile + trace околу неа."""
+        self._busy = True
+        try:
+            try:
+                session = page.context.new_cdp_session(page)
+            except Exception:                          # Firefox/WebKit – нема CDP
+                self.unsupported += 1
+                return call()
+            chunks: List[Dict] = []
+            done = []
+            session.send("Profiler.enable")
+            session.send("Profiler.setSamplingInterval", {"interval": self.interval_us})
+            if self.tracing:
+                session.on("Tracing.dataCollected", lambda params: chunks.extend(params["value"]))
+                session.on("Tracing.tracingComplete", lambda params: done.append(True))
+                session.send("Tracing.start", {"categories": TRACE_CATEGORIES, "transferMode": "ReportEvents"})
+            session.send("Profiler.start")
+            started = time.perf_counter()
+            try:
+                return call()
+            finally:
+                wall_ms = (time.perf_counter() - started) * 1000
+                self._finish(page, session, action, wall_ms, chunks, done)
+        finally:
+            self._busy = False
+
+    def _finish(self, page, session, action, wall_ms, chunks, done) -> None:
+        try:
+            profile = session.send("Profiler.stop")["profile"]
+            if self.tracing:
+                session.send("Tracing.end")
+                deadline = time.perf_counter() + 5
+                while not done and time.perf_counter() < deadline:
+                    page.wait_for_timeout(20)          # sync API: events се испорачуваат додека чека
+            session.detach()
+        except Exception:                              # страницата/context-от е затворен во акцијата
+            self.lost += 1
+            return
+        functions = self_times(profile)
+        self._counter += 1
+        stem = self.out_dir / slug(self.test) / f"{self._counter:02d}-{action}"
+        stem.parent.mkdir(parents=True, exist_ok=True)
+        files = [stem.with_suffix(".cpuprofile")]
+        files[0].write_text(json.dumps(profile), encoding="utf-8")
+        if chunks:
+            files.append(stem.with_suffix(".trace.json"))
+            files[1].write_text(json.dumps({"traceEvents": chunks}), encoding="utf-8")
+        self.records.append(ActionProfile(
+            self.test, action, wall_ms, sum(f.self_ms for f in functions),
+            long_tasks(chunks), functions[: self.top], [str(f) for f in files]))
+
+    def take(self, test: str) -> List[ActionProfile]:
+        return [r for r in self.records if r.test == test]
+
+
+def format_profile(record: ActionProfile) -> str:
+    """Неколку реда за pytest извештајот на тестот."""
+    tasks = record.long_tasks
+    lines = [f"{record.action}: wall {record.wall_ms:.0f} ms, CPU busy {record.busy_ms:.0f} ms, "
+             f"long tasks {len(tasks)}" + (f" (max {max(tasks):.0f} ms, total {sum(tasks):.0f} ms)" if tasks else "")]
+    for row in record.top:
+        lines.append(f"    {row.self_ms:8.1f} ms  {row.function}  {row.location}")
+    lines.extend(f"    -> {path}" for path in record.files)
+    return "\n".join(lines)
+
+
+def summarize(records: Iterable[Dict], top: int = 5) -> List[Dict]:
+    """По акција низ сите тестови (records од `as_dict`): медијани, long tasks, top функции."""
+    by_action: Dict[str, List[Dict]] = defaultdict(list)
+    for record in records:
+        by_action[record["action"]].append(record)
+    rows = []
+    for action, items in by_action.items():
+        functions: Dict[tuple, float] = defaultdict(float)
+        for item in items:
+            for row in item["top"]:
+                functions[(row["function"], row["location"])] += row["self_ms"]
+        tasks = [ms for item in items for ms in item["long_tasks"]]
+        rows.append({
+            "action": action,
+            "count": len(items),
+            "wall_p50": float(np.median([i["wall_ms"] for i in items])),
+            "busy_p50": float(np.median([i["busy_ms"] for i in items])),
+            "long_tasks": len(tasks),
+            "long_task_max": max(tasks, default=0.0),
+            "top": sorted(functions.items(), key=lambda kv: kv[1], reverse=True)[:top],
+        })
+    return sorted(rows, key=lambda row: row["wall_p50"], reverse=True)
+
+
+# ============================ INSTRUMENTATION ================================
+
+_active: Optional[CpuProfiler] = None
+
+
+def enable(profiler: CpuProfiler) -> CpuProfiler:
+    global _active
+    _active = profiler
+    return profiler
+
+
+def disable() -> None:
+    global _active
+    _active = None
+
+
+def active() -> Optional[CpuProfiler]:
+    return _active
+
+
+def cpu_profiled(cls):
+    """Ги обвиткува јавните sync методи; без активен профилер – една проверка."""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value) or inspect.iscoroutinefunction(value):
+            continue
+
+        def wrap(fn, name=attr):
+            @functools.wraps(fn)
+            def wrapper(self, *args, **kwargs):
+                profiler = _active
+                if profiler is None or not profiler.wants(name):
+                    return fn(self, *args, **kwargs)
+                return profiler.run(self.page, name, lambda: fn(self, *args, **kwargs))
+            return wrapper
+
+        setattr(cls, attr, wrap(value))
+    return cls
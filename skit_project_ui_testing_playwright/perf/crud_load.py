@@ -0,0 +1,412 @@
+# perf/crud_load.py
+"""asyncio + aiohttp верзија на Gatling RestfulBookerCrudSimulation: истите
+сценарија, injection, throttle и assertions (успешни > 98%, p95 < 1000 ms по барање).
+
+    python -m perf.crud_load --duration-sec 60 --ramp-users 5 --target-rps 10
+    python -m perf.crud_load --local --local-latency lognormal:20:0.5   # офлајн
+
+Излезен код 1 ако некоја assertion падне.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import aiohttp
+
+from perf.arrivals import (
+    RateProfile,
+    TokenBucket,
+    constant_users_per_sec,
+    parse_profile,
+    ramp_users,
+    reach_rps,
+    run_profile,
+)
+from perf.feeders import STRATEGIES, Feeder, FeederExhausted, GeneratedSource, booking_record, open_source
+from perf.histogram import LatencyHistogram
+from perf.history import HistoryDB, current_environment, record_crud_stats
+
+DEFAULT_BASE_URL = "https://restful-booker.herokuapp.com"
+AUTH_BODY = {"username": "admin", "password": "password123"}
+
+
+class CrudSettings(NamedTuple):
+    base_url: str = DEFAULT_BASE_URL
+    duration_sec: float = 120
+    ramp_users: int = 5
+    target_rps: float = 10
+    # фиксни во Java симулацијата
+    negative_users_per_sec: float = 1
+    negative_during_sec: float = 30
+    throttle_ramp_sec: float = 30
+    min_success_pct: float = 98.0
+    p95_max_ms: float = 1000
+
+
+Scenario = Callable[["CrudClient"], Awaitable[None]]
+
+
+class AssertionResult(NamedTuple):
+    description: str
+    actual: float
+    ok: bool
+
+
+def booking_body(record: dict) -> dict:
+    """
+    Рамен feeder запис (firstname, ..., checkin, checkout, needs) → JSON тело за
+    /booking. Записите од CSV се стрингови, па бројот и bool-от се конвертираат.
+    """
+    deposit = record["depositpaid"]
+    return {
+        "firstname": record["firstname"],
+        "lastname": record["lastname"],
+        "totalprice": int(record["totalprice"]),
+        "depositpaid": deposit if isinstance(deposit, bool) else str(deposit).lower() == "true",
+        "bookingdates": {"checkin": record["checkin"], "checkout": record["checkout"]},
+        "additionalneeds": record.get("needs", ""),
+    }
+
+
+def booking_payload(rnd: random.Random = random) -> dict:
+    """Исто како Java bookingFeeder: случајни имиња, цена, датуми (1–9 дена од денес, 1–4 ноќи)."""
+    return booking_body(booking_record(rnd, 0))
+
+
+# ================================= STATS =====================================
+
+class RequestStats:
+    """
+    OK/KO и хистограми на времиња (ms) по име на барање (CreateToken, ...).
+
+    `response` се мери од ПЛАНИРАНИОТ момент на праќање (слотот од throttle-от),
+    па доцнењето на генераторот (полн pool, зафатен event loop) влегува во
+    бројката наместо да се „изгуби“ (coordinated omission); `service` е чистото
+    време од праќање до одговор. Assertions одат на `response`.
+    """
+
+    def __init__(self, significant_digits: int = 2):
+        self.significant_digits = significant_digits
+        self.response: Dict[str, LatencyHistogram] = {}
+        self.service: Dict[str, LatencyHistogram] = {}
+        self.ok: Dict[str, int] = defaultdict(int)
+        self.ko: Dict[str, int] = defaultdict(int)
+        # колку доцнеше стартот на корисниците наспроти injection профилот
+        self.schedule_lag = LatencyHistogram(highest_ms=600_000)
+
+    def _histogram(self, table: Dict[str, LatencyHistogram], name: str) -> LatencyHistogram:
+        if name not in table:
+            table[name] = LatencyHistogram(significant_digits=self.significant_digits)
+        return table[name]
+
+    def record(self, name: str, latency_ms: float, ok: bool, lag_ms: float = 0.0) -> None:
+        self._histogram(self.service, name).record(latency_ms)
+        self._histogram(self.response, name).record(latency_ms + max(lag_ms, 0.0))
+        (self.ok if ok else self.ko)[name] += 1
+
+    def names(self) -> List[str]:
+        return sorted(self.response)
+
+    def count(self, name: Optional[str] = None) -> int:
+        return self.successes(name) + self.failures(name)
+
+    def successes(self, name: Optional[str] = None) -> int:
+        return self.ok[name] if name else sum(self.ok.values())
+
+    def failures(self, name: Optional[str] = None) -> int:
+        return self.ko[name] if name else sum(self.ko.values())
+
+    def histogram(self, name: Optional[str] = None, corrected: bool = True) -> LatencyHistogram:
+        """Хистограм за `name`; за None – сите барања споени (Global)."""
+        table = self.response if corrected else self.service
+        if name:
+            return self._histogram(table, name)
+        merged = LatencyHistogram(significant_digits=self.significant_digits)
+        for histogram in table.values():
+            merged.merge(histogram)
+        return merged
+
+    def percentile(self, name: Optional[str], pct: float, corrected: bool = True) -> float:
+        return self.histogram(name, corrected).percentile(pct)
+
+    # ------------------------- snapshots (distributed) ----------------------
+
+    def snapshot(self) -> Dict:
+        """JSON-безбеден snapshot (хистограмите со LatencyHistogram.encode)."""
+        return {
+            "ok": dict(self.ok),
+            "ko": dict(self.ko),
+            "response": {name: h.encode() for name, h in self.response.items()},
+            "service": {name: h.encode() for name, h in self.service.items()},
+            "lag": self.schedule_lag.encode(),
+        }
+
+    def drain(self) -> Dict:
+        """Snapshot од досега снименото, па нула – за интервални (delta) snapshots."""
+        snapshot = self.snapshot()
+        self.response.clear()
+        self.service.clear()
+        self.ok.clear()
+        self.ko.clear()
+        self.schedule_lag.reset()
+        return snapshot
+
+    def merge_snapshot(self, snapshot: Dict) -> "RequestStats":
+        for name, count in snapshot["ok"].items():
+            self.ok[name] += count
+        for name, count in snapshot["ko"].items():
+            self.ko[name] += count
+        for attr in ("response", "service"):
+            table = getattr(self, attr)
+            for name, encoded in snapshot[attr].items():
+                self._histogram(table, name).merge(LatencyHistogram.decode(encoded))
+        self.schedule_lag.merge(LatencyHistogram.decode(snapshot["lag"]))
+        return self
+
+
+def evaluate_assertions(stats: RequestStats, min_success_pct: float = 98.0,
+                        p95_max_ms: float = 1000) -> List[AssertionResult]:
+    """global().successfulRequests().percent().gt(...) + forAll().responseTime().percentile(95).lt(...)."""
+    total = stats.count()
+    success_pct = 100.0 * stats.successes() / total if total else 0.0
+    results = [AssertionResult(f"Global: percentage of successful events is greater than {min_success_pct}",
+                               success_pct, success_pct > min_success_pct)]
+    for name in stats.names():                     # forAll = секое барање, без Global
+        p95 = stats.percentile(name, 95)
+        results.append(AssertionResult(f"{name}: 95th percentile of response time is less than {p95_max_ms:g}",
+                                       p95, p95 < p95_max_ms))
+    return results
+
+
+# ============================== CRUD CLIENT ==================================
+
+class _ChainAborted(Exception):
+    """Нема token/bookingId од претходен чекор, или throttle-от истекол."""
+
+
+class CrudClient:
+    """
+    Чекорите од Java симулацијата; без состојба – token/bookingId се враќаат на
+    ланецот. Телата за create/update доаѓаат од `feeder` (perf/feeders.py).
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, base_url: str,
+                 throttle: TokenBucket, stats: RequestStats, feeder: Feeder):
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.throttle = throttle
+        self.stats = stats
+        self.feeder = feeder
+
+    def booking(self) -> dict:
+        return booking_body(next(self.feeder))
+
+    async def request(self, name: str, method: str, path: str, expect: Sequence[int],
+                      body: Optional[dict] = None, token: Optional[str] = None,
+                      check: Optional[Callable[[dict], bool]] = None) -> Optional[dict]:
+        """
+        Едно барање + status check (и `check` над JSON телото, како jsonPath
+        во Gatling). Враќа телото ({} ако не е JSON) ако е OK, инаку None.
+        """
+        intended = await self.throttle.acquire()
+        if intended is None:
+            raise _ChainAborted("throttle finished")
+        headers = {"Cookie": f"token={token}"} if token else None
+        lag_ms = (time.monotonic() - intended) * 1000
+        started = time.perf_counter()
+        try:
+            async with self.session.request(method, f"{self.base_url}{path}", headers=headers,
+                                            data=json.dumps(body) if body is not None else None) as resp:
+                raw = await resp.read()
+                status = resp.status
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.stats.record(name, (time.perf_counter() - started) * 1000, False, lag_ms)
+            return None
+        latency_ms = (time.perf_counter() - started) * 1000
+        try:
+            payload = json.loads(raw) if raw else {}
+        except ValueError:
+            payload = {}   # restful-booker враќа "Created"/"OK" како text/plain
+        ok = status in expect and (check is None or (isinstance(payload, dict) and check(payload)))
+        self.stats.record(name, latency_ms, ok, lag_ms)
+        return payload if ok else None
+
+    async def auth(self) -> str:
+        payload = await self.request("CreateToken", "POST", "/auth", (200,), AUTH_BODY,
+                                     check=lambda p: "token" in p)
+        if payload is None:
+            raise _ChainAborted("no token")
+        return payload["token"]
+
+    async def create(self) -> int:
+        payload = await self.request("CreateBooking", "POST", "/booking", (200,), self.booking(),
+                                     check=lambda p: "bookingid" in p)
+        if payload is None:
+            raise _ChainAborted("no bookingid")
+        return payload["bookingid"]
+
+    async def read(self, booking_id: int) -> None:
+        await self.request("GetBookingById", "GET", f"/booking/{booking_id}", (200,),
+                           check=lambda p: "firstname" in p)
+
+    async def update(self, booking_id: int, token: str) -> None:
+        await self.request("UpdateBooking", "PUT", f"/booking/{booking_id}", (200, 201, 202),
+                           self.booking(), token)
+
+    async def delete(self, booking_id: int, token: str) -> None:
+        await self.request("DeleteBooking", "DELETE", f"/booking/{booking_id}", (200, 201, 202, 204), token=token)
+
+    async def update_invalid_token(self, booking_id: int) -> None:
+        await self.request("UpdateBooking - Invalid Token", "PUT", f"/booking/{booking_id}", (403,),
+                           self.booking(), "BADTOKEN")
+
+
+async def crud_happy_path(client: CrudClient) -> None:
+    token = await client.auth()
+    booking_id = await client.create()
+    await client.read(booking_id)
+    await client.update(booking_id, token)
+    await client.delete(booking_id, token)
+
+
+async def crud_negative(client: CrudClient) -> None:
+    await client.auth()
+    booking_id = await client.create()
+    await client.update_invalid_token(booking_id)
+
+
+# ================================= RUNNER ====================================
+
+def injection_profiles(settings: CrudSettings) -> List[Tuple[RateProfile, Scenario]]:
+    """setUp(...) од Java: rampUsers за happy path, constantUsersPerSec за негативниот."""
+    return [
+        (ramp_users(settings.ramp_users, settings.duration_sec), crud_happy_path),
+        (constant_users_per_sec(settings.negative_users_per_sec, settings.negative_during_sec), crud_negative),
+    ]
+
+
+def build_profiles(settings: CrudSettings, spec: Optional[str] = None) -> List[Tuple[RateProfile, Scenario]]:
+    """Стандардната injection, или `spec` (perf.arrivals.parse_profile) за happy path."""
+    profiles = injection_profiles(settings)
+    if spec:
+        profiles[0] = (parse_profile(spec), crud_happy_path)
+    return profiles
+
+
+async def run_crud_load(settings: CrudSettings, connections: int = 100, seed: Optional[int] = None,
+                        profiles: Optional[Sequence[Tuple[RateProfile, Scenario]]] = None,
+                        stats: Optional[RequestStats] = None, shard: Tuple[int, int] = (0, 1),
+                        started: Optional[float] = None, feeder: Optional[Feeder] = None) -> RequestStats:
+    """
+    `profiles` ја заменува стандардната injection (на пр. stepped/spike од
+    perf/arrivals.py). `shard=(i, n)`: овој процес е worker i од n – ги носи
+    пристигнувањата i, i+n, ... и 1/n од RPS cap-от; `started` е заедничкиот
+    почеток (time.monotonic) за сите workers (perf/distributed.py).
+    `feeder` – извор на booking податоци; стандардно генератор со `seed`.
+    Празен queue feeder го прекинува само ланецот на тој корисник.
+    """
+    stats = stats if stats is not None else RequestStats()
+    feeder = feeder if feeder is not None else Feeder(GeneratedSource(booking_record, seed), "circular")
+    index, workers = shard
+    throttle = TokenBucket(
+        reach_rps(settings.target_rps, settings.throttle_ramp_sec, settings.duration_sec).scaled(1 / workers),
+        started=started,
+    )
+    connector = aiohttp.TCPConnector(limit=connections, keepalive_timeout=30)
+    headers = {"Content-Type": "application/json", "Accept": "application/json"}
+    async with aiohttp.ClientSession(connector=connector, headers=headers,
+                                     cookie_jar=aiohttp.DummyCookieJar(),
+                                     timeout=aiohttp.ClientTimeout(total=60)) as session:
+        client = CrudClient(session, settings.base_url, throttle, stats, feeder)
+
+        def _user(scenario: Scenario):
+            async def _run(index: int, intended: float) -> None:
+                try:
+                    await scenario(client)
+                except (_ChainAborted, FeederExhausted):
+                    pass
+            return _run
+
+        runs = [asyncio.ensure_future(run_profile(profile, _user(scenario), lag=stats.schedule_lag,
+                                                  shard=shard, started=throttle.started))
+                for profile, scenario in profiles or injection_profiles(settings)]
+        # симулацијата завршува кога ќе истече throttle-от (како во Gatling)
+        _, pending = await asyncio.wait(runs, timeout=max(0.0, throttle.ends - time.monotonic()))
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return stats
+
+
+def report(stats: RequestStats, assertions: Sequence[AssertionResult]) -> str:
+    lines = [f"{'request':<32}{'count':>7}{'ko':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'p99 raw':>9}"]
+    for name in stats.names() + [None]:
+        h = stats.histogram(name)
+        lines.append(
+            f"{name or 'Global':<32}{stats.count(name):>7}{stats.failures(name):>6}"
+            f"{h.percentile(50):>9.1f}{h.percentile(95):>9.1f}{h.percentile(99):>9.1f}{h.max:>9.1f}"
+            f"{stats.percentile(name, 99, corrected=False):>9.1f}"
+        )
+    lag = stats.schedule_lag
+    lines.append(f"injection lag: users={lag.total_count} p99={lag.percentile(99):.1f}ms max={lag.max:.1f}ms")
+    lines += [f"{a.description} : {str(a.ok).lower()} (actual : {a.actual:.1f})" for a in assertions]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    defaults = CrudSettings()
+    parser = argparse.ArgumentParser(description="restful-booker CRUD load (Python port of RestfulBookerCrudSimulation)")
+    parser.add_argument("--base-url", default=defaults.base_url)
+    parser.add_argument("--duration-sec", type=float, default=defaults.duration_sec)
+    parser.add_argument("--ramp-users", type=int, default=defaults.ramp_users)
+    parser.add_argument("--target-rps", type=float, default=defaults.target_rps)
+    parser.add_argument("--connections", type=int, default=100, help="keep-alive connection pool size")
+    parser.add_argument("--seed", type=int, default=None, help="feeder seed for repeatable payloads")
+    parser.add_argument("--profile", default=None,
+                        help="happy-path injection instead of rampUsers, e.g. 'spike:1:20:60:30:5' "
+                             "or 'nothing:5+stepped:2:2:4:15' (see perf.arrivals.parse_profile)")
+    parser.add_argument("--feeder", default=None,
+                        help="booking data file (.csv or .jsonl with firstname,lastname,totalprice,"
+                             "depositpaid,checkin,checkout,needs) instead of generated payloads")
+    parser.add_argument("--feeder-strategy", choices=STRATEGIES, default="circular")
+    parser.add_argument("--history", default=None, metavar="DB",
+                        help="append per-request percentiles to a perf.history SQLite file")
+    parser.add_argument("--local", action="store_true",
+                        help="run against an in-process restful-booker stand-in (mocks/restful_booker.py)")
+    parser.add_argument("--local-latency", default="fixed:0", help="stand-in latency, e.g. lognormal:20:0.5 (ms)")
+    parser.add_argument("--local-error-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    api = None
+    base_url = args.base_url
+    if args.local:
+        from mocks.restful_booker import Fault, Latency, RestfulBookerServer
+        api = RestfulBookerServer(faults={"*": Fault(Latency.parse(args.local_latency), args.local_error_rate)},
+                                  seed=args.seed).start()
+        base_url = api.url
+    settings = defaults._replace(base_url=base_url, duration_sec=args.duration_sec,
+                                 ramp_users=args.ramp_users, target_rps=args.target_rps)
+    profiles = build_profiles(settings, args.profile)
+    feeder = Feeder(open_source(args.feeder), args.feeder_strategy, seed=args.seed) if args.feeder else None
+    try:
+        stats = asyncio.run(run_crud_load(settings, connections=args.connections, seed=args.seed,
+                                          profiles=profiles, feeder=feeder))
+    finally:
+        if api is not None:
+            api.stop()
+    assertions = evaluate_assertions(stats, settings.min_success_pct, settings.p95_max_ms)
+    print(report(stats, assertions))
+    if args.history:
+        with HistoryDB(args.history) as db:
+            record_crud_stats(db, stats, current_environment("local" if args.local else base_url))
+    return 0 if all(a.ok for a in assertions) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
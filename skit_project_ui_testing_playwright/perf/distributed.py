@@ -0,0 +1,250 @@
+# perf/distributed.py
+"""CRUD load (perf/crud_load.py) распореден на N worker процеси / машини: секој
+worker носи shard од глобалниот injection профил, а coordinator-от ги спојува
+нивните RequestStats во еден извештај.
+
+    python -m perf.distributed --processes 4 --target-rps 400 --ramp-users 2000
+    python -m perf.distributed --listen 0.0.0.0:7000 --expect 3    # + --worker host:7000 на секоја машина
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+from perf.crud_load import (
+    CrudSettings,
+    RequestStats,
+    build_profiles,
+    evaluate_assertions,
+    report,
+    run_crud_load,
+)
+from perf.feeders import STRATEGIES, Feeder, open_source
+from perf.history import HistoryDB, current_environment, record_crud_stats
+
+START_DELAY_SEC = 1.0   # колку напред е заедничкиот почеток од „start“ пораката
+
+
+async def _send(writer: asyncio.StreamWriter, message: Dict) -> None:
+    writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+    await writer.drain()
+
+
+async def _receive(reader: asyncio.StreamReader) -> Optional[Dict]:
+    line = await reader.readline()
+    return json.loads(line) if line else None
+
+
+# ================================= WORKER ====================================
+
+async def run_worker(host: str, port: int, interval: float = 1.0) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        await _send(writer, {"type": "hello", "node": socket.gethostname(), "pid": os.getpid()})
+        start = await _receive(reader)
+        if start is None:
+            return
+        settings = CrudSettings(**start["settings"])
+        shard = (start["index"], start["workers"])
+        # wall clock → monotonic: ист момент на сите машини, стабилен во процесот
+        started = time.monotonic() + (start["start_at"] - time.time())
+        stats = RequestStats()
+        feeder = None
+        if start.get("feeder"):
+            feeder = Feeder(open_source(start["feeder"]), start["feeder_strategy"], shard=shard, seed=start["seed"])
+
+        async def _stream() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                await _send(writer, {"type": "snapshot", "index": shard[0], "stats": stats.drain()})
+
+        streamer = asyncio.ensure_future(_stream())
+        try:
+            await run_crud_load(settings, connections=start["connections"], seed=start["seed"],
+                                profiles=build_profiles(settings, start["profile"]),
+                                stats=stats, shard=shard, started=started, feeder=feeder)
+        finally:
+            streamer.cancel()
+            await asyncio.gather(streamer, return_exceptions=True)
+        await _send(writer, {"type": "done", "index": shard[0], "stats": stats.drain()})
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def worker_main(host: str, port: int, interval: float = 1.0) -> None:
+    """Влез за multiprocessing / `--worker host:port`."""
+    asyncio.run(run_worker(host, port, interval))
+
+
+# =============================== COORDINATOR =================================
+
+class Coordinator:
+    """Ги чека `expect` workers, им дели shards и ги спојува нивните snapshots."""
+
+    def __init__(self, settings: CrudSettings, expect: int, profile: Optional[str] = None,
+                 connections: int = 100, seed: Optional[int] = None, progress=None,
+                 feeder: Optional[str] = None, feeder_strategy: str = "circular"):
+        self.settings = settings
+        self.expect = expect
+        self.profile = profile
+        self.connections = connections
+        self.seed = seed
+        self.progress = progress          # callable(str) за тековен статус, или None
+        self.feeder = feeder              # патека до feeder фајл (иста кај секој worker)
+        self.feeder_strategy = feeder_strategy
+        self.stats = RequestStats()
+        self.nodes: List[str] = []
+        self.node_counts: Dict[str, int] = {}   # барања по worker (збирот = stats.count())
+        self.lost: List[str] = []
+        self._ready = asyncio.Event()
+        self._start_at = 0.0
+        self._handlers: List[asyncio.Task] = []
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self._on_connect, host, port)
+
+    async def wait_done(self) -> RequestStats:
+        await self._ready.wait()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        return self.stats
+
+    async def _on_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        hello = await _receive(reader)
+        if hello is None or len(self.nodes) >= self.expect:
+            writer.close()
+            return
+        index = len(self.nodes)
+        node = f"{hello['node']}:{hello['pid']}"
+        self.nodes.append(node)
+        self.node_counts[node] = 0
+        self._handlers.append(asyncio.current_task())
+        if len(self.nodes) == self.expect:
+            self._start_at = time.time() + START_DELAY_SEC
+            self._ready.set()
+        await self._ready.wait()
+
+        await _send(writer, {
+            "type": "start", "index": index, "workers": self.expect, "start_at": self._start_at,
+            "settings": self.settings._asdict(), "profile": self.profile,
+            "connections": self.connections,
+            "feeder": self.feeder, "feeder_strategy": self.feeder_strategy,
+            "seed": None if self.seed is None else self.seed + index,
+        })
+        try:
+            while True:
+                message = await _receive(reader)
+                if message is None:
+                    self.lost.append(node)     # прекината врска – се чува тоа што стигна
+                    return
+                before = self.stats.count()
+                self.stats.merge_snapshot(message["stats"])
+                self.node_counts[node] += self.stats.count() - before
+                if self.progress:
+                    self.progress(f"[{node}] {message['type']}: total={self.stats.count()} "
+                                  f"ko={self.stats.failures()}")
+                if message["type"] == "done":
+                    return
+        finally:
+            writer.close()
+
+
+async def run_distributed(settings: CrudSettings, processes: int = 0, expect: int = 0,
+                          listen: str = "127.0.0.1:0", profile: Optional[str] = None,
+                          connections: int = 100, seed: Optional[int] = None,
+                          interval: float = 1.0, progress=None, feeder: Optional[str] = None,
+                          feeder_strategy: str = "circular") -> Coordinator:
+    """Стартува coordinator + `processes` локални workers; чека и `expect` надворешни."""
+    total = processes + expect
+    if total < 1:
+        raise ValueError("need at least one worker (processes or expect)")
+    host, _, port = listen.rpartition(":")
+    coordinator = Coordinator(settings, total, profile, connections, seed, progress, feeder, feeder_strategy)
+    server = await coordinator.serve(host, int(port))
+    bound_port = server.sockets[0].getsockname()[1]
+    if progress:
+        progress(f"coordinator on {host}:{bound_port}, waiting for {total} workers")
+
+    context = multiprocessing.get_context("spawn")
+    local = [context.Process(target=worker_main, args=("127.0.0.1" if host in ("", "0.0.0.0") else host,
+                                                        bound_port, interval), daemon=True)
+             for _ in range(processes)]
+    for process in local:
+        process.start()
+    try:
+        await coordinator.wait_done()
+    finally:
+        server.close()
+        await server.wait_closed()
+        for process in local:
+            process.join(timeout=10)
+    return coordinator
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    defaults = CrudSettings()
+    parser = argparse.ArgumentParser(description="Distributed restful-booker CRUD load")
+    parser.add_argument("--worker", metavar="HOST:PORT", help="run as a worker for the given coordinator")
+    parser.add_argument("--processes", type=int, default=0, help="local worker processes to spawn")
+    parser.add_argument("--expect", type=int, default=0, help="remote workers to wait for")
+    parser.add_argument("--listen", default="127.0.0.1:0", help="coordinator address (use 0.0.0.0:PORT for remote)")
+    parser.add_argument("--interval", type=float, default=1.0, help="snapshot interval in seconds")
+    parser.add_argument("--base-url", default=defaults.base_url)
+    parser.add_argument("--duration-sec", type=float, default=defaults.duration_sec)
+    parser.add_argument("--ramp-users", type=int, default=defaults.ramp_users)
+    parser.add_argument("--target-rps", type=float, default=defaults.target_rps)
+    parser.add_argument("--profile", default=None, help="happy-path injection (perf.arrivals.parse_profile)")
+    parser.add_argument("--connections", type=int, default=100, help="keep-alive pool size per worker")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--feeder", default=None, help="booking data file (.csv/.jsonl), sharded across workers")
+    parser.add_argument("--feeder-strategy", choices=STRATEGIES, default="circular")
+    parser.add_argument("--history", default=None, metavar="DB",
+                        help="append per-request percentiles to a perf.history SQLite file")
+    parser.add_argument("--local", action="store_true",
+                        help="target an in-process restful-booker stand-in started by the coordinator")
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        host, _, port = args.worker.rpartition(":")
+        worker_main(host, int(port), args.interval)
+        return 0
+
+    api = None
+    base_url = args.base_url
+    if args.local:
+        from mocks.restful_booker import RestfulBookerServer
+        api = RestfulBookerServer().start()
+        base_url = api.url
+    settings = defaults._replace(base_url=base_url, duration_sec=args.duration_sec,
+                                 ramp_users=args.ramp_users, target_rps=args.target_rps)
+    try:
+        coordinator = asyncio.run(run_distributed(
+            settings, processes=args.processes, expect=args.expect, listen=args.listen, profile=args.profile,
+            connections=args.connections, seed=args.seed, interval=args.interval,
+            feeder=args.feeder and os.path.abspath(args.feeder), feeder_strategy=args.feeder_strategy,
+            progress=lambda line: print(line, file=sys.stderr),
+        ))
+    finally:
+        if api is not None:
+            api.stop()
+    assertions = evaluate_assertions(coordinator.stats, settings.min_success_pct, settings.p95_max_ms)
+    print(f"workers: {len(coordinator.nodes)} "
+          f"({', '.join(f'{node}: {coordinator.node_counts[node]}' for node in coordinator.nodes)})")
+    if coordinator.lost:
+        print(f"lost workers (partial data): {', '.join(coordinator.lost)}")
+    print(report(coordinator.stats, assertions))
+    if args.history:
+        with HistoryDB(args.history) as db:
+            record_crud_stats(db, coordinator.stats, current_environment("local" if args.local else base_url),
+                              label=f"crud x{len(coordinator.nodes)}")
+    return 0 if all(a.ok for a in assertions) and not coordinator.lost else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
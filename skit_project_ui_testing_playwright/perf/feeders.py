@@ -0,0 +1,266 @@
+# perf/feeders.py
+"""Feeders (по угледа на Gatling) – тест податоци за booking/contact, заеднички за
+UI тестовите и load сценаријата: lazy извори, queue/circular/random стратегии,
+thread-safe `next()` и `shard=(i, n)` без дупликати меѓу workers.
+"""
+
+import csv
+import itertools
+import json
+import mmap
+import os
+import random
+import threading
+from array import array
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+STRATEGIES = ("queue", "circular", "random")
+
+Record = Dict[str, object]
+
+
+class FeederExhausted(RuntimeError):
+    """Queue feeder-от нема повеќе записи (Gatling: „Feeder is now empty“)."""
+
+
+def worker_shard() -> Tuple[int, int]:
+    """(индекс, број) на тековниот pytest-xdist worker; (0, 1) без xdist."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1") or 1)
+    if worker.startswith("gw"):
+        return int(worker[2:]), count
+    return 0, 1
+
+
+# ============================== RECORD BUILDERS ==============================
+
+def booking_record(rnd: random.Random, index: int) -> Record:
+    """Исти полиња и опсези како Java bookingFeeder во RestfulBookerCrudSimulation."""
+    start = date.today() + timedelta(days=rnd.randint(1, 9))
+    end = start + timedelta(days=rnd.randint(1, 4))
+    return {
+        "firstname": f"User{rnd.randrange(100000)}",
+        "lastname": f"Perf{rnd.randrange(100000)}",
+        "totalprice": rnd.randint(50, 499),
+        "depositpaid": rnd.random() < 0.5,
+        "checkin": start.isoformat(),
+        "checkout": end.isoformat(),
+        "needs": "Breakfast" if rnd.random() < 0.5 else "Late checkout",
+    }
+
+
+_FIRST_NAMES = ("Мила", "Ана", "Марко", "Петар", "Елена", "Стефан", "Ива", "Никола")
+_LAST_NAMES = ("Тестова", "Петровска", "Јовановски", "Николова", "Стојанов", "Димитрова")
+
+
+def contact_record(rnd: random.Random, index: int) -> Record:
+    """Валиден contact payload (ги поминува правилата на backend-от – види mocks/shady_meadows.py)."""
+    first, last = rnd.choice(_FIRST_NAMES), rnd.choice(_LAST_NAMES)
+    return {
+        "name": f"{first} {last}",
+        "email": f"tester{index}.{rnd.randrange(10 ** 6)}@example.com",
+        "phone": f"+3897{rnd.randrange(10 ** 7):07d}",
+        "subject": f"Прашање за сместување #{index}",
+        "description": (
+            "Ова е тест порака со доволна должина за да помине валидаторот. "
+            f"Референца {rnd.randrange(10 ** 9):09d}."
+        ),
+    }
+
+
+def guest_record(rnd: random.Random, index: int) -> Record:
+    """Гостин за формата на /reservation (firstname 3–18, lastname 3–30 знаци)."""
+    return {
+        "firstname": rnd.choice(_FIRST_NAMES) + ("" if index < 1 else f"{index % 1000}"),
+        "lastname": rnd.choice(_LAST_NAMES),
+        "email": f"guest{index}.{rnd.randrange(10 ** 6)}@example.com",
+        "phone": f"+3897{rnd.randrange(10 ** 7):07d}",
+    }
+
+
+# ================================== SOURCES ==================================
+
+class GeneratedSource:
+    """Бесконечен извор: `build(rnd, index)` за index = 0, 1, 2, ..."""
+
+    def __init__(self, build: Callable[[random.Random, int], Record], seed: Optional[int] = None):
+        self.build = build
+        self.seed = seed
+
+    def records(self) -> Iterator[Record]:
+        rnd = random.Random(self.seed)
+        for index in itertools.count():
+            yield self.build(rnd, index)
+
+
+class CsvSource:
+    """CSV со header; вредностите остануваат стрингови (како Gatling csv feeder)."""
+
+    def __init__(self, path, **reader_options):
+        self.path = Path(path)
+        self.reader_options = reader_options
+
+    def records(self) -> Iterator[Record]:
+        with self.path.open(newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f, **self.reader_options)
+
+
+class JsonlSource:
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def records(self) -> Iterator[Record]:
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class MmapDataset:
+    """
+    JSONL фајл + `<фајл>.idx` (uint64 offset по запис), двата преку mmap.
+    `len()` и `dataset[i]` се O(1); во меморија е само тоа што OS го кешира.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        index_path = self.path.with_name(self.path.name + ".idx")
+        if self.index_is_stale(self.path):
+            self.build_index(self.path)
+        self._data_file = self.path.open("rb")
+        self._index_file = index_path.open("rb")
+        self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = memoryview(self._index).cast("Q")
+
+    @staticmethod
+    def index_is_stale(path) -> bool:
+        """
+        `.idx` недостасува, е постар од JSONL-от (регенериран/изменет) или
+        последниот offset е надвор од фајлот – старите offsets би сечеле запис
+        на половина.
+        """
+        path = Path(path)
+        index_path = path.with_name(path.name + ".idx")
+        if not index_path.exists():
+            return True
+        data, index = path.stat(), index_path.stat()
+        if index.st_mtime_ns < data.st_mtime_ns or index.st_size % 8:
+            return True
+        if not index.st_size:
+            return data.st_size > 0
+        with index_path.open("rb") as f:
+            f.seek(-8, os.SEEK_END)
+            last = array("Q", f.read(8))[0]
+        return last >= data.st_size
+
+    @staticmethod
+    def build_index(path) -> int:
+        """Запишува `.idx` за постоечки JSONL; враќа број на записи."""
+        path = Path(path)
+        offsets = array("Q")
+        with path.open("rb") as f:
+            position = 0
+            for line in f:
+                if line.strip():
+                    offsets.append(position)
+                position += len(line)
+        with path.with_name(path.name + ".idx").open("wb") as f:
+            offsets.tofile(f)
+        return len(offsets)
+
+    @classmethod
+    def build(cls, path, records: Iterable[Record], count: Optional[int] = None) -> "MmapDataset":
+        """Генерира dataset (на пр. од GeneratedSource(...).records()) без да го држи во меморија."""
+        path = Path(path)
+        with path.open("w", encoding="utf-8") as f:
+            for record in itertools.islice(records, count):
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        cls.build_index(path)
+        return cls(path)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, i: int) -> Record:
+        start = self._offsets[i]
+        end = self._data.find(b"\n", start)
+        return json.loads(self._data[start:end if end >= 0 else len(self._data)])
+
+    def records(self) -> Iterator[Record]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def close(self) -> None:
+        self._offsets.release()
+        self._index.close()
+        self._data.close()
+        self._index_file.close()
+        self._data_file.close()
+
+
+def open_source(path):
+    """По екстензија: .csv → CsvSource, .jsonl → MmapDataset (индексиран, за random)."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return CsvSource(path)
+    if suffix in (".jsonl", ".ndjson"):
+        return MmapDataset(path)
+    raise ValueError(f"unsupported feeder file {path!r} (expected .csv or .jsonl)")
+
+
+# ================================== FEEDER ===================================
+
+class Feeder:
+    """
+    `next(feeder)` → следниот запис по `strategy`. Безбедно за повеќе нишки /
+    корутини; со `shard` – и за повеќе процеси над ист извор.
+    """
+
+    def __init__(self, source, strategy: str = "queue", shard: Tuple[int, int] = (0, 1),
+                 seed: Optional[int] = None):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}, got {strategy!r}")
+        if strategy == "random" and not hasattr(source, "__getitem__") and not isinstance(source, GeneratedSource):
+            raise ValueError("random strategy needs an indexed source (MmapDataset) or a generator")
+        self.source = source
+        self.strategy = strategy
+        self.shard = shard
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+        self._iterator: Optional[Iterator[Record]] = None
+
+    def _sharded(self) -> Iterator[Record]:
+        index, workers = self.shard
+        return itertools.islice(self.source.records(), index, None, workers)
+
+    def __iter__(self) -> "Feeder":
+        return self
+
+    def __next__(self) -> Record:
+        with self._lock:
+            if self.strategy == "random" and not isinstance(self.source, GeneratedSource):
+                index, workers = self.shard
+                size = len(range(index, len(self.source), workers))
+                if not size:
+                    raise FeederExhausted(f"no records for shard {self.shard}")
+                return self.source[index + workers * self._rnd.randrange(size)]
+            if self._iterator is None:
+                self._iterator = self._sharded()
+            try:
+                return next(self._iterator)
+            except StopIteration:
+                if self.strategy == "queue":
+                    raise FeederExhausted(f"feeder over {self.source!r} is empty") from None
+                self._iterator = self._sharded()
+                try:
+                    return next(self._iterator)
+                except StopIteration:
+                    raise FeederExhausted(f"no records for shard {self.shard}") from None
+
+    next = __next__
+
+    def take(self, count: int) -> list:
+        return [next(self) for _ in range(count)]
@@ -0,0 +1,304 @@
+# perf/gatling_log.py
+"""Gatling simulation.log (tab-separated, Gatling 2.x – 3.10) → NumPy колони,
+перцентили и throughput по прозорци; `build_store()` / `RequestLog.load()` за
+логови поголеми од RAM (np.memmap). Бинарниот лог од 3.11+ → UnsupportedLogFormat.
+
+    python -m perf.gatling_log ../restfulbooker-performance-testing/target/gatling
+    python -m perf.gatling_log run/simulation.log --store /tmp/run1 --window-ms 5000
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (50, 75, 95, 99)
+CHUNK_ROWS = 1_000_000
+
+# колона → dtype (start: epoch ms, latency: ms, name: индекс во `names`)
+COLUMNS = {"start": np.int64, "latency": np.int32, "name": np.int32, "ok": np.bool_}
+
+
+class UnsupportedLogFormat(ValueError):
+    """Фајлот не е текстуален Gatling simulation.log."""
+
+
+class RunInfo(NamedTuple):
+    simulation: str = ""
+    run_id: str = ""
+    start_ms: int = 0
+    description: str = ""
+    version: str = ""
+
+
+class Chunk(NamedTuple):
+    start: np.ndarray
+    latency: np.ndarray
+    name: np.ndarray
+    ok: np.ndarray
+
+
+# ================================= PARSER ====================================
+
+class LogParser:
+    """Стримува еден simulation.log; после `chunks()` се пополнети run/users/errors/names."""
+
+    def __init__(self, path, chunk_rows: int = CHUNK_ROWS):
+        self.path = Path(path)
+        self.chunk_rows = chunk_rows
+        self.run = RunInfo()
+        self.users = 0
+        self.errors: Dict[str, int] = {}
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def _check_format(self, head: bytes) -> None:
+        if head and (b"\0" in head or not head.split(b"\t", 1)[0].isupper()):
+            raise UnsupportedLogFormat(
+                f"{self.path} is not a tab-separated simulation.log (binary log from Gatling 3.11+?)")
+
+    def _code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def chunks(self) -> Iterator[Chunk]:
+        starts: List[int] = []
+        latencies: List[int] = []
+        codes: List[int] = []
+        oks: List[bool] = []
+
+        def _flush() -> Chunk:
+            chunk = Chunk(np.array(starts, dtype=COLUMNS["start"]), np.array(latencies, dtype=COLUMNS["latency"]),
+                          np.array(codes, dtype=COLUMNS["name"]), np.array(oks, dtype=COLUMNS["ok"]))
+            for column in (starts, latencies, codes, oks):
+                column.clear()
+            return chunk
+
+        with self.path.open("rb") as f:
+            self._check_format(f.read(4096))
+            f.seek(0)
+            for raw in f:
+                fields = raw.rstrip(b"\r\n").decode("utf-8", "replace").split("\t")
+                kind = fields[0]
+                if kind == "REQUEST":
+                    # 3.x: REQUEST groups name start end status msg; 2.x има scenario и userId пред groups
+                    status = 5 if len(fields) > 5 and fields[5] in ("OK", "KO") else 7
+                    try:
+                        start, end = int(fields[status - 2]), int(fields[status - 1])
+                    except (IndexError, ValueError):
+                        continue            # скратен последен ред (run што уште пишува)
+                    starts.append(start)
+                    latencies.append(end - start)
+                    codes.append(self._code(fields[status - 3]))
+                    oks.append(fields[status] == "OK")
+                    if len(starts) >= self.chunk_rows:
+                        yield _flush()
+                elif kind == "USER":
+                    self.users += "START" in fields
+                elif kind == "ERROR" and len(fields) > 1:
+                    self.errors[fields[1]] = self.errors.get(fields[1], 0) + 1
+                elif kind == "RUN" and len(fields) >= 6:
+                    self.run = RunInfo(fields[1], fields[2], int(fields[3]), fields[4].strip(), fields[5])
+        if starts:
+            yield _flush()
+
+
+# ============================== COLUMNAR LOG =================================
+
+class RequestLog:
+    """Колоните за сите барања од еден run (во меморија или memmap од store)."""
+
+    def __init__(self, start: np.ndarray, latency: np.ndarray, name: np.ndarray, ok: np.ndarray,
+                 names: Sequence[str], run: RunInfo = RunInfo(), users: int = 0,
+                 errors: Optional[Dict[str, int]] = None):
+        self.start = start
+        self.latency = latency
+        self.name = name
+        self.ok = ok
+        self.names = list(names)
+        self.run = run
+        self.users = users
+        self.errors = errors or {}
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @classmethod
+    def load(cls, store_dir) -> "RequestLog":
+        """Отвора store од `build_store()` со np.memmap (само за читање)."""
+        store = Path(store_dir)
+        meta = json.loads((store / "meta.json").read_text(encoding="utf-8"))
+        count = meta["count"]
+        columns = {
+            column: np.memmap(store / f"{column}.bin", dtype=dtype, mode="r", shape=(count,))
+            if count else np.zeros(0, dtype=dtype)
+            for column, dtype in COLUMNS.items()
+        }
+        return cls(names=meta["names"], run=RunInfo(*meta["run"]), users=meta["users"],
+                   errors=meta["errors"], **columns)
+
+    # ------------------------------- queries --------------------------------
+
+    def _select(self, status: str) -> Tuple[np.ndarray, np.ndarray]:
+        if status == "all":
+            return self.latency, self.name
+        mask = self.ok if status == "ok" else ~self.ok
+        return self.latency[mask], self.name[mask]
+
+    def counts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(вкупно, KO) по барање, индексирано како `names`."""
+        total = np.bincount(self.name, minlength=len(self.names))
+        ko = np.bincount(self.name[~self.ok], minlength=len(self.names))
+        return total, ko
+
+    def maxima(self) -> np.ndarray:
+        """Најголема латенција по барање (ms), индексирано како `names`."""
+        peaks = np.zeros(len(self.names), dtype=np.int64)
+        np.maximum.at(peaks, self.name, self.latency)
+        return peaks
+
+    def percentiles(self, pcts: Sequence[float] = DEFAULT_PERCENTILES, status: str = "all") -> Dict[str, np.ndarray]:
+        """
+        {име: [p за секој pct]} + „Global“, nearest-rank, во ms. `status`:
+        all (Gatling „Total“), ok или ko. Празно барање → нули.
+        """
+        latency, name = self._select(status)
+        pcts = np.asarray(pcts, dtype=float)
+        order = np.lexsort((latency, name))
+        by_name = latency[order]
+        bounds = np.searchsorted(name[order], np.arange(len(self.names) + 1))
+        result = dict(zip(self.names, _nearest_rank(by_name, bounds, pcts)))
+        result["Global"] = _nearest_rank(np.sort(latency), np.array([0, len(latency)]), pcts)[0]
+        return result
+
+    def throughput(self, window_ms: int = 1000, name: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (почеток на прозорец во epoch ms, барања, KO) по прозорци од `window_ms`,
+        по моментот на праќање. Празните прозорци остануваат (нули).
+        """
+        start, ok = self.start, self.ok
+        if name is not None:
+            mask = self.name == self.names.index(name)
+            start, ok = start[mask], ok[mask]
+        if not len(start):
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+        t0 = int(start.min()) // window_ms * window_ms
+        bins = (start - t0) // window_ms
+        total = np.bincount(bins)
+        ko = np.bincount(bins, weights=~ok, minlength=len(total)).astype(np.int64)
+        return t0 + window_ms * np.arange(len(total), dtype=np.int64), total, ko
+
+    def report(self, pcts: Sequence[float] = DEFAULT_PERCENTILES, window_ms: int = 1000) -> str:
+        total, ko = self.counts()
+        table = self.percentiles(pcts)
+        header = f"{'request':<32}{'count':>8}{'ko':>7}" + "".join(f"{'p' + format(p, 'g'):>9}" for p in pcts) + f"{'max':>9}"
+        lines = []
+        if self.run.simulation:
+            lines.append(f"{self.run.simulation} ({self.run.run_id}, Gatling {self.run.version}), users={self.users}")
+        lines.append(header)
+        for code, (name, peak) in enumerate(zip(self.names, self.maxima())):
+            lines.append(f"{name:<32}{total[code]:>8}{ko[code]:>7}"
+                         + "".join(f"{v:>9.0f}" for v in table[name]) + f"{peak:>9}")
+        lines.append(f"{'Global':<32}{len(self):>8}{int(ko.sum()):>7}"
+                     + "".join(f"{v:>9.0f}" for v in table["Global"])
+                     + f"{int(self.latency.max()) if len(self) else 0:>9}")
+        _, requests, _ = self.throughput(window_ms)
+        if len(requests):
+            per_sec = requests * (1000 / window_ms)
+            lines.append(f"throughput ({window_ms} ms windows): mean={per_sec.mean():.1f}/s "
+                         f"peak={per_sec.max():.1f}/s")
+        lines += [f"error: {message} ({count})" for message, count in sorted(self.errors.items())]
+        return "\n".join(lines)
+
+
+def _nearest_rank(sorted_values: np.ndarray, bounds: np.ndarray, pcts: np.ndarray) -> np.ndarray:
+    """Групи [bounds[i], bounds[i+1]) од сортирана низа → (групи × перцентили)."""
+    counts = np.diff(bounds)
+    ranks = np.maximum(1, np.ceil(pcts[None, :] / 100 * counts[:, None])).astype(np.int64)
+    index = np.minimum(bounds[:-1, None] + ranks - 1, max(len(sorted_values) - 1, 0))
+    if not len(sorted_values):
+        return np.zeros((len(counts), len(pcts)))
+    return np.where(counts[:, None] > 0, sorted_values[index], 0).astype(float)
+
+
+# ============================ PARSE / STORE ==================================
+
+def parse(path, chunk_rows: int = CHUNK_ROWS) -> RequestLog:
+    """Целиот лог во меморија (само колоните, не текстот)."""
+    parser = LogParser(path, chunk_rows)
+    chunks = list(parser.chunks())
+    columns = {
+        column: np.concatenate([getattr(c, column) for c in chunks]) if chunks else np.zeros(0, dtype=dtype)
+        for column, dtype in COLUMNS.items()
+    }
+    return RequestLog(names=parser.names, run=parser.run, users=parser.users, errors=parser.errors, **columns)
+
+
+def build_store(path, store_dir, chunk_rows: int = CHUNK_ROWS) -> RequestLog:
+    """Лог → колонски store на диск, chunk по chunk; враќа memmap RequestLog."""
+    store = Path(store_dir)
+    store.mkdir(parents=True, exist_ok=True)
+    (store / "meta.json").unlink(missing_ok=True)    # нецелосен store нема meta
+    parser = LogParser(path, chunk_rows)
+    count = 0
+    files = {column: (store / f"{column}.bin").open("wb") for column in COLUMNS}
+    try:
+        for chunk in parser.chunks():
+            for column, f in files.items():
+                getattr(chunk, column).tofile(f)
+            count += len(chunk.start)
+    finally:
+        for f in files.values():
+            f.close()
+    meta = {"count": count, "names": parser.names, "run": list(parser.run), "users": parser.users,
+            "errors": parser.errors, "source": str(Path(path).resolve())}
+    (store / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    return RequestLog.load(store)
+
+
+def find_latest_log(root) -> Path:
+    """`root` е simulation.log или директориум (на пр. target/gatling) → најновиот лог."""
+    root = Path(root)
+    if root.is_file():
+        return root
+    logs = sorted(root.rglob("simulation.log"), key=lambda p: p.stat().st_mtime)
+    if not logs:
+        raise FileNotFoundError(f"no simulation.log under {root}")
+    return logs[-1]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Analyse a Gatling simulation.log with NumPy")
+    parser.add_argument("log", nargs="?", help="simulation.log or a directory with Gatling runs")
+    parser.add_argument("--store", help="columnar store directory (written from LOG, or read if LOG is omitted)")
+    parser.add_argument("--window-ms", type=int, default=1000, help="throughput window")
+    parser.add_argument("--percentile", type=float, action="append", dest="percentiles",
+                        help=f"repeatable; default {DEFAULT_PERCENTILES}")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    if args.log is None and args.store is None:
+        parser.error("give a simulation.log (or directory) and/or --store")
+    try:
+        if args.log is None:
+            log = RequestLog.load(args.store)
+        elif args.store:
+            log = build_store(find_latest_log(args.log), args.store, args.chunk_rows)
+        else:
+            log = parse(find_latest_log(args.log), args.chunk_rows)
+    except (FileNotFoundError, UnsupportedLogFormat) as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(log.report(args.percentiles or DEFAULT_PERCENTILES, args.window_ms))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
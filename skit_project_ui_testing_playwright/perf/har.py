@@ -0,0 +1,186 @@
+# perf/har.py
+"""HAR record/replay за UI тестовите: live демото се снима еднаш (HAR по тест +
+тела по sha1 во `--har-dir`), а потоа `HarReplayer` ги служи барањата преку
+`context.route` – по (метод, URL без порта и датуми), по редослед, со снимениот
+booking слот. Неснимено барање: strict → abort, lenient → мрежа.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import re
+import zlib
+from collections import defaultdict
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from perf.routing import size_key
+from perf.slots import Slot
+
+MODES = ("record", "replay")
+MATCHING = ("strict", "lenient")
+DEFAULT_DIR = Path(".perf") / "har"
+
+# query параметри чија вредност не е дел од replay клучот
+DATE_PARAMS = ("checkin", "checkout")
+
+# телото е веќе декодирано – овие headers би го излажале browser-от
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def har_name(nodeid: str) -> str:
+    """tests/test_x.py::test_y[a-b] → tests_test_x.py__test_y_a-b_ (име на фајл)."""
+    return re.sub(r"[^\w.-]", "_", nodeid.replace("::", "__"))
+
+
+def replay_key(method: str, url: str, site_host: str) -> tuple:
+    """(метод, size_key) со checkin/checkout без вредност – за хостот на сајтот."""
+    key = size_key(url, site_host)
+    if urlparse(url).netloc == site_host and "?" in key:
+        path, query = key.split("?", 1)
+        params = [(name, "" if name in DATE_PARAMS else value)
+                  for name, value in parse_qsl(query, keep_blank_values=True)]
+        key = f"{path}?{urlencode(params)}"
+    return method, key
+
+
+class HarArchive:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.meta_path = self.root / "meta.json"
+        try:
+            self.meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.meta = {"base_url": None, "tests": {}}
+        self.meta.setdefault("slots", {})
+
+    def _har_path(self, slug: str) -> Path:
+        return self.root / "hars" / f"{slug}.har.gz"
+
+    def _content_path(self, sha1: str) -> Path:
+        return self.root / "content" / sha1[:2] / f"{sha1}.gz"
+
+    # ------------------------------- record ---------------------------------
+
+    def put_content(self, data: bytes) -> str:
+        sha1 = hashlib.sha1(data).hexdigest()
+        path = self._content_path(sha1)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{id(data)}.tmp")
+            tmp.write_bytes(zlib.compress(data, 6))
+            tmp.replace(path)                     # паралелни workers – atomic
+        return sha1
+
+    def ingest(self, slug: str, har_paths: List[Path]) -> int:
+        """Playwright HAR(s) на еден тест → hars/<slug>.har.gz + content/. Враќа број на записи."""
+        entries = []
+        for har_path in har_paths:
+            if not Path(har_path).exists():
+                continue                          # context без ниту едно барање
+            log = json.loads(Path(har_path).read_text(encoding="utf-8"))["log"]
+            for entry in log["entries"]:
+                content = entry["response"].get("content", {})
+                attached = content.pop("_file", None)
+                if attached:
+                    content["_sha1"] = self.put_content((Path(har_path).parent / attached).read_bytes())
+                entries.append(entry)
+        path = self._har_path(slug)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as fh:
+            json.dump({"log": {"version": "1.2", "entries": entries}}, fh)
+        return len(entries)
+
+    def record_test(self, slug: str, duration: float) -> None:
+        self.meta["tests"][slug] = round(duration, 3)
+
+    def pin_slot(self, slug: str, slot: Slot) -> None:
+        self.meta["slots"][slug] = [slot.room_id, *slot.iso()]
+
+    def pinned_slot(self, slug: str) -> Optional[Slot]:
+        """Booking слотот со кој тестот е снимен (None – тестот не резервира)."""
+        pinned = self.meta["slots"].get(slug)
+        if not pinned:
+            return None
+        room_id, checkin, checkout = pinned
+        return Slot(int(room_id), date.fromisoformat(checkin), date.fromisoformat(checkout))
+
+    def save_meta(self, base_url: str) -> None:
+        # workers снимаат различни тестови → спој со она што е веќе на диск
+        on_disk = HarArchive(self.root).meta
+        self.meta["tests"] = {**on_disk.get("tests", {}), **self.meta["tests"]}
+        self.meta["slots"] = {**on_disk["slots"], **self.meta["slots"]}
+        self.meta["base_url"] = base_url
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.meta_path.write_text(json.dumps(self.meta, indent=1, sort_keys=True), encoding="utf-8")
+
+    # ------------------------------- replay ---------------------------------
+
+    def has(self, slug: str) -> bool:
+        return self._har_path(slug).exists()
+
+    def entries(self, slug: str) -> List[Dict]:
+        with gzip.open(self._har_path(slug), "rt", encoding="utf-8") as fh:
+            return json.load(fh)["log"]["entries"]
+
+    def body(self, content: Dict) -> bytes:
+        if "_sha1" in content:
+            return zlib.decompress(self._content_path(content["_sha1"]).read_bytes())
+        text = content.get("text", "")
+        if content.get("encoding") == "base64":
+            return base64.b64decode(text)
+        return text.encode("utf-8")
+
+    def size(self) -> Dict[str, int]:
+        """Bytes на диск: hars/ и content/ (по компресија)."""
+        return {part: sum(f.stat().st_size for f in (self.root / part).rglob("*") if f.is_file())
+                for part in ("hars", "content") if (self.root / part).exists()}
+
+
+class HarReplayer:
+    def __init__(self, archive: HarArchive, entries: List[Dict], base_url: str, strict: bool = True):
+        self.archive = archive
+        self.strict = strict
+        self.site_host = urlparse(base_url).netloc
+        recorded_host = urlparse(archive.meta.get("base_url") or base_url).netloc
+        self.pending: Dict[tuple, List[Dict]] = defaultdict(list)   # уште неискористени, по редослед
+        self.last: Dict[tuple, Dict] = {}
+        for entry in entries:
+            request = entry["request"]
+            self.pending[replay_key(request["method"], request["url"], recorded_host)].append(entry)
+        self.served = 0
+        self.unmatched: List[str] = []
+
+    def match(self, method: str, url: str, post_data: Optional[str]) -> Optional[Dict]:
+        key = replay_key(method, url, self.site_host)
+        pending = self.pending.get(key)
+        if not pending:
+            return self.last.get(key)
+        entry = next((e for e in pending if e["request"].get("postData", {}).get("text") == post_data), pending[0])
+        pending.remove(entry)
+        self.last[key] = entry
+        return entry
+
+    def handle(self, route) -> None:
+        request = route.request
+        entry = self.match(request.method, request.url, request.post_data)
+        if entry is None:
+            self.unmatched.append(f"{request.method} {request.url}")
+            if self.strict:
+                route.abort("internetdisconnected")
+            else:
+                route.fallback()
+            return
+        response = entry["response"]
+        headers = {h["name"]: h["value"] for h in response.get("headers", [])
+                   if h["name"].lower() not in _DROP_HEADERS and not h["name"].startswith(":")}
+        self.served += 1
+        route.fulfill(status=response["status"], headers=headers, body=self.archive.body(response.get("content", {})))
+
+    def attach(self, context):
+        context.route("**/*", self.handle)
+        return context
+
@@ -0,0 +1,148 @@
+# perf/histogram.py
+"""Латенција хистограм во стилот на HdrHistogram: log-bucket-и во микросекунди
+(≤ 1% грешка со 2 цифри), фиксна меморија, `merge()` меѓу workers и
+`encode()`/`decode()` за праќање меѓу процеси.
+"""
+
+import base64
+import json
+import math
+import zlib
+from array import array
+from typing import Iterator, Optional, Tuple
+
+
+class LatencyHistogram:
+    def __init__(self, highest_ms: float = 3_600_000, significant_digits: int = 2):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.highest_ms = highest_ms
+        self.significant_digits = significant_digits
+
+        self._highest = int(highest_ms * 1000)
+        sub_bucket_count_magnitude = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._half_magnitude = sub_bucket_count_magnitude - 1
+        self._half_count = 1 << self._half_magnitude
+        self._sub_bucket_mask = (1 << sub_bucket_count_magnitude) - 1
+
+        buckets = 1
+        while (1 << sub_bucket_count_magnitude) << (buckets - 1) <= self._highest:
+            buckets += 1
+        self.counts = array("q", bytes(8 * (buckets + 1) * self._half_count))
+
+        self.total_count = 0
+        self._sum = 0
+        self._min: Optional[int] = None
+        self._max = 0
+
+    # ------------------------------ index math ------------------------------
+
+    def _index(self, value: int) -> int:
+        bucket = (value | self._sub_bucket_mask).bit_length() - (self._half_magnitude + 1)
+        sub_bucket = value >> bucket
+        return ((bucket + 1) << self._half_magnitude) + sub_bucket - self._half_count
+
+    def _highest_equivalent(self, index: int) -> int:
+        """Најголемата вредност (µs) што паѓа во бројачот `index`."""
+        bucket = (index >> self._half_magnitude) - 1
+        sub_bucket = (index & (self._half_count - 1)) + self._half_count
+        if bucket < 0:
+            bucket, sub_bucket = 0, sub_bucket - self._half_count
+        return (sub_bucket << bucket) + (1 << bucket) - 1
+
+    # ------------------------------- record ---------------------------------
+
+    def record(self, value_ms: float, count: int = 1) -> None:
+        value = min(max(int(value_ms * 1000), 0), self._highest)
+        self.counts[self._index(value)] += count
+        self.total_count += count
+        self._sum += value * count
+        self._min = value if self._min is None else min(self._min, value)
+        self._max = max(self._max, value)
+
+    def record_corrected(self, value_ms: float, expected_interval_ms: float) -> None:
+        """
+        Снима `value_ms` и, ако е подолга од `expected_interval_ms`, ги
+        дополнува барањата што требаше да тргнат во меѓувреме
+        (value - interval, value - 2·interval, ... > interval).
+        """
+        self.record(value_ms)
+        if expected_interval_ms <= 0:
+            return
+        missing = value_ms - expected_interval_ms
+        while missing >= expected_interval_ms:
+            self.record(missing)
+            missing -= expected_interval_ms
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        if len(other.counts) != len(self.counts) or other.significant_digits != self.significant_digits:
+            raise ValueError("cannot merge histograms with different range/precision")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total_count += other.total_count
+        self._sum += other._sum
+        if other._min is not None:
+            self._min = other._min if self._min is None else min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        return self
+
+    def reset(self) -> None:
+        for index in range(len(self.counts)):
+            self.counts[index] = 0
+        self.total_count = self._sum = self._max = 0
+        self._min = None
+
+    # ------------------------------- queries --------------------------------
+
+    @property
+    def min(self) -> float:
+        return (self._min or 0) / 1000
+
+    @property
+    def max(self) -> float:
+        return self._max / 1000
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.total_count / 1000 if self.total_count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank перцентил во ms (исто како perf.step_timing.percentile)."""
+        if not self.total_count:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.total_count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self._max) / 1000
+        return self.max
+
+    def buckets(self) -> Iterator[Tuple[float, int]]:
+        """(горна граница во ms, број) за непразните бројачи – за извештаи/графици."""
+        for index, count in enumerate(self.counts):
+            if count:
+                yield self._highest_equivalent(index) / 1000, count
+
+    # ---------------------------- serialization -----------------------------
+
+    def encode(self) -> str:
+        """Компактен string: непразните (index, count) парови + min/max/sum, zlib + base64."""
+        sparse = [v for index, count in enumerate(self.counts) if count for v in (index, count)]
+        payload = {"h": self.highest_ms, "d": self.significant_digits, "c": sparse,
+                   "n": self.total_count, "s": self._sum, "lo": self._min, "hi": self._max}
+        return base64.b64encode(zlib.compress(json.dumps(payload, separators=(",", ":")).encode())).decode()
+
+    @classmethod
+    def decode(cls, encoded: str) -> "LatencyHistogram":
+        payload = json.loads(zlib.decompress(base64.b64decode(encoded)))
+        histogram = cls(highest_ms=payload["h"], significant_digits=payload["d"])
+        sparse = payload["c"]
+        for index, count in zip(sparse[::2], sparse[1::2]):
+            histogram.counts[index] = count
+        histogram.total_count = payload["n"]
+        histogram._sum = payload["s"]
+        histogram._min = payload["lo"]
+        histogram._max = payload["hi"]
+        return histogram
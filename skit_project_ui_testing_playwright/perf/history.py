@@ -0,0 +1,380 @@
+# perf/history.py
+"""Историја на перформанси низ runs (SQLite: траења на тестови, MainPage чекори,
+перцентили по барање) и детекција на регресии – change point + Mann-Whitney U
+низ runs и робусен z-score за последниот run.
+
+    python -m perf.history runs
+    python -m perf.history check --kind step           # излезен код 1 ако има регресии
+"""
+
+import argparse
+import math
+import os
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_PATH = Path(".perf") / "history.sqlite"
+KINDS = ("test", "step", "request")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    source      TEXT NOT NULL,          -- pytest / crud_load / gatling
+    started     REAL NOT NULL,          -- epoch секунди
+    commit_sha  TEXT NOT NULL DEFAULT '',
+    branch      TEXT NOT NULL DEFAULT '',
+    environment TEXT NOT NULL DEFAULT '',
+    host        TEXT NOT NULL DEFAULT '',
+    label       TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    kind   TEXT NOT NULL,
+    name   TEXT NOT NULL,
+    stat   TEXT NOT NULL,
+    value  REAL NOT NULL,
+    PRIMARY KEY (run_id, kind, name, stat)
+);
+CREATE INDEX IF NOT EXISTS samples_series ON samples (kind, name, stat);
+"""
+
+
+class Run(NamedTuple):
+    id: int
+    source: str
+    started: float
+    commit: str
+    branch: str
+    environment: str
+    host: str
+    label: str
+
+
+class Point(NamedTuple):
+    run_id: int
+    started: float
+    commit: str
+    value: float
+
+
+class Regression(NamedTuple):
+    kind: str
+    name: str
+    stat: str
+    before: float          # медијана пред промената
+    after: float           # медијана после
+    p_value: float
+    since_run: int         # првиот run по промената
+    since_commit: str
+    method: str            # "change-point" или "latest"
+
+    @property
+    def change(self) -> float:
+        return self.after / self.before - 1 if self.before else math.inf
+
+
+# ================================ TAGGING ====================================
+
+def _git(*args: str) -> str:
+    try:
+        out = subprocess.run(["git", *args], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return out.stdout.strip() if out.returncode == 0 else ""
+
+
+def current_commit() -> str:
+    """CI променливите имаат предност (shallow checkout, detached HEAD)."""
+    return os.environ.get("GIT_COMMIT") or os.environ.get("GITHUB_SHA", "")[:12] or _git("rev-parse", "--short=12", "HEAD")
+
+
+def current_branch() -> str:
+    return os.environ.get("GIT_BRANCH") or os.environ.get("GITHUB_REF_NAME") or _git("rev-parse", "--abbrev-ref", "HEAD")
+
+
+def current_environment(default: str = "") -> str:
+    return os.environ.get("PERF_ENV", default)
+
+
+# ================================ DATABASE ===================================
+
+class HistoryDB:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # timeout → xdist/паралелни load runs чекаат наместо „database is locked“
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "HistoryDB":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -------------------------------- write ---------------------------------
+
+    def add_run(self, source: str, samples: Iterable[Tuple[str, str, str, float]],
+                environment: str = "", label: str = "", commit: Optional[str] = None,
+                branch: Optional[str] = None, started: Optional[float] = None) -> int:
+        """Еден run со сите (kind, name, stat, value) во една трансакција; враќа run id."""
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (source, started, commit_sha, branch, environment, host, label)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (source, time.time() if started is None else started,
+                 current_commit() if commit is None else commit,
+                 current_branch() if branch is None else branch,
+                 environment, socket.gethostname(), label),
+            )
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO samples (run_id, kind, name, stat, value) VALUES (?, ?, ?, ?, ?)",
+                ((run_id, kind, name, stat, float(value)) for kind, name, stat, value in samples),
+            )
+        return run_id
+
+    # -------------------------------- read ----------------------------------
+
+    def runs(self, limit: int = 20) -> List[Run]:
+        rows = self.conn.execute("SELECT * FROM runs ORDER BY started DESC, id DESC LIMIT ?", (limit,))
+        return [Run(*row) for row in rows]
+
+    def series(self, kind: str, name: str, stat: str, environment: Optional[str] = None,
+               limit: int = 50) -> List[Point]:
+        """Вредностите на една серија, од најстар кон најнов run (последните `limit`)."""
+        query = ("SELECT r.id, r.started, r.commit_sha, s.value FROM samples s JOIN runs r ON r.id = s.run_id"
+                 " WHERE s.kind = ? AND s.name = ? AND s.stat = ?")
+        params: list = [kind, name, stat]
+        if environment is not None:
+            query += " AND r.environment = ?"
+            params.append(environment)
+        query += " ORDER BY r.started DESC, r.id DESC LIMIT ?"
+        rows = self.conn.execute(query, params + [limit]).fetchall()
+        return [Point(*row) for row in reversed(rows)]
+
+    def names(self, kind: Optional[str] = None) -> List[Tuple[str, str, str]]:
+        """Сите (kind, name, stat) серии."""
+        query = "SELECT DISTINCT kind, name, stat FROM samples"
+        params: tuple = ()
+        if kind:
+            query += " WHERE kind = ?"
+            params = (kind,)
+        return [tuple(row) for row in self.conn.execute(query + " ORDER BY kind, name, stat", params)]
+
+
+# =============================== STATISTICS ==================================
+
+def mann_whitney_greater(before: Sequence[float], after: Sequence[float]) -> float:
+    """
+    Еднострано p дека `after` е стохастички поголемо од `before` (U тест,
+    нормална апроксимација со корекција за изедначени рангови и континуитет).
+    """
+    n1, n2 = len(before), len(after)
+    if not n1 or not n2:
+        return 1.0
+    values = sorted([(v, 0) for v in before] + [(v, 1) for v in after])
+    ranks = [0.0] * len(values)
+    ties = 0.0
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+    u_after = sum(r for r, (_, group) in zip(ranks, values) if group) - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u_after - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _sse(values: Sequence[float]) -> float:
+    mean = sum(values) / len(values)
+    return sum((v - mean) ** 2 for v in values)
+
+
+def detect(values: Sequence[float], min_size: int = 3, alpha: float = 0.01,
+           min_change: float = 0.10) -> Optional[Tuple[int, float, str]]:
+    """
+    (индекс на првата „лоша“ вредност, p, метод) ако серијата покажува
+    значајно забавување кон крајот, инаку None. Види заглавието на модулот.
+    """
+    n = len(values)
+    best: Optional[Tuple[int, float, str]] = None
+
+    splits = range(min_size, n - min_size + 1)
+    if len(splits):
+        k = min(splits, key=lambda k: _sse(values[:k]) + _sse(values[k:]))
+        before, after = values[:k], values[k:]
+        if statistics.median(after) >= statistics.median(before) * (1 + min_change):
+            p = mann_whitney_greater(before, after)
+            if p < alpha:
+                best = (k, p, "change-point")
+
+    if best is None and n > min_size:
+        history, latest = values[:-1], values[-1]
+        center = statistics.median(history)
+        mad = statistics.median(abs(v - center) for v in history) * 1.4826
+        if latest >= center * (1 + min_change):
+            z = (latest - center) / max(mad, abs(center) * 1e-3, 1e-12)
+            p = 0.5 * math.erfc(z / math.sqrt(2))
+            if p < alpha:
+                best = (n - 1, p, "latest")
+    return best
+
+
+def regressions(db: HistoryDB, kind: Optional[str] = None, environment: Optional[str] = None,
+                window: int = 20, stats: Sequence[str] = ("duration", "p95"), min_size: int = 3,
+                alpha: float = 0.01, min_change: float = 0.10) -> List[Regression]:
+    """Ги проверува сите серии (последните `window` runs) од даден вид; најлошите прво."""
+    found = []
+    for series_kind, name, stat in db.names(kind):
+        if stat not in stats:
+            continue
+        points = db.series(series_kind, name, stat, environment, limit=window)
+        values = [p.value for p in points]
+        hit = detect(values, min_size, alpha, min_change)
+        if hit is None:
+            continue
+        index, p_value, method = hit
+        found.append(Regression(series_kind, name, stat, statistics.median(values[:index]),
+                                statistics.median(values[index:]), p_value,
+                                points[index].run_id, points[index].commit, method))
+    return sorted(found, key=lambda r: r.change, reverse=True)
+
+
+# ================================ RECORDERS ==================================
+
+def pytest_samples(durations: Dict[str, float], step_rows: Iterable[Dict] = ()) -> List[Tuple[str, str, str, float]]:
+    """Траења по тест (секунди) + summarize() редици од step_timing."""
+    samples = [("test", nodeid, "duration", seconds) for nodeid, seconds in durations.items()]
+    for row in step_rows:
+        samples += [("step", row["step"], stat, row[stat])
+                    for stat in ("count", "p50", "p95", "p99", "max") if stat in row]
+    return samples
+
+
+def request_samples(table: Dict[str, Sequence[float]], counts: Dict[str, Tuple[int, int]],
+                    pcts: Sequence[float] = (50, 95, 99)) -> List[Tuple[str, str, str, float]]:
+    """{име: перцентили во ms} + {име: (вкупно, KO)} → редици за kind="request"."""
+    samples = []
+    for name, values in table.items():
+        samples += [("request", name, f"p{p:g}", v) for p, v in zip(pcts, values)]
+        total, ko = counts.get(name, (0, 0))
+        samples += [("request", name, "count", total), ("request", name, "ko", ko)]
+    return samples
+
+
+def record_crud_stats(db: HistoryDB, stats, environment: str = "", label: str = "crud") -> int:
+    """RequestStats од perf/crud_load.py (corrected response времиња)."""
+    names = stats.names() + [None]
+    table = {name or "Global": [stats.percentile(name, p) for p in (50, 95, 99)] for name in names}
+    counts = {name or "Global": (stats.count(name), stats.failures(name)) for name in names}
+    return db.add_run("crud_load", request_samples(table, counts), environment, label)
+
+
+def record_gatling_log(db: HistoryDB, log, environment: str = "", label: str = "") -> int:
+    """RequestLog од perf/gatling_log.py; run-от го добива времето на симулацијата."""
+    pcts = (50, 95, 99)
+    table = {name: list(values) for name, values in log.percentiles(pcts).items()}
+    total, ko = log.counts()
+    counts = {name: (int(total[i]), int(ko[i])) for i, name in enumerate(log.names)}
+    counts["Global"] = (len(log), int(ko.sum()))
+    started = log.run.start_ms / 1000 if log.run.start_ms else None
+    return db.add_run("gatling", request_samples(table, counts, pcts), environment,
+                      label or log.run.simulation, started=started)
+
+
+# ================================== CLI ======================================
+
+def format_regression(r: Regression) -> str:
+    return (f"{r.kind:<8}{r.name[:48]:<50}{r.stat:<9}{r.before:>10.3f} -> {r.after:<10.3f}"
+            f"{r.change:>+8.0%}  p={r.p_value:.1e}  since run {r.since_run} ({r.since_commit or '?'}, {r.method})")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Cross-run performance history")
+    parser.add_argument("--db", default=str(DEFAULT_PATH), help="SQLite file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    runs = sub.add_parser("runs", help="list recent runs")
+    runs.add_argument("--limit", type=int, default=20)
+
+    trend = sub.add_parser("trend", help="values of one series across runs")
+    trend.add_argument("kind", choices=KINDS)
+    trend.add_argument("name")
+    trend.add_argument("--stat", default=None, help="default: duration for tests, p95 otherwise")
+    trend.add_argument("--env", default=None)
+    trend.add_argument("--limit", type=int, default=30)
+
+    names = sub.add_parser("names", help="list recorded series")
+    names.add_argument("--kind", choices=KINDS)
+
+    check = sub.add_parser("check", help="report significant slowdowns; exit 1 if any")
+    check.add_argument("--kind", choices=KINDS)
+    check.add_argument("--env", default=None)
+    check.add_argument("--window", type=int, default=20, help="runs per series to consider")
+    check.add_argument("--alpha", type=float, default=0.01)
+    check.add_argument("--min-change", type=float, default=0.10, help="minimal relative slowdown (0.1 = 10%%)")
+
+    imp = sub.add_parser("import-gatling", help="record a Gatling simulation.log (file or target/gatling dir)")
+    imp.add_argument("log")
+    imp.add_argument("--env", default=current_environment())
+    args = parser.parse_args(argv)
+
+    with HistoryDB(args.db) as db:
+        if args.command == "runs":
+            for run in db.runs(args.limit):
+                stamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(run.started))
+                print(f"{run.id:>5}  {stamp}  {run.source:<10}{run.commit or '-':<14}{run.branch or '-':<20}"
+                      f"{run.environment or '-':<28}{run.label}")
+        elif args.command == "names":
+            for kind, name, stat in db.names(args.kind):
+                print(f"{kind:<8}{stat:<9}{name}")
+        elif args.command == "trend":
+            stat = args.stat or ("duration" if args.kind == "test" else "p95")
+            points = db.series(args.kind, args.name, stat, args.env, args.limit)
+            if not points:
+                print(f"no data for {args.kind} {args.name!r} {stat}", file=sys.stderr)
+                return 2
+            peak = max(p.value for p in points) or 1.0
+            for p in points:
+                stamp = time.strftime("%Y-%m-%d %H:%M", time.localtime(p.started))
+                print(f"{p.run_id:>5}  {stamp}  {p.commit or '-':<14}{p.value:>12.3f}  {'#' * round(30 * p.value / peak)}")
+        elif args.command == "check":
+            found = regressions(db, args.kind, args.env, args.window, alpha=args.alpha, min_change=args.min_change)
+            for r in found:
+                print(format_regression(r))
+            print(f"{len(found)} regression(s)")
+            return 1 if found else 0
+        elif args.command == "import-gatling":
+            from perf.gatling_log import UnsupportedLogFormat, find_latest_log, parse
+            try:
+                log = parse(find_latest_log(args.log))
+            except (FileNotFoundError, UnsupportedLogFormat) as e:
+                print(e, file=sys.stderr)
+                return 2
+            run_id = record_gatling_log(db, log, args.env)
+            print(f"recorded run {run_id}: {log.run.simulation or 'simulation'} ({len(log)} requests)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+# perf/layout.py
+"""Layout snapshots: геометрија на именувани елементи за цела матрица од viewports
+во една вчитана страница (по viewport: resize + една евалуација што чека
+стабилен layout) → LayoutTable со векторски правила.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from pages.main_page import FIND_ELEMENTS_JS, VISIBLE_JS
+
+
+class Viewport(NamedTuple):
+    name: str
+    width: int
+    height: int
+
+
+VIEWPORTS: Tuple[Viewport, ...] = (
+    Viewport("phone-s", 320, 568),
+    Viewport("phone", 375, 812),
+    Viewport("tablet", 768, 1024),
+    Viewport("tablet-l", 1024, 768),
+    Viewport("laptop", 1366, 800),
+    Viewport("desktop", 1920, 1080),
+)
+
+# rects се во координати на документот (scroll вклучен) – споредливи меѓу viewports
+SETTLE_JS = """
+async ({selectors, width, stableFrames, timeout}) => {
+  const find = """ + FIND_ELEMENTS_JS.strip() + """;
+  const visible = """ + VISIBLE_JS.strip() + """;
+  const deadline = performance.now() + timeout;
+  const frame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+  const measure = () => Object.values(selectors).map(selector => {
+    const el = find(selector).find(visible);
+    if (!el) return null;
+    const r = el.getBoundingClientRect();
+    return [r.x + scrollX, r.y + scrollY, r.width, r.height];
+  });
+  let changed = true;
+  const observer = new ResizeObserver(() => { changed = true; });
+  observer.observe(document.documentElement);
+  Object.values(selectors).forEach(s => find(s).forEach(el => observer.observe(el)));
+  try {
+    while (window.innerWidth !== width && performance.now() < deadline) await frame();
+    let last = null, stable = 0, frames = 0;
+    while (performance.now() < deadline) {
+      await frame();
+      frames++;
+      const rects = measure();
+      const signature = JSON.stringify(rects);
+      stable = (!changed && signature === last) ? stable + 1 : 0;
+      changed = false;
+      last = signature;
+      if (stable >= stableFrames) return {settled: true, frames, rects};
+    }
+    return {settled: false, frames, rects: measure()};
+  } finally {
+    observer.disconnect();
+  }
+}
+"""
+
+
+class Rule(NamedTuple):
+    """Правило над LayoutTable; важи само за viewports со min_width <= ширина < max_width."""
+    kind: str
+    a: str
+    b: Optional[str] = None
+    gap: float = 0.0
+    min_width: int = 0
+    max_width: int = 10 ** 6
+
+
+def right_of(a: str, b: str, gap: float = 0.0, **widths) -> Rule:
+    """a.x >= b.x + gap (на пр. Price Summary десно од формата на десктоп)."""
+    return Rule("right_of", a, b, gap, **widths)
+
+
+def below(a: str, b: str, gap: float = 0.0, **widths) -> Rule:
+    """a.y >= b.y + gap (стакнато под b на мобилен)."""
+    return Rule("below", a, b, gap, **widths)
+
+
+def inside_viewport(a: str, **widths) -> Rule:
+    """Без хоризонтален overflow: 0 <= x и x + w <= ширина на viewport-от."""
+    return Rule("inside_viewport", a, **widths)
+
+
+def visible(a: str, **widths) -> Rule:
+    return Rule("visible", a, **widths)
+
+
+class LayoutTable:
+    def __init__(self, viewports: Sequence[Viewport], names: Sequence[str], rects: np.ndarray,
+                 frames: Sequence[int], settled: Sequence[bool]):
+        self.viewports = list(viewports)
+        self.names = list(names)
+        self.rects = rects                       # (viewports, елементи, 4) float32, NaN = невидлив
+        self.visible = ~np.isnan(rects[..., 0])
+        self.frames = np.asarray(frames)
+        self.settled = np.asarray(settled, dtype=bool)
+        self.widths = np.array([v.width for v in self.viewports])
+
+    def column(self, name: str, field: str) -> np.ndarray:
+        """Вредност по viewport: field ∈ x/y/width/height."""
+        return self.rects[:, self.names.index(name), "x y width height".split().index(field)]
+
+    def box(self, viewport: str, name: str) -> Optional[Dict[str, float]]:
+        row = self.rects[[v.name for v in self.viewports].index(viewport), self.names.index(name)]
+        return None if np.isnan(row[0]) else dict(zip(("x", "y", "width", "height"), row.tolist()))
+
+    def check(self, rules: Sequence[Rule]) -> List[str]:
+        """Сите прекршувања, по едно на (правило, viewport)."""
+        failures = []
+        for rule in rules:
+            applies = (self.widths >= rule.min_width) & (self.widths < rule.max_width)
+            a_x, a_y, a_w = (self.column(rule.a, f) for f in ("x", "y", "width"))
+            if rule.kind == "visible":
+                ok = self.visible[:, self.names.index(rule.a)]
+            elif rule.kind == "inside_viewport":
+                ok = (a_x >= 0) & (a_x + a_w <= self.widths + 0.5)
+            elif rule.kind == "right_of":
+                ok = a_x >= self.column(rule.b, "x") + rule.gap
+            elif rule.kind == "below":
+                ok = a_y >= self.column(rule.b, "y") + rule.gap
+            else:
+                raise ValueError(f"unknown rule {rule.kind!r}")
+            for index in np.flatnonzero(applies & ~ok):   # NaN (невидлив) споредби се False → прекршување
+                failures.append(f"{self.viewports[index].name} ({self.widths[index]}px): "
+                                f"{rule.kind}({rule.a}{', ' + rule.b if rule.b else ''}, gap={rule.gap:g})")
+        return failures
+
+    def format(self) -> str:
+        """Компактна табела: редица по viewport, x,y,w×h по елемент."""
+        header = f"{'viewport':<16}" + "".join(f"{name:>24}" for name in self.names)
+        lines = [header]
+        for i, viewport in enumerate(self.viewports):
+            cells = []
+            for j in range(len(self.names)):
+                x, y, w, h = self.rects[i, j]
+                cells.append(f"{'-':>24}" if np.isnan(x) else f"{f'{x:.0f},{y:.0f} {w:.0f}x{h:.0f}':>24}")
+            flag = "" if self.settled[i] else " (not settled)"
+            lines.append(f"{f'{viewport.name} {viewport.width}':<16}" + "".join(cells) + flag)
+        return "\n".join(lines)
+
+
+def snapshot(page, elements: Dict[str, str], viewports: Sequence[Viewport] = VIEWPORTS,
+             stable_frames: int = 2, timeout: int = 5000, strict: bool = True) -> LayoutTable:
+    """
+    Ја мери `elements` ({име: селектор како кај MainPage.query_elements}) за
+    секој viewport без reload; на крај viewport-от се враќа на оригиналниот.
+    Елементите треба веќе да се вчитани (на пр. query_elements(..., wait=True)).
+    `strict` → PlaywrightTimeoutError ако layout-от не се смири во `timeout`
+    ms за некој viewport.
+    """
+    original = page.viewport_size
+    rects = np.full((len(viewports), len(elements), 4), np.nan, dtype=np.float32)
+    frames, settled = [], []
+    try:
+        for i, viewport in enumerate(viewports):
+            page.set_viewport_size({"width": viewport.width, "height": viewport.height})
+            result = page.evaluate(SETTLE_JS, {"selectors": elements, "width": viewport.width,
+                                               "stableFrames": stable_frames, "timeout": timeout})
+            if strict and not result["settled"]:
+                raise PlaywrightTimeoutError(f"layout did not settle at {viewport.name} within {timeout} ms")
+            for j, rect in enumerate(result["rects"]):
+                if rect is not None:
+                    rects[i, j] = rect
+            frames.append(result["frames"])
+            settled.append(result["settled"])
+    finally:
+        if original:
+            page.set_viewport_size(original)
+    return LayoutTable(viewports, list(elements), rects, frames, settled)
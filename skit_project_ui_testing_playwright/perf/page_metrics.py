@@ -0,0 +1,153 @@
+# perf/page_metrics.py
+"""Page load метрики (TTFB, DOMContentLoaded, load, FP/FCP, LCP) по секоја
+навигација на MainPage.goto_*, споредени со budget-и по рута (perf/budgets.json):
+"warn" → PageBudgetWarning, "fail" → PageBudgetExceeded. Вклучување:
+plugins/page_budgets.py.
+"""
+
+import json
+import threading
+import warnings
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_BUDGETS_FILE = Path(__file__).with_name("budgets.json")
+MODES = ("off", "warn", "fail")
+
+# LCP се чита со buffered PerformanceObserver; Firefox/WebKit не го поддржуваат
+# → null веднаш, без чекање. Сите времиња се во ms од почетокот на навигацијата.
+# timeOrigin е ист за цел документ → по hash навигација (/#/booking од веќе
+# вчитана почетна) нема ново вчитување и таа мерка не се брои.
+METRICS_JS = """
+async () => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const paint = {};
+  performance.getEntriesByType('paint').forEach(e => { paint[e.name] = e.startTime; });
+  let lcp = null;
+  const types = PerformanceObserver.supportedEntryTypes || [];
+  if (types.includes('largest-contentful-paint')) {
+    lcp = await new Promise(resolve => {
+      const timer = setTimeout(() => resolve(null), 250);
+      const observer = new PerformanceObserver(list => {
+        const entries = list.getEntries();
+        clearTimeout(timer);
+        observer.disconnect();
+        resolve(entries[entries.length - 1].startTime);
+      });
+      observer.observe({type: 'largest-contentful-paint', buffered: true});
+    });
+  }
+  return {
+    url: location.href,
+    time_origin: performance.timeOrigin,
+    ttfb: nav ? nav.responseStart : null,
+    dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav ? nav.loadEventEnd : null,
+    fp: paint['first-paint'] ?? null,
+    fcp: paint['first-contentful-paint'] ?? null,
+    lcp: lcp,
+    transfer_size: nav ? nav.transferSize : null,
+  };
+}
+"""
+
+
+class PageBudgetExceeded(AssertionError):
+    pass
+
+
+class PageBudgetWarning(UserWarning):
+    pass
+
+
+def load_budgets(path=None) -> Dict[str, Dict[str, float]]:
+    """{рута: {метрика: лимит_ms}}; клучевите што почнуваат со '_' се коментари."""
+    data = json.loads(Path(path or DEFAULT_BUDGETS_FILE).read_text(encoding="utf-8"))
+    return {route: limits for route, limits in data.items() if not route.startswith("_")}
+
+
+def check_budgets(route: str, metrics: Dict, budgets: Dict[str, Dict[str, float]]) -> List[str]:
+    """Листа на прекршувања (празна ако е сè во рамки на budget-от)."""
+    violations = []
+    for metric, limit in budgets.get(route, {}).items():
+        value = metrics.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{route}: {metric} {value:.0f}ms > budget {limit:.0f}ms")
+    return violations
+
+
+class PageMetricsCollector:
+    def __init__(self, budgets: Dict[str, Dict[str, float]], mode: str = "warn"):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+        self.budgets = budgets
+        self.mode = mode
+        self.records: List[Dict] = []      # за тековниот тест
+        self._last_origin = None
+        self._lock = threading.Lock()
+
+    def reset(self) -> List[Dict]:
+        with self._lock:
+            records, self.records = self.records, []
+        return records
+
+    def start_test(self) -> None:
+        """Нов тест: празни записи и без timeOrigin од претходниот тест (нов context)."""
+        with self._lock:
+            self.records = []
+            self._last_origin = None
+
+    def record(self, route: str, metrics: Dict) -> None:
+        origin = metrics.get("time_origin")
+        if origin is not None and origin == self._last_origin:
+            return   # same-document навигација – Navigation Timing е од претходната
+        self._last_origin = origin
+        violations = check_budgets(route, metrics, self.budgets)
+        with self._lock:
+            self.records.append({"route": route, **metrics, "violations": violations})
+        if not violations:
+            return
+        message = "Page budget exceeded – " + "; ".join(violations)
+        if self.mode == "fail":
+            raise PageBudgetExceeded(message)
+        warnings.warn(PageBudgetWarning(message), stacklevel=3)
+
+
+_collector: Optional[PageMetricsCollector] = None
+
+
+def enable(collector: PageMetricsCollector) -> PageMetricsCollector:
+    global _collector
+    _collector = collector
+    return collector
+
+
+def disable() -> None:
+    global _collector
+    _collector = None
+
+
+def active() -> Optional[PageMetricsCollector]:
+    return _collector
+
+
+def capture(page, route: str) -> Optional[Dict]:
+    """Повикај по навигација (sync Page). Без активен collector – ништо не прави."""
+    collector = _collector
+    if collector is None:
+        return None
+    page.wait_for_load_state("load")
+    metrics = page.evaluate(METRICS_JS)
+    collector.record(route, metrics)
+    return metrics
+
+
+async def capture_async(page, route: str) -> Optional[Dict]:
+    """Истото за playwright.async_api Page (AsyncMainPage)."""
+    collector = _collector
+    if collector is None:
+        return None
+    await page.wait_for_load_state("load")
+    metrics = await page.evaluate(METRICS_JS)
+    collector.record(route, metrics)
+    return metrics
@@ -0,0 +1,127 @@
+# perf/page_pool.py
+"""Pool од „топли“ страници: секоја во свој context, веќе вчитана на home/booking/
+contact/admin (`wait_until="commit"`), за тестот да не го плаќа SPA boot-от.
+По тестот `checkin` ја чисти (routes на страницата, storage, cookies, viewport) и
+ја вчитува одново; празен pool → ладна страница. Вклучување: plugins/page_pool.py.
+"""
+
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+from playwright.sync_api import Error as PlaywrightError
+
+ROUTES: Dict[str, str] = {
+    "home": "",
+    "booking": "/#/booking",
+    "contact": "/#/contact",
+    "admin": "/admin",
+}
+DEFAULT_SIZE = 2
+
+RESET_STORAGE_JS = "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+
+
+class PagePool:
+    def __init__(self, new_context: Callable, base_url: str, size: int = DEFAULT_SIZE,
+                 routes: Optional[Dict[str, str]] = None):
+        """`new_context` – на пр. `lambda: browser.new_context(**browser_context_args)`."""
+        self.new_context = new_context
+        self.base_url = base_url.rstrip("/")
+        self.size = size
+        self.routes = dict(routes or ROUTES)
+        self.warm: Dict[str, List] = defaultdict(list)
+        self.filled = set()                        # рути што веќе се полнеле
+        self.viewports: Dict[int, Optional[Dict]] = {}   # id(page) → viewport од context-от
+        # wait/cold – вкупно секунди чекање на warm (hit) и на ладен (miss) checkout
+        self.stats = {"hits": 0, "misses": 0, "discarded": 0, "wait": 0.0, "cold": 0.0}
+
+    def url(self, route: str) -> str:
+        return f"{self.base_url}{self.routes[route]}"
+
+    # ------------------------------ lifecycle -------------------------------
+
+    def _new_page(self):
+        page = self.new_context().new_page()
+        self.viewports[id(page)] = page.viewport_size
+        return page
+
+    def _start(self, route: str):
+        """Нов context + навигација до рутата без чекање на вчитување."""
+        page = self._new_page()
+        try:
+            page.goto(self.url(route), wait_until="commit")
+        except PlaywrightError:
+            page.context.close()
+            raise
+        return page
+
+    def _fill(self, route: str) -> None:
+        while len(self.warm[route]) < self.size:
+            try:
+                self.warm[route].append(self._start(route))
+            except PlaywrightError:
+                self.stats["discarded"] += 1
+                return
+
+    def checkout(self, route: str):
+        """Страница вчитана на `route` (domcontentloaded), ексклузивно за повикувачот."""
+        if route not in self.routes:
+            raise KeyError(f"unknown route {route!r}; known: {', '.join(self.routes)}")
+        if route not in self.filled:
+            self.filled.add(route)
+            self._fill(route)                      # прв пат за рутата – сите N паралелно
+        started = time.perf_counter()
+        while self.warm[route]:
+            page = self.warm[route].pop(0)
+            try:
+                page.wait_for_load_state("domcontentloaded")
+            except PlaywrightError:
+                self._discard(page)
+                continue
+            self.stats["hits"] += 1
+            self.stats["wait"] += time.perf_counter() - started
+            return page
+        page = self._new_page()
+        page.goto(self.url(route))
+        page.wait_for_load_state("domcontentloaded")
+        self.stats["misses"] += 1
+        self.stats["cold"] += time.perf_counter() - started
+        return page
+
+    def checkin(self, page, route: str) -> None:
+        """Ресет + повторна (позадинска) навигација; над `size` → затвори."""
+        if len(self.warm[route]) >= self.size:
+            self._discard(page, counted=False)
+            return
+        try:
+            if page.is_closed():
+                raise PlaywrightError("page closed by the test")
+            page.unroute_all(behavior="ignoreErrors")
+            page.evaluate(RESET_STORAGE_JS)
+            page.context.clear_cookies()
+            page.context.clear_permissions()
+            viewport = self.viewports.get(id(page))
+            if viewport and page.viewport_size != viewport:
+                page.set_viewport_size(viewport)     # тестот го сменил (мобилен/десктоп)
+            page.goto("about:blank")
+            page.goto(self.url(route), wait_until="commit")
+        except PlaywrightError:
+            self._discard(page)
+            return
+        self.warm[route].append(page)
+
+    def _discard(self, page, counted: bool = True) -> None:
+        if counted:
+            self.stats["discarded"] += 1
+        self.viewports.pop(id(page), None)
+        try:
+            page.context.close()
+        except PlaywrightError:
+            pass
+
+    def close(self) -> None:
+        for pages in self.warm.values():
+            for page in pages:
+                self._discard(page, counted=False)
+        self.warm.clear()
@@ -0,0 +1,125 @@
+# perf/routing.py
+"""Routing профили: "functional" – abort за image/font/media и надворешни хостови
+(assertion-ите не читаат пиксели), "full-fidelity" – сè се вчитува, без route
+(interception го исклучува HTTP cache-от). Заштедените bytes се од Content-Length
+видена во full-fidelity (`.perf/resource-sizes.json`). Вклучување: plugins/routing.py.
+"""
+
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Dict, FrozenSet, NamedTuple, Optional
+from urllib.parse import urlparse
+
+DEFAULT_SIZES_FILE = Path(".perf") / "resource-sizes.json"
+
+
+class RoutingProfile(NamedTuple):
+    name: str
+    block_types: FrozenSet[str] = frozenset()    # Playwright request.resource_type
+    block_external: bool = False                 # сè надвор од хостот на base_url
+
+    @property
+    def blocks_anything(self) -> bool:
+        return bool(self.block_types) or self.block_external
+
+    def reason(self, url: str, resource_type: str, site_host: str) -> Optional[str]:
+        """Зошто се блокира барањето („image“, „external“, ...) или None."""
+        if resource_type in self.block_types:
+            return resource_type
+        if self.block_external:
+            parsed = urlparse(url)
+            if parsed.scheme in ("http", "https") and parsed.netloc != site_host:
+                return "external"
+        return None
+
+
+PROFILES: Dict[str, RoutingProfile] = {
+    "functional": RoutingProfile("functional", frozenset({"image", "font", "media"}), block_external=True),
+    "full-fidelity": RoutingProfile("full-fidelity"),
+}
+
+
+def get_profile(name: str) -> RoutingProfile:
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"unknown routing profile {name!r}; known: {', '.join(PROFILES)}") from None
+
+
+class RoutingStats:
+    def __init__(self, sizes: Optional[Dict[str, int]] = None):
+        self.sizes: Dict[str, int] = dict(sizes or {})   # size_key → bytes (Content-Length)
+        self.blocked = Counter()                         # причина → барања
+        self.saved_bytes = 0
+        self.unknown = 0                                 # блокирани без позната големина
+
+    def learn(self, key: str, size: Optional[str]) -> None:
+        if size and size.isdigit():
+            self.sizes[key] = int(size)
+
+    def block(self, key: str, reason: str) -> None:
+        self.blocked[reason] += 1
+        size = self.sizes.get(key)
+        if size is None:
+            self.unknown += 1
+        else:
+            self.saved_bytes += size
+
+    def as_dict(self) -> Dict:
+        return {"blocked": dict(self.blocked), "saved_bytes": self.saved_bytes, "unknown": self.unknown}
+
+    def merge(self, data: Dict) -> None:
+        self.blocked.update(data.get("blocked", {}))
+        self.saved_bytes += data.get("saved_bytes", 0)
+        self.unknown += data.get("unknown", 0)
+
+    @classmethod
+    def load(cls, path: Path) -> "RoutingStats":
+        try:
+            return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            return cls()
+
+    def save_sizes(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        merged = {**RoutingStats.load(path).sizes, **self.sizes}
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(merged, indent=0, sort_keys=True), encoding="utf-8")
+        tmp.replace(path)                       # паралелни pytest runs – atomic
+
+
+def size_key(url: str, site_host: str) -> str:
+    """Клуч за големината: патека за сопствениот хост (локалниот stand-in
+    добива нова порта секој run), цел URL за надворешните."""
+    parsed = urlparse(url)
+    if parsed.netloc == site_host:
+        return parsed.path + (f"?{parsed.query}" if parsed.query else "")
+    return url
+
+
+def apply(context, profile: RoutingProfile, stats: RoutingStats, base_url: str):
+    """Го закачува профилот на BrowserContext; го враќа истиот context."""
+    site_host = urlparse(base_url).netloc
+    if not profile.blocks_anything:
+        def _learn(response):
+            # само ресурси што некој профил би ги блокирал
+            if any(p.reason(response.url, response.request.resource_type, site_host) for p in PROFILES.values()):
+                stats.learn(size_key(response.url, site_host), response.headers.get("content-length"))
+
+        context.on("response", _learn)
+        return context
+
+    def _handle(route):
+        request = route.request
+        reason = profile.reason(request.url, request.resource_type, site_host)
+        if reason is None:
+            route.fallback()
+            return
+        stats.block(size_key(request.url, site_host), reason)
+        route.abort("blockedbyclient")
+
+    context.route("**/*", _handle)
+    return context
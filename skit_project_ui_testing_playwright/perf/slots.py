@@ -0,0 +1,159 @@
+# perf/slots.py
+"""Слотови соба/датуми за booking тестовите и perf/ui_runner.py – без судири меѓу
+паралелни тестови и со резервациите од претходни runs: SlotGrid (index → Slot)
+и SlotAllocator (lease фајлови со O_EXCL + `site_occupancy`).
+"""
+
+import json
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.request import urlopen
+
+Occupancy = Callable[[int], Iterable[Tuple[date, date]]]
+
+
+class SlotsExhausted(RuntimeError):
+    """Нема слободен слот во хоризонтот на allocator-от."""
+
+
+class Slot(NamedTuple):
+    room_id: int
+    checkin: date
+    checkout: date
+
+    @property
+    def nights(self) -> List[date]:
+        return [self.checkin + timedelta(days=i) for i in range((self.checkout - self.checkin).days)]
+
+    def ddmmyyyy(self) -> Tuple[str, str]:
+        """Датумите во форматот на date picker-от на сајтот (DD/MM/YYYY)."""
+        return self.checkin.strftime("%d/%m/%Y"), self.checkout.strftime("%d/%m/%Y")
+
+    def iso(self) -> Tuple[str, str]:
+        return self.checkin.isoformat(), self.checkout.isoformat()
+
+
+# ================================= GRID ======================================
+
+class SlotGrid:
+    """Детерминистичко index → Slot; `gap` празни ноќи меѓу соседни прозорци."""
+
+    def __init__(self, rooms: Sequence[int], start: date, nights: int = 1, gap: int = 1):
+        if not rooms:
+            raise ValueError("need at least one room")
+        self.rooms = list(rooms)
+        self.start = start
+        self.nights = nights
+        self.gap = gap
+
+    def slot(self, index: int) -> Slot:
+        window, room = divmod(index, len(self.rooms))
+        checkin = self.start + timedelta(days=window * (self.nights + self.gap))
+        return Slot(self.rooms[room], checkin, checkin + timedelta(days=self.nights))
+
+
+# =============================== ALLOCATOR ===================================
+
+class SlotAllocator:
+    """
+    `acquire()` → слободен Slot, заклучен за овој процес преку lease фајлови
+    во `lease_dir` (ист директориум за сите xdist workers). `free_slots()` –
+    истото пребарување без claim.
+    """
+
+    def __init__(self, lease_dir, rooms: Sequence[int], start: Optional[date] = None,
+                 horizon_days: int = 365, occupied: Optional[Occupancy] = None, owner: str = ""):
+        if not rooms:
+            raise ValueError("need at least one room")
+        self.lease_dir = Path(lease_dir)
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        self.rooms = list(rooms)
+        self.start = start or date.today() + timedelta(days=1)
+        self.horizon_days = horizon_days
+        self.occupied = occupied
+        self.owner = owner or str(os.getpid())
+
+    def _lease(self, room_id: int, night: date) -> Path:
+        return self.lease_dir / f"room{room_id}-{night.isoformat()}.lease"
+
+    def _candidates(self, nights: int, room_ids: Optional[Sequence[int]]) -> Iterator[Slot]:
+        """Слотови по ред (датум, соба), без ноќите што сајтот ги пријавува за зафатени."""
+        rooms = list(room_ids or self.rooms)
+        busy = {room: list(self.occupied(room)) if self.occupied else [] for room in rooms}
+        for offset in range(self.horizon_days - nights + 1):   # и checkout во хоризонтот
+            checkin = self.start + timedelta(days=offset)
+            checkout = checkin + timedelta(days=nights)
+            for room in rooms:
+                if not any(checkin < end and start < checkout for start, end in busy[room]):
+                    yield Slot(room, checkin, checkout)
+
+    def free_slots(self, nights: int = 1, limit: int = 10,
+                   room_ids: Optional[Sequence[int]] = None) -> List[Slot]:
+        """Слободни (незакупени и незафатени) слотови, без да се закупат."""
+        found = []
+        for slot in self._candidates(nights, room_ids):
+            if not any(self._lease(slot.room_id, n).exists() for n in slot.nights):
+                found.append(slot)
+                if len(found) >= limit:
+                    break
+        return found
+
+    def acquire(self, nights: int = 1, room_ids: Optional[Sequence[int]] = None) -> Slot:
+        for slot in self._candidates(nights, room_ids):
+            if self._claim(slot):
+                return slot
+        raise SlotsExhausted(f"no free {nights}-night slot in {self.horizon_days} days from {self.start}")
+
+    def _claim(self, slot: Slot) -> bool:
+        claimed = []
+        for night in slot.nights:
+            path = self._lease(slot.room_id, night)
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                for taken in claimed:
+                    taken.unlink()
+                return False
+            with os.fdopen(fd, "w") as f:
+                f.write(self.owner)
+            claimed.append(path)
+        return True
+
+    def release(self, slot: Slot) -> None:
+        """Враќа слот што НЕ е резервиран (на пр. тест што само ја отвора формата)."""
+        for night in slot.nights:
+            self._lease(slot.room_id, night).unlink(missing_ok=True)
+
+    def booked(self, slot: Slot) -> bool:
+        """Дали сајтот ги пријавува ноќите на слотот за зафатени (тестот направил резервација)."""
+        if self.occupied is None:
+            return False
+        return any(slot.checkin < end and start < slot.checkout for start, end in self.occupied(slot.room_id))
+
+
+# ============================ SITE LOOKUPS ===================================
+
+def _get_json(url: str, timeout: float) -> dict:
+    with urlopen(url, timeout=timeout) as resp:
+        return json.loads(resp.read() or b"{}")
+
+
+def site_rooms(base_url: str, timeout: float = 10) -> List[int]:
+    """ID-ата на собите од /api/room (празна листа ако API-то не е достапно)."""
+    try:
+        return [int(r["roomid"]) for r in _get_json(f"{base_url}/api/room", timeout).get("rooms", [])]
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+
+
+def site_occupancy(base_url: str, timeout: float = 10) -> Occupancy:
+    """Зафатените периоди по соба од /api/report/room/<id> (недостапно → ништо не е зафатено)."""
+    def _occupied(room_id: int) -> List[Tuple[date, date]]:
+        try:
+            report = _get_json(f"{base_url}/api/report/room/{room_id}", timeout).get("report", [])
+            return [(date.fromisoformat(r["start"]), date.fromisoformat(r["end"])) for r in report]
+        except (OSError, ValueError, KeyError, TypeError):
+            return []
+    return _occupied
@@ -0,0 +1,135 @@
+# perf/step_timing.py
+"""Траење по чекор за MainPage / AsyncMainPage: `@timed_methods` ги мери јавните
+методи, `@timed("име")` / `with step("име")` helper-ите во тестовите, со гнездење
+("reach_booking_form > goto_booking"). Вклучување: plugins/step_timing.py.
+"""
+
+import functools
+import inspect
+import math
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_active: Optional["StepRecorder"] = None
+# ContextVar (не threading.local) → гнездењето важи и по asyncio task-ови
+_stack: ContextVar[Tuple[str, ...]] = ContextVar("step_stack", default=())
+
+
+class StepRecorder:
+    """Собира записи {test, step, path, depth, duration, ok}; thread-safe."""
+
+    def __init__(self):
+        self.records: List[Dict] = []
+        self.test: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def add(self, path: Tuple[str, ...], duration: float, ok: bool) -> None:
+        record = {
+            "test": self.test,
+            "step": path[-1],
+            "path": " > ".join(path),
+            "depth": len(path) - 1,
+            "duration": duration,
+            "ok": ok,
+        }
+        with self._lock:
+            self.records.append(record)
+
+
+def enable(recorder: Optional[StepRecorder] = None) -> StepRecorder:
+    global _active
+    _active = recorder or StepRecorder()
+    return _active
+
+
+def disable() -> None:
+    global _active
+    _active = None
+
+
+def active() -> Optional[StepRecorder]:
+    return _active
+
+
+@contextmanager
+def step(name: str):
+    recorder = _active
+    if recorder is None:
+        yield
+        return
+    path = _stack.get() + (name,)
+    token = _stack.set(path)
+    started = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        _stack.reset(token)
+        recorder.add(path, time.perf_counter() - started, ok)
+
+
+def timed(name=None):
+    """Декоратор: `@timed`, `@timed("име")`; работи и за async функции."""
+    def decorate(fn):
+        label = name if isinstance(name, str) else fn.__name__
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                if _active is None:
+                    return await fn(*args, **kwargs)
+                with step(label):
+                    return await fn(*args, **kwargs)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if _active is None:
+                    return fn(*args, **kwargs)
+                with step(label):
+                    return fn(*args, **kwargs)
+        return wrapper
+
+    return decorate(name) if callable(name) else decorate
+
+
+def timed_methods(cls):
+    """Ги обвиткува сите јавни методи на класата (без property и `_приватни`)."""
+    for attr, value in list(vars(cls).items()):
+        if not attr.startswith("_") and inspect.isfunction(value):
+            setattr(cls, attr, timed(attr)(value))
+    return cls
+
+
+# ============================== SUMMARY ======================================
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank перцентил од веќе сортирана листа."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(records: Iterable[Dict]) -> List[Dict]:
+    """Статистика по чекор (низ сите тестови), сортирано по p95 опаѓачки."""
+    by_step: Dict[str, List[float]] = {}
+    for r in records:
+        by_step.setdefault(r["step"], []).append(r["duration"])
+    rows = []
+    for name, values in by_step.items():
+        values.sort()
+        rows.append({
+            "step": name,
+            "count": len(values),
+            "p50": statistics.median(values),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": values[-1],
+            "total": sum(values),
+        })
+    return sorted(rows, key=lambda row: row["p95"], reverse=True)
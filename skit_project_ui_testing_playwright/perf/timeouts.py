@@ -0,0 +1,123 @@
+# perf/timeouts.py
+"""Адаптивни timeouts: timeout на чекор = p99 од историјата (perf/history.py) ×
+safety factor, со hard-coded вредноста како горна граница – скршен тест паѓа за
+секунди наместо по 25 s. Вклучување: plugins/timeouts.py.
+"""
+
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+DEFAULT_FACTOR = 3.0
+DEFAULT_FLOOR_MS = 2000      # под ова не се оди – cold start, GC паузи, бавен CI
+
+_active: Optional["TimeoutPolicy"] = None
+_inside: ContextVar[bool] = ContextVar("adaptive_timeout_inside", default=False)
+
+
+class TimeoutPolicy:
+    def __init__(self, p99_ms: Dict[str, float], factor: float = DEFAULT_FACTOR,
+                 floor_ms: float = DEFAULT_FLOOR_MS):
+        self.p99_ms = dict(p99_ms)
+        self.factor = factor
+        self.floor_ms = floor_ms
+        self.used: Dict[str, Tuple[int, int]] = {}     # чекор → (адаптивен, cap) последно употребени
+
+    def limit(self, step: str, cap_ms: float) -> int:
+        """Timeout (ms) за `step`: min(cap, max(floor, p99 × factor)); непознат чекор → cap."""
+        p99 = self.p99_ms.get(step)
+        if p99 is None:
+            return int(cap_ms)
+        value = int(min(cap_ms, max(self.floor_ms, p99 * self.factor)))
+        self.used[step] = (value, int(cap_ms))
+        return value
+
+    @classmethod
+    def from_history(cls, db, environment: Optional[str] = None, window: int = 10, min_runs: int = 3,
+                     factor: float = DEFAULT_FACTOR, floor_ms: float = DEFAULT_FLOOR_MS) -> "TimeoutPolicy":
+        """Од perf.history.HistoryDB; траењата на чекорите таму се во секунди."""
+        p99_ms = {}
+        for _, name, stat in db.names("step"):
+            if stat != "p99":
+                continue
+            points = db.series("step", name, "p99", environment, limit=window)
+            if len(points) >= min_runs:
+                p99_ms[name] = max(p.value for p in points) * 1000
+        return cls(p99_ms, factor, floor_ms)
+
+
+def enable(policy: TimeoutPolicy) -> TimeoutPolicy:
+    global _active
+    _active = policy
+    return policy
+
+
+def disable() -> None:
+    global _active
+    _active = None
+
+
+def active() -> Optional[TimeoutPolicy]:
+    return _active
+
+
+# =============================== DECORATORS ==================================
+
+def _wrap(step: str, fn):
+    signature = inspect.signature(fn)
+    default = signature.parameters["timeout"].default
+
+    def _adapted(args, kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.arguments["timeout"] = _active.limit(step, bound.arguments.get("timeout", default))
+        return bound.args, bound.kwargs
+
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if _active is None or _inside.get():
+                return await fn(*args, **kwargs)
+            args, kwargs = _adapted(args, kwargs)
+            token = _inside.set(True)
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                _inside.reset(token)
+    else:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _active is None or _inside.get():
+                return fn(*args, **kwargs)
+            args, kwargs = _adapted(args, kwargs)
+            token = _inside.set(True)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _inside.reset(token)
+    return wrapper
+
+
+def adaptive(name=None):
+    """Декоратор за функција со `timeout=` параметар: `@adaptive`, `@adaptive("име")`."""
+    def decorate(fn):
+        return _wrap(name if isinstance(name, str) else fn.__name__, fn)
+
+    return decorate(name) if callable(name) else decorate
+
+
+def adaptive_timeouts(cls=None, *, skip=()):
+    """
+    Ги обвиткува јавните методи со `timeout=` параметар (со default). `skip` –
+    генерички wait-ови чиј p99 е мешавина од различни намени.
+    """
+    def decorate(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or attr in skip or not inspect.isfunction(value):
+                continue
+            parameter = inspect.signature(value).parameters.get("timeout")
+            if parameter is not None and parameter.default is not inspect.Parameter.empty:
+                setattr(cls, attr, _wrap(attr, value))
+        return cls
+
+    return decorate(cls) if cls is not None else decorate
@@ -0,0 +1,192 @@
+# perf/ui_runner.py
+"""Конкурентен runner за UI сценарија (AsyncMainPage): еден browser, свој context по
+сценарио и до `concurrency` сценарија истовремено во еден процес.
+
+    python -m perf.ui_runner --scenario booking --count 40 --concurrency 10
+
+Без --base-url се стартува локалниот stand-in (mocks/shady_meadows.py).
+"""
+
+import argparse
+import asyncio
+import functools
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from playwright.async_api import async_playwright
+
+from pages.async_main_page import AsyncMainPage
+from perf.slots import Slot, SlotAllocator, site_occupancy, site_rooms
+from perf.step_timing import percentile
+
+Scenario = Callable[[AsyncMainPage, int], Awaitable[None]]
+
+
+class ScenarioResult(NamedTuple):
+    name: str
+    index: int
+    ok: bool
+    duration: float   # секунди
+    error: str
+
+
+# ============================== SCENARIOS ====================================
+
+async def contact_scenario(main: AsyncMainPage, index: int) -> None:
+    await main.goto_contact()
+    await main.fill_contact_form(
+        name=f"Load User {index}",
+        email=f"load.user{index}@example.com",
+        phone="+38971234567",
+        subject="Прашање за сместување",
+        description="Ова е тест порака со доволна должина за да помине валидаторот.",
+    )
+    result = await main.submit_contact_form_checked(timeout=20000)
+    assert result.accepted, f"contact rejected: {result}"
+    await main.wait_success_contact()
+
+
+@functools.lru_cache(maxsize=None)
+def _booking_slots(base_url: str) -> SlotAllocator:
+    # lease-ите се по run (свеж директориум); ноќите резервирани во претходни
+    # runs/на live демото ги враќа site_occupancy – како `slot_allocator` во tests/conftest.py
+    return SlotAllocator(tempfile.mkdtemp(prefix="ui-runner-slots-"), site_rooms(base_url) or [1],
+                         occupied=site_occupancy(base_url), owner="ui_runner")
+
+
+async def booking_scenario(main: AsyncMainPage, index: int) -> None:
+    # секое сценарио свој слободен слот (соба + 2 ноќи) → без 409 и при повторен run
+    allocator = _booking_slots(main.base_url)
+    slot = await asyncio.to_thread(allocator.acquire, 2)       # lookup-от е sync HTTP
+    try:
+        await _book(main, index, slot)
+    finally:
+        if not await asyncio.to_thread(allocator.booked, slot):
+            allocator.release(slot)
+
+
+async def _book(main: AsyncMainPage, index: int, slot: Slot) -> None:
+    await main.goto_booking()
+    await main.set_dates(*slot.ddmmyyyy())
+    await main.click_check_availability()
+    await main.click_book_now(slot.room_id)
+    await main.maybe_click_sidebar_reserve_now()
+    await main.wait_booking_form()
+    await main.fill_booking_form(
+        firstname="Мила", lastname="Тестова", email=f"load.user{index}@example.com", phone="+38971234567"
+    )
+    result = await main.click_final_reserve_checked(timeout=20000)
+    assert result.accepted, f"booking rejected: {result}"
+    await main.wait_booking_confirmed()
+
+
+async def login_scenario(main: AsyncMainPage, index: int) -> None:
+    await main.login_as_admin()
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "contact": contact_scenario,
+    "booking": booking_scenario,
+    "login": login_scenario,
+}
+
+
+# ================================ RUNNER =====================================
+
+async def run_scenarios(scenarios: Sequence[Tuple[str, Scenario]], base_url: str,
+                        concurrency: int = 10, browser_name: str = "chromium",
+                        headless: bool = True) -> List[ScenarioResult]:
+    """Ги извршува сценаријата со најмногу `concurrency` истовремено во еден browser."""
+    async with async_playwright() as pw:
+        browser = await getattr(pw, browser_name).launch(headless=headless)
+        slots = asyncio.Semaphore(concurrency)
+
+        async def _one(index: int, name: str, scenario: Scenario) -> ScenarioResult:
+            async with slots:
+                context = await browser.new_context()
+                started = time.perf_counter()
+                try:
+                    await scenario(AsyncMainPage(await context.new_page(), base_url), index)
+                    return ScenarioResult(name, index, True, time.perf_counter() - started, "")
+                except Exception as e:
+                    return ScenarioResult(name, index, False, time.perf_counter() - started,
+                                          f"{type(e).__name__}: {e}")
+                finally:
+                    await context.close()
+
+        try:
+            return list(await asyncio.gather(
+                *(_one(i, name, scenario) for i, (name, scenario) in enumerate(scenarios))
+            ))
+        finally:
+            await browser.close()
+
+
+def run_scenarios_blocking(scenarios: Sequence[Tuple[str, Scenario]], base_url: str,
+                           **kwargs) -> List[ScenarioResult]:
+    """
+    Sync влез: event loop-от се крева во посебна нишка, па може да се повика и
+    од pytest тест каде sync Playwright (pytest-playwright) веќе работи.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, run_scenarios(scenarios, base_url, **kwargs)).result()
+
+
+def summarize(results: Sequence[ScenarioResult], wall: float) -> str:
+    lines = []
+    for name in sorted({r.name for r in results}):
+        rows = [r for r in results if r.name == name]
+        durations = sorted(r.duration for r in rows)
+        p95 = percentile(durations, 95)
+        failed = sum(not r.ok for r in rows)
+        lines.append(
+            f"{name:<10} runs={len(rows):<4} failed={failed:<3} "
+            f"p50={statistics.median(durations):.2f}s p95={p95:.2f}s max={durations[-1]:.2f}s"
+        )
+    lines.append(f"total: {len(results)} scenarios in {wall:.2f}s "
+                 f"({len(results) / wall:.1f} scenarios/s)")
+    for r in results:
+        if not r.ok:
+            lines.append(f"  FAILED {r.name}#{r.index}: {r.error.splitlines()[0]}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run UI scenarios concurrently in one process")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario name (repeatable); default: contact")
+    parser.add_argument("--count", type=int, default=10, help="runs per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--base-url", default=None, help="default: start the local stand-in")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or ["contact"]
+    scenarios = [(name, SCENARIOS[name]) for name in names for _ in range(args.count)]
+
+    site = None
+    base_url = args.base_url
+    if base_url is None:
+        from mocks import ShadyMeadowsServer
+        site = ShadyMeadowsServer().start()
+        base_url = site.url
+    try:
+        started = time.perf_counter()
+        results = asyncio.run(run_scenarios(
+            scenarios, base_url, concurrency=args.concurrency,
+            browser_name=args.browser, headless=not args.headed,
+        ))
+        print(summarize(results, time.perf_counter() - started))
+    finally:
+        if site is not None:
+            site.stop()
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
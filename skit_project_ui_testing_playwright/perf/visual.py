@@ -0,0 +1,197 @@
+# perf/visual.py
+"""Визуелна регресија: baseline screenshot по (рута, viewport) во
+tests/visual-baselines/, споредба со NumPy – перцептуален hash (DCT) + diff по
+блокови 16×16, со маски од perf/visual.json. Слика бајт-идентична со baseline-от
+или со последната што поминала со истите маски и прагови не се декодира
+(`.perf/visual-cache.json`). Вклучување: plugins/visual.py.
+"""
+
+import hashlib
+import io
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_MASKS_FILE = Path(__file__).with_name("visual.json")
+DEFAULT_BASELINE_DIR = Path("tests") / "visual-baselines"
+DEFAULT_CACHE_FILE = Path(".perf") / "visual-cache.json"
+
+HASH_SIZE = 8             # 8×8 = 64 бита
+DCT_SIZE = 32
+BLOCK = 16                # px
+
+
+class VisualDiff(NamedTuple):
+    key: str
+    distance: int                                   # phash Hamming (0–64)
+    changed_ratio: float                            # удел на сменети блокови
+    bbox: Optional[Tuple[int, int, int, int]]       # x, y, w, h на сите сменети блокови (px)
+    source: str                                     # "compared" / "identical" / "cache" / "new-baseline" / "missing" / "size"
+    elapsed_ms: float
+    passed: bool
+
+
+def load_masks(path=None) -> Dict[str, Dict[str, List]]:
+    """{рута: {"selectors": [...], "rects": [[x, y, w, h], ...]}}; '_' клучеви се коментари."""
+    data = json.loads(Path(path or DEFAULT_MASKS_FILE).read_text(encoding="utf-8"))
+    return {route: masks for route, masks in data.items() if not route.startswith("_")}
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# ============================== VECTOR OPS ===================================
+
+def decode_png(data: bytes) -> np.ndarray:
+    """PNG bytes → (H, W, 3) uint8. Pillow само за decode; сè друго е NumPy."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def luminance(rgb: np.ndarray) -> np.ndarray:
+    return rgb.astype(np.float32) @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def block_mean(gray: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Просек по еднакви блокови (area downsample) – остатокот на рабовите се отфрла."""
+    h, w = gray.shape
+    bh, bw = max(h // rows, 1), max(w // cols, 1)
+    cropped = gray[: bh * rows, : bw * cols]
+    return cropped.reshape(rows, bh, cols, bw).mean(axis=(1, 3))
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = _dct_matrix(DCT_SIZE)
+
+
+def phash(gray: np.ndarray) -> np.ndarray:
+    """64-битен перцептуален hash (bool низа)."""
+    small = block_mean(gray, DCT_SIZE, DCT_SIZE)
+    low = (_DCT @ small @ _DCT.T)[:HASH_SIZE, :HASH_SIZE].ravel()
+    return low > np.median(low[1:])                # DC компонентата не влегува во медијаната
+
+
+def apply_rects(gray: np.ndarray, rects: Sequence[Sequence[float]], scale: float = 1.0) -> np.ndarray:
+    if not rects:
+        return gray
+    gray = gray.copy()
+    for x, y, w, h in rects:
+        gray[int(y * scale): int((y + h) * scale), int(x * scale): int((x + w) * scale)] = 0
+    return gray
+
+
+def compare_arrays(baseline: np.ndarray, actual: np.ndarray, block_threshold: float = 6.0
+                   ) -> Tuple[int, float, Optional[Tuple[int, int, int, int]]]:
+    """(phash растојание, удел сменети блокови, bbox) за две сиви слики со иста големина."""
+    distance = int(np.count_nonzero(phash(baseline) != phash(actual)))
+    h, w = baseline.shape
+    rows, cols = max(h // BLOCK, 1), max(w // BLOCK, 1)
+    changed = block_mean(np.abs(baseline - actual), rows, cols) > block_threshold
+    if not changed.any():
+        return distance, 0.0, None
+    ys, xs = np.nonzero(changed)
+    bbox = (int(xs.min()) * BLOCK, int(ys.min()) * BLOCK,
+            int(xs.max() - xs.min() + 1) * BLOCK, int(ys.max() - ys.min() + 1) * BLOCK)
+    return distance, float(changed.mean()), bbox
+
+
+# ================================ STORE ======================================
+
+class VisualStore:
+    def __init__(self, baseline_dir: Path = DEFAULT_BASELINE_DIR, cache_file: Path = DEFAULT_CACHE_FILE,
+                 max_distance: int = 4, max_changed_ratio: float = 0.002, block_threshold: float = 6.0,
+                 update: bool = False):
+        self.baseline_dir = Path(baseline_dir)
+        self.cache_file = Path(cache_file)
+        self.max_distance = max_distance
+        self.max_changed_ratio = max_changed_ratio
+        self.block_threshold = block_threshold
+        self.update = update
+        try:
+            self.cache: Dict[str, Dict[str, str]] = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.cache = {}
+        self.results: List[VisualDiff] = []
+
+    def baseline_path(self, key: str) -> Path:
+        return self.baseline_dir / f"{key}.png"
+
+    def has_baseline(self, key: str) -> bool:
+        return self.baseline_path(key).exists()
+
+    def _settings(self, rects: Sequence[Sequence[float]], scale: float) -> str:
+        """sha256 на rects + праговите – cache-от важи само за истата споредба."""
+        settings = [[list(r) for r in rects], scale, self.max_distance,
+                    self.max_changed_ratio, self.block_threshold]
+        return sha256(json.dumps(settings).encode())
+
+    def compare(self, key: str, png: bytes, rects: Sequence[Sequence[float]] = (), scale: float = 1.0) -> VisualDiff:
+        """Нова слика (PNG bytes) наспроти baseline-от за `key` (на пр. "home-phone")."""
+        started = time.perf_counter()
+        path = self.baseline_path(key)
+        shot_sha = sha256(png)
+        settings = self._settings(rects, scale)
+
+        def _done(distance, ratio, bbox, source, passed):
+            result = VisualDiff(key, distance, ratio, bbox, source, (time.perf_counter() - started) * 1000, passed)
+            self.results.append(result)
+            return result
+
+        if not self.update and not path.exists():
+            return _done(64, 1.0, None, "missing", False)
+        if self.update:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(png)
+            self.cache[key] = {"baseline": shot_sha, "shot": shot_sha, "settings": settings}
+            return _done(0, 0.0, None, "new-baseline", True)
+
+        baseline_bytes = path.read_bytes()
+        baseline_sha = sha256(baseline_bytes)
+        if shot_sha == baseline_sha:
+            return _done(0, 0.0, None, "identical", True)
+        cached = self.cache.get(key, {})
+        if cached == {"baseline": baseline_sha, "shot": shot_sha, "settings": settings}:
+            return _done(0, 0.0, None, "cache", True)
+
+        baseline, actual = decode_png(baseline_bytes), decode_png(png)
+        if baseline.shape != actual.shape:
+            return _done(64, 1.0, None, "size", False)
+        distance, ratio, bbox = compare_arrays(apply_rects(luminance(baseline), rects, scale),
+                                               apply_rects(luminance(actual), rects, scale),
+                                               self.block_threshold)
+        passed = distance <= self.max_distance and ratio <= self.max_changed_ratio
+        if passed:
+            self.cache[key] = {"baseline": baseline_sha, "shot": shot_sha, "settings": settings}
+        return _done(distance, ratio, bbox, "compared", passed)
+
+    def save_cache(self) -> None:
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            on_disk = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            on_disk = {}
+        on_disk.update(self.cache)                   # паралелни workers – различни клучеви
+        self.cache_file.write_text(json.dumps(on_disk, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def describe(result: VisualDiff) -> str:
+    where = f", changed area {result.bbox}" if result.bbox else ""
+    if result.source == "missing":
+        return f"{result.key}: no baseline screenshot (record it with --visual-update)"
+    if result.source == "size":
+        return f"{result.key}: screenshot size differs from the baseline"
+    return (f"{result.key}: phash distance {result.distance}, "
+            f"{result.changed_ratio:.2%} blocks changed{where}")
@@ -0,0 +1,96 @@
+# plugins/cpu_profile.py
+"""`pytest --cpu-profile[=ACTIONS]` – резиме по профилирана акција во извештајот на
+тестот (секција "cpu profile") и табела по акција на крај.
+"""
+
+import pytest
+
+from perf import cpu_profile
+from plugins.workers import WorkerResults, is_worker
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("cpu-profile", "Chromium CPU profiles around MainPage actions")
+    group.addoption("--cpu-profile", nargs="?", const=",".join(cpu_profile.DEFAULT_ACTIONS), default=None,
+                    metavar="ACTIONS", help="record a CPU profile and trace around these MainPage methods "
+                                            f"(comma separated, default: {', '.join(cpu_profile.DEFAULT_ACTIONS)})")
+    group.addoption("--cpu-profile-dir", default=None,
+                    help=f"where raw profiles are written (default: {cpu_profile.DEFAULT_DIR})")
+    group.addoption("--cpu-profile-top", type=int, default=5,
+                    help="functions by self time shown per action")
+    group.addoption("--cpu-profile-interval", type=int, default=100,
+                    help="sampling interval in microseconds")
+    group.addoption("--cpu-profile-no-trace", action="store_true", default=False,
+                    help="CPU profile only, without tracing (no long tasks)")
+
+
+class CpuProfilePlugin(WorkerResults):
+    output_key = "cpu_profile"
+
+    def __init__(self, config):
+        self.config = config
+        actions = [a.strip() for a in config.getoption("cpu_profile").split(",") if a.strip()]
+        self.profiler = cpu_profile.enable(cpu_profile.CpuProfiler(
+            actions,
+            out_dir=config.rootpath / (config.getoption("cpu_profile_dir") or cpu_profile.DEFAULT_DIR),
+            interval_us=config.getoption("cpu_profile_interval"),
+            top=config.getoption("cpu_profile_top"),
+            tracing=not config.getoption("cpu_profile_no_trace"),
+        ))
+        self.records = []          # controller: и од workers
+        self.unsupported = 0
+        self.lost = 0
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.profiler.test = item.nodeid
+        yield
+        self.profiler.test = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != "call":
+            return
+        profiles = self.profiler.take(item.nodeid)
+        if profiles:
+            report.sections.append(("cpu profile", "\n".join(cpu_profile.format_profile(p) for p in profiles)))
+            item.user_properties.append(("cpu_profile", [p.as_dict() for p in profiles]))
+
+    def local(self):
+        return {"records": [p.as_dict() for p in self.profiler.records],
+                "unsupported": self.profiler.unsupported, "lost": self.profiler.lost}
+
+    def merge(self, data) -> None:
+        self.records.extend(data["records"])
+        self.unsupported += data["unsupported"]
+        self.lost += data["lost"]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if is_worker(self.config):
+            return
+        tr = terminalreporter
+        tr.write_sep("=", "frontend CPU profiles")
+        if self.unsupported:
+            tr.write_line(f"{self.unsupported} actions ran without a profile (no CDP – Chromium only)")
+        if self.lost:
+            tr.write_line(f"{self.lost} profiles lost (page closed or CDP error during the action)")
+        if not self.records:
+            tr.write_line(f"no profiled action ran ({', '.join(sorted(self.profiler.actions))})")
+            return
+        tr.write_line(f"{'action':<28}{'count':>7}{'wall p50':>10}{'busy p50':>10}{'long tasks':>12}{'max ms':>8}")
+        for row in cpu_profile.summarize(self.records, self.profiler.top):
+            tr.write_line(f"{row['action']:<28}{row['count']:>7}{row['wall_p50']:>10.0f}{row['busy_p50']:>10.0f}"
+                          f"{row['long_tasks']:>12}{row['long_task_max']:>8.0f}")
+            for (function, location), ms in row["top"]:
+                tr.write_line(f"    {ms:8.1f} ms  {function}  {location}")
+        tr.write_line(f"raw profiles in {self.profiler.out_dir}")
+
+    def pytest_unconfigure(self, config):
+        cpu_profile.disable()
+
+
+def pytest_configure(config):
+    if config.getoption("cpu_profile"):
+        config.pluginmanager.register(CpuProfilePlugin(config), "cpu-profile")
@@ -0,0 +1,167 @@
+# plugins/har.py
+"""`pytest --har record|replay [--har-match lenient]` – HAR по тест (сите негови
+context-и); strict replay без снимка → skip. На крај: served/unmatched барања
+и replay време наспроти снимањето.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from perf import har
+from plugins.workers import WorkerResults, add_counts, is_worker
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("har", "HAR record/replay of browser traffic")
+    group.addoption("--har", choices=har.MODES, default=None,
+                    help="record each test's network traffic, or replay it from the archive")
+    group.addoption("--har-dir", default=None, help=f"archive directory (default: {har.DEFAULT_DIR})")
+    group.addoption("--har-match", choices=har.MATCHING, default="strict",
+                    help="replay: abort (strict) or send to the network (lenient) requests that were not recorded")
+
+
+class HarTest:
+    """HAR на еден тест (или session fixture): context args + replay route + ingest."""
+
+    def __init__(self, plugin: "HarPlugin", name: str):
+        self.plugin = plugin
+        self.name = name
+        self.contexts = []
+        self.tmp = None
+        self.replayer = None
+        if plugin.mode == "record":
+            self.tmp = Path(tempfile.mkdtemp(prefix="har-"))
+        elif plugin.mode == "replay":
+            archive = plugin.archive
+            if not archive.has(name) and plugin.strict:
+                pytest.skip(f"no HAR recording for {name} (record it with --har record)")
+            entries = archive.entries(name) if archive.has(name) else []
+            self.replayer = har.HarReplayer(archive, entries, plugin.base_url, strict=plugin.strict)
+
+    def context_args(self) -> dict:
+        if self.tmp is None:
+            return {}
+        path = self.tmp / f"context-{len(self.contexts)}.har"
+        return {"record_har_path": str(path), "record_har_content": "attach", "record_har_mode": "minimal"}
+
+    def pinned_slot(self):
+        """Replay: слотот од снимањето (или None)."""
+        if self.replayer is None:
+            return None
+        return self.plugin.archive.pinned_slot(self.name)
+
+    def pin_slot(self, slot) -> None:
+        if self.tmp is not None:
+            self.plugin.archive.pin_slot(self.name, slot)
+
+    def attach(self, context):
+        if self.plugin.mode:
+            self.contexts.append(context)
+        if self.replayer is not None:
+            self.replayer.attach(context)
+        return context
+
+    def finish(self) -> None:
+        for context in self.contexts:
+            try:
+                context.close()                   # HAR се запишува при close
+            except Exception:
+                pass
+        if self.tmp is not None:
+            self.plugin.stats["entries"] += self.plugin.archive.ingest(
+                self.name, sorted(self.tmp.glob("context-*.har")))
+            shutil.rmtree(self.tmp, ignore_errors=True)
+        if self.replayer is not None:
+            self.plugin.stats["served"] += self.replayer.served
+            self.plugin.stats["unmatched"] += len(self.replayer.unmatched)
+            self.plugin.unmatched.extend(self.replayer.unmatched[:3])
+
+
+class HarPlugin(WorkerResults):
+    output_key = "har"
+
+    def __init__(self, config):
+        self.config = config
+        self.mode = config.getoption("har")
+        self.strict = config.getoption("har_match") == "strict"
+        self.archive = har.HarArchive(config.rootpath / (config.getoption("har_dir") or har.DEFAULT_DIR))
+        self.base_url = ""                        # го поставува fixture-от `har_archive`
+        self.stats = {"entries": 0, "served": 0, "unmatched": 0}
+        self.unmatched = []                       # примери за summary
+        self.total = {}                           # controller: збир од сите процеси
+        self.examples = []
+        self.durations = {}                       # controller: тест → s (setup+call+teardown)
+
+    def test(self, name: str) -> HarTest:
+        return HarTest(self, name)
+
+    def pytest_runtest_logreport(self, report):
+        name = har.har_name(report.nodeid)
+        self.durations[name] = self.durations.get(name, 0.0) + report.duration
+
+    def local(self):
+        return {**self.stats, "unmatched_examples": self.unmatched[:10], "slots": self.archive.meta["slots"]}
+
+    def merge(self, data) -> None:
+        add_counts(self.total, {key: data.get(key, 0) for key in self.stats})
+        self.examples.extend(data.get("unmatched_examples", []))
+        if self.mode == "record":
+            self.archive.meta["slots"].update(data.get("slots", {}))
+
+    def merged(self) -> None:
+        if self.mode == "record" and self.durations:
+            for name, duration in self.durations.items():
+                if self.archive.has(name):
+                    self.archive.record_test(name, duration)
+            self.archive.save_meta(self.base_url or self.config.getoption("base_url", default=None) or "")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if is_worker(self.config):
+            return
+        tr = terminalreporter
+        tr.write_sep("=", f"HAR {self.mode} ({self.archive.root})")
+        size = self.archive.size()
+        tr.write_line(f"archive: {len(self.archive.meta.get('tests', {}))} tests, "
+                      f"hars {size.get('hars', 0) / 1024:.0f} KiB, content {size.get('content', 0) / 1024:.0f} KiB")
+        if self.mode == "record":
+            tr.write_line(f"recorded entries: {self.total['entries']}")
+            return
+        tr.write_line(f"served from archive: {self.total['served']}, unmatched: {self.total['unmatched']}"
+                      + (" (aborted)" if self.strict else " (sent to network)"))
+        for example in self.examples[:5]:
+            tr.write_line(f"  unmatched: {example}")
+        recorded = self.archive.meta.get("tests", {})
+        common = [name for name in self.durations if name in recorded]
+        live = sum(recorded[name] for name in common)
+        if live:
+            replay = sum(self.durations[name] for name in common)
+            tr.write_line(f"{len(common)} tests: replay {replay:.1f}s vs recorded {live:.1f}s "
+                          f"({replay / live:.0%} of the recorded run)")
+
+
+def pytest_configure(config):
+    if config.getoption("har"):
+        config.pluginmanager.register(HarPlugin(config), "har")
+
+
+@pytest.fixture(scope="session")
+def har_archive(pytestconfig, base_url):
+    """HarPlugin или None (без --har)."""
+    plugin = pytestconfig.pluginmanager.get_plugin("har")
+    if plugin is not None:
+        plugin.base_url = base_url
+    return plugin
+
+
+@pytest.fixture
+def har_test(request, har_archive):
+    """HAR на тековниот тест; без --har – None."""
+    if har_archive is None:
+        yield None
+        return
+    recording = har_archive.test(har.har_name(request.node.nodeid))
+    yield recording
+    recording.finish()
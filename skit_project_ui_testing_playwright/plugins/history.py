@@ -0,0 +1,72 @@
+# plugins/history.py
+"""`pytest --perf-history[=PATH]` – траењата на поминатите тестови и (со
+--step-timing) MainPage чекорите во SQLite историјата, и регресиите од овој run.
+"""
+
+from collections import defaultdict
+
+import pytest
+
+from perf import history, step_timing
+from plugins.workers import is_worker
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf-history", "cross-run performance history")
+    group.addoption("--perf-history", nargs="?", const=str(history.DEFAULT_PATH), default=None, metavar="PATH",
+                    help=f"record test/step timings of this run (default DB: {history.DEFAULT_PATH})")
+
+
+class HistoryPlugin:
+    def __init__(self, config, path: str):
+        self.config = config
+        self.path = path
+        self.durations = defaultdict(float)
+        self.not_passed = set()
+        self.run_id = None
+        self.found = []
+
+    def _environment(self) -> str:
+        base_url = self.config.getoption("base_url", default=None) or self.config.getini("base_url")
+        return history.current_environment(base_url or "local")
+
+    def pytest_runtest_logreport(self, report):
+        if is_worker(self.config):
+            return
+        self.durations[report.nodeid] += report.duration
+        if not report.passed:
+            self.not_passed.add(report.nodeid)
+
+    @pytest.hookimpl(trylast=True)   # после plugins/step_timing.py (ги собира записите од workers)
+    def pytest_sessionfinish(self, session):
+        if is_worker(self.config):
+            return
+        durations = {n: d for n, d in self.durations.items() if n not in self.not_passed}
+        timing = self.config.pluginmanager.get_plugin("step-timing")
+        # само успешните чекори – истечен timeout не е „траење“ (perf/timeouts.py)
+        step_rows = step_timing.summarize(r for r in timing.records if r["ok"]) if timing else []
+        if not durations and not step_rows:
+            return
+        environment = self._environment()
+        with history.HistoryDB(self.path) as db:
+            self.run_id = db.add_run("pytest", history.pytest_samples(durations, step_rows), environment,
+                                     label=self.config.getoption("markexpr", default="") or "")
+            self.found = [r for r in history.regressions(db, environment=environment)
+                          if r.since_run == self.run_id]
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.run_id is None:
+            return
+        tr = terminalreporter
+        tr.write_sep("=", "performance history")
+        tr.write_line(f"run {self.run_id} recorded in {self.path}")
+        for regression in self.found:
+            tr.write_line(history.format_regression(regression))
+        if not self.found:
+            tr.write_line("no significant slowdowns against previous runs")
+
+
+def pytest_configure(config):
+    path = config.getoption("perf_history")
+    if path:
+        config.pluginmanager.register(HistoryPlugin(config, path), "perf-history")
@@ -0,0 +1,76 @@
+# plugins/page_budgets.py
+"""`pytest --perf-budgets warn|fail` – метриките се закачуваат како
+user_properties["page_metrics"], а на крај има табела по рута.
+"""
+
+import statistics
+from collections import defaultdict
+
+import pytest
+
+from perf import page_metrics
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf-budgets", "page load performance budgets")
+    group.addoption("--perf-budgets", choices=page_metrics.MODES, default=None,
+                    help="collect page load metrics on every MainPage navigation and warn/fail on budget breaches")
+    group.addoption("--perf-budgets-file", default=None,
+                    help=f"budgets JSON (default: {page_metrics.DEFAULT_BUDGETS_FILE.name} next to perf/page_metrics.py)")
+    parser.addini("perf_budgets", default="off", help="default for --perf-budgets (off/warn/fail)")
+
+
+class PageBudgetsPlugin:
+    def __init__(self, collector):
+        self.collector = collector
+        self.by_route = defaultdict(list)
+
+    def pytest_runtest_setup(self, item):
+        self.collector.start_test()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        yield
+        if call.when == "teardown":
+            records = self.collector.reset()
+            if records:
+                item.user_properties.append(("page_metrics", records))
+
+    def pytest_runtest_logreport(self, report):
+        # на controller-от (и со xdist) – од user_properties на извештајот
+        if report.when != "teardown":
+            return
+        for name, records in report.user_properties:
+            if name == "page_metrics":
+                for record in records:
+                    self.by_route[record["route"]].append(record)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.by_route:
+            return
+        tr = terminalreporter
+        tr.write_sep("=", f"page load metrics (budgets: {self.collector.mode})")
+        tr.write_line(f"{'route':<14}{'loads':>6}{'ttfb':>8}{'fcp':>8}{'lcp':>8}{'load':>8}{'breaches':>10}")
+        for route, records in sorted(self.by_route.items()):
+            def _p50(metric):
+                values = [r[metric] for r in records if r.get(metric) is not None]
+                return f"{statistics.median(values):.0f}" if values else "-"
+            breaches = sum(bool(r["violations"]) for r in records)
+            tr.write_line(
+                f"{route:<14}{len(records):>6}{_p50('ttfb'):>8}{_p50('fcp'):>8}"
+                f"{_p50('lcp'):>8}{_p50('load'):>8}{breaches:>10}"
+            )
+
+    def pytest_unconfigure(self, config):
+        page_metrics.disable()
+
+
+def pytest_configure(config):
+    mode = config.getoption("perf_budgets") or config.getini("perf_budgets")
+    if mode == "off":
+        return
+    collector = page_metrics.PageMetricsCollector(
+        page_metrics.load_budgets(config.getoption("perf_budgets_file")), mode
+    )
+    page_metrics.enable(collector)
+    config.pluginmanager.register(PageBudgetsPlugin(collector), "page-budgets")
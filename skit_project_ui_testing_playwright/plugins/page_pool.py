@@ -0,0 +1,153 @@
+# plugins/page_pool.py
+"""Fixture `warm_main` над perf/page_pool.py – `warm_main("contact")` → MainPage на
+топла страница; `--page-pool N` страници по рута и routing профил (0 = ладни).
+--screenshot/--tracing важат и тука; со --har/--video страниците се ладни.
+"""
+
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+from pages.main_page import MainPage
+from perf.page_pool import DEFAULT_SIZE, ROUTES, PagePool
+from plugins.workers import WorkerResults, add_counts, is_worker
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("page-pool", "pre-navigated pages for UI tests")
+    group.addoption("--page-pool", type=int, default=DEFAULT_SIZE, metavar="N",
+                    help="warm pages kept per route for the warm_main fixture (0 = always cold)")
+
+CALL_REPORT = pytest.StashKey()      # call извештајот – warm_main при teardown знае дали тестот паднал
+
+
+class PagePoolPlugin(WorkerResults):
+    output_key = "page_pool"
+
+    def __init__(self, config):
+        self.config = config
+        self.pools = []
+        self.stats = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        if call.when == "call":
+            item.stash[CALL_REPORT] = outcome.get_result()
+
+    def local(self):
+        stats = {}
+        for pool in self.pools:
+            add_counts(stats, pool.stats)
+        return stats
+
+    def merge(self, data) -> None:
+        add_counts(self.stats, data)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        hits, misses = self.stats.get("hits", 0), self.stats.get("misses", 0)
+        if is_worker(self.config) or not hits + misses:
+            return
+        tr = terminalreporter
+        tr.write_sep("=", f"page pool ({self.config.getoption('page_pool')} per route)")
+        line = f"warm checkouts: {hits}, avg wait {self.stats['wait'] / max(hits, 1):.3f}s"
+        if misses:
+            line += f" | cold: {misses}, avg {self.stats['cold'] / misses:.3f}s"
+        tr.write_line(line + f" | discarded: {self.stats.get('discarded', 0)}")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(PagePoolPlugin(config), "page-pool")
+
+
+@pytest.fixture(scope="session")
+def page_pool(pytestconfig, browser, browser_context_args, base_url, context_routing):
+    """Factory: `page_pool(profile)` → PagePool за routing профилот (се креира при прво барање)."""
+    plugin = pytestconfig.pluginmanager.get_plugin("page-pool")
+    pools = {}
+
+    def get(profile) -> PagePool:
+        if profile.name not in pools:
+            pools[profile.name] = PagePool(
+                lambda: context_routing.apply(browser.new_context(**browser_context_args), profile),
+                base_url, size=pytestconfig.getoption("page_pool"))
+            plugin.pools.append(pools[profile.name])
+        return pools[profile.name]
+
+    yield get
+    for pool in pools.values():
+        pool.close()
+
+
+def _cold_only(request) -> bool:
+    """Context-от мора да е нов за тестот: HAR по тест, видео или marker со context args."""
+    config = request.config
+    return bool(config.getoption("har", default=None)
+                or config.getoption("video", default="off") != "off"
+                or request.node.get_closest_marker("browser_context_args"))
+
+
+def _keep(option: str, failed: bool) -> bool:
+    """--screenshot/--tracing вредност → дали artifact-от се чува (како кај `page`)."""
+    return option == "on" or (failed and option in ("only-on-failure", "retain-on-failure"))
+
+
+def _save_artifacts(request, output_path: str, pages) -> None:
+    """Screenshot/trace од топлите страници пред ресетот, во `output_path` на тестот."""
+    config = request.config
+    report = request.node.stash.get(CALL_REPORT, None)
+    failed = report is None or report.failed            # без call извештај – setup паднал
+    screenshot, tracing = config.getoption("screenshot"), config.getoption("tracing")
+    for index, page in enumerate(pages, start=1):
+        suffix = "" if len(pages) == 1 else f"-{index}"
+        try:
+            if _keep(screenshot, failed):
+                path = Path(output_path) / f"test-{'failed' if failed else 'finished'}{suffix}.png"
+                page.screenshot(path=path, timeout=5000, full_page=config.getoption("full_page_screenshot"))
+                request.node.user_properties.append(("playwright_screenshot", str(path)))
+            if tracing == "off":
+                continue
+            if _keep(tracing, failed):
+                path = Path(output_path) / f"trace{suffix}.zip"
+                page.context.tracing.stop(path=path)
+                request.node.user_properties.append(("playwright_trace", str(path)))
+            else:
+                page.context.tracing.stop()
+        except PlaywrightError:
+            pass                                         # страницата паднала – checkin ја фрла
+
+
+@pytest.fixture
+def warm_main(request, base_url, routing_profile, output_path):
+    """Factory: `warm_main("contact")` → MainPage на веќе вчитана рута
+    (home/booking/contact/admin). Страниците се враќаат во pool-от по тестот.
+    Со --har/--video context-ите се по тест → обична, ладна страница."""
+    if _cold_only(request):
+        new_context = request.getfixturevalue("new_context")
+
+        def cold(route: str) -> MainPage:
+            page = new_context().new_page()
+            page.goto(f"{base_url}{ROUTES[route]}")
+            page.wait_for_load_state("domcontentloaded")
+            return MainPage(page, base_url)
+
+        yield cold
+        return
+
+    pool = request.getfixturevalue("page_pool")(routing_profile)
+    tracing = request.config.getoption("tracing") != "off"
+    taken = []
+
+    def checkout(route: str) -> MainPage:
+        page = pool.checkout(route)
+        taken.append((page, route))
+        if tracing:
+            page.context.tracing.start(title=request.node.nodeid, screenshots=True,
+                                       snapshots=True, sources=True)
+        return MainPage(page, base_url)
+
+    yield checkout
+    _save_artifacts(request, output_path, [page for page, _ in taken if not page.is_closed()])
+    for page, route in taken:
+        pool.checkin(page, route)
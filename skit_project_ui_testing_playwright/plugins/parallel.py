@@ -0,0 +1,125 @@
+# plugins/parallel.py
+"""`pytest -n N` со редослед „најдолгите прво“ (LPT): траењата по тест се паметат
+во pytest cache (`perf/durations`), а на крај има извештај за забрзувањето
+наспроти последниот сериски run со истите тестови (`suite_key`).
+"""
+
+import hashlib
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+import pytest
+
+from plugins.workers import is_worker
+
+DURATIONS_KEY = "perf/durations"
+SERIAL_RUN_KEY = "perf/serial_runs"    # suite_key → последниот сериски run
+EMA_ALPHA = 0.5   # тежина на последниот run во измазнетото траење
+SERIAL_RUNS_KEPT = 20
+
+
+def merge_durations(previous: Dict[str, float], current: Dict[str, float],
+                    alpha: float = EMA_ALPHA) -> Dict[str, float]:
+    """EMA по тест; тестовите што не беа во овој run ја задржуваат старата вредност."""
+    merged = dict(previous)
+    for nodeid, seconds in current.items():
+        old = previous.get(nodeid)
+        merged[nodeid] = seconds if old is None else alpha * seconds + (1 - alpha) * old
+    return merged
+
+
+def order_longest_first(nodeids: Iterable[str], durations: Dict[str, float]) -> List[str]:
+    """
+    Подредување најдолгите прво. Непознатите (нови) тестови добиваат медијана
+    од познатите. Редоследот е детерминистички – сите xdist workers мора да
+    добијат ИСТА листа за да не пукне колекцијата.
+    """
+    nodeids = list(nodeids)
+    known = [durations[n] for n in nodeids if n in durations]
+    default = statistics.median(known) if known else 0.0
+    return sorted(nodeids, key=lambda n: (-durations.get(n, default), n))
+
+
+def suite_key(nodeids: Iterable[str]) -> str:
+    """Отпечаток на множеството тестови (редоследот не е битен)."""
+    return hashlib.sha1("\n".join(sorted(set(nodeids))).encode()).hexdigest()[:16]
+
+
+def _workers(config) -> int:
+    n = config.getoption("numprocesses", default=None)
+    return n if isinstance(n, int) else 0
+
+
+class DurationScheduler:
+    def __init__(self, config):
+        self.config = config
+        self.cache = getattr(config, "cache", None)   # нема го со -p no:cacheprovider
+        self.previous: Dict[str, float] = self.cache.get(DURATIONS_KEY, {}) if self.cache else {}
+        self.current: Dict[str, float] = defaultdict(float)
+        self.started = time.perf_counter()
+        self.wall: Optional[float] = None
+
+    def pytest_sessionstart(self, session):
+        self.started = time.perf_counter()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        # само xdist workers; сериски run-от го задржува редоследот од фајловите
+        if not is_worker(config) or config.getoption("no_duration_order"):
+            return
+        rank = {n: i for i, n in enumerate(order_longest_first([i.nodeid for i in items], self.previous))}
+        items.sort(key=lambda item: rank[item.nodeid])
+
+    def pytest_runtest_logreport(self, report):
+        # во паралелен режим извештаите од workers стигнуваат и до controller-от
+        if not is_worker(self.config):
+            self.current[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        if is_worker(self.config) or self.cache is None or not self.current:
+            return
+        self.wall = time.perf_counter() - self.started
+        self.cache.set(DURATIONS_KEY, merge_durations(self.previous, self.current))
+        if not _workers(self.config):
+            runs = self.cache.get(SERIAL_RUN_KEY, {})
+            runs.pop(suite_key(self.current), None)             # најновиот оди на крај
+            runs[suite_key(self.current)] = {"wall": self.wall, "tests": len(self.current)}
+            self.cache.set(SERIAL_RUN_KEY, dict(list(runs.items())[-SERIAL_RUNS_KEPT:]))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        workers = _workers(self.config)
+        if is_worker(self.config) or not workers or not self.wall:
+            return
+        serial_sum = sum(self.current.values())
+        tr = terminalreporter
+        tr.write_sep("=", "parallel run summary")
+        tr.write_line(f"workers: {workers}, wall time: {self.wall:.1f}s")
+        tr.write_line(
+            f"sum of test durations: {serial_sum:.1f}s -> speedup {serial_sum / self.wall:.2f}x "
+            f"(efficiency {serial_sum / self.wall / workers:.0%})"
+        )
+        runs = self.cache.get(SERIAL_RUN_KEY, {}) if self.cache else {}
+        last_serial = runs.get(suite_key(self.current))
+        if last_serial:
+            tr.write_line(
+                f"last serial run ({last_serial['tests']} tests): {last_serial['wall']:.1f}s "
+                f"-> speedup {last_serial['wall'] / self.wall:.2f}x"
+            )
+        if not self.previous:
+            tr.write_line("no recorded durations yet – next parallel run will order longest-first")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("parallel", "duration-aware parallel runs (pytest-xdist)")
+    group.addoption(
+        "--no-duration-order",
+        action="store_true",
+        default=False,
+        help="keep file order on xdist workers instead of longest-first by recorded durations",
+    )
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(DurationScheduler(config), "duration-scheduler")
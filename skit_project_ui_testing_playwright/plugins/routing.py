@@ -0,0 +1,82 @@
+# plugins/routing.py
+"""`pytest --routing-profile functional|full-fidelity` и
+`@pytest.mark.routing_profile(...)` за секој context од pytest-playwright и за
+warm_main; на крај – блокирани барања и заштедени bytes.
+"""
+
+import pytest
+
+from perf import page_metrics, routing
+from plugins.workers import WorkerResults, is_worker
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("routing", "resource blocking profiles")
+    group.addoption("--routing-profile", choices=sorted(routing.PROFILES), default=None,
+                    help="default routing profile for browser contexts "
+                         "(default: functional, full-fidelity with --perf-budgets)")
+    group.addoption("--resource-sizes-file", default=None,
+                    help=f"known resource sizes for the bytes-saved estimate (default: {routing.DEFAULT_SIZES_FILE})")
+
+
+class RoutingPlugin(WorkerResults):
+    output_key = "routing"
+
+    def __init__(self, config):
+        self.config = config
+        name = config.getoption("routing_profile")
+        if name is None:
+            name = "full-fidelity" if page_metrics.active() else "functional"
+        self.default = routing.get_profile(name)
+        option = config.getoption("resource_sizes_file")
+        self.sizes_file = config.rootpath / (option or routing.DEFAULT_SIZES_FILE)
+        self.stats = routing.RoutingStats.load(self.sizes_file)
+        self.total = routing.RoutingStats()      # controller: збир од сите workers
+        self.base_url = ""                       # го поставува fixture-от context_routing
+
+    def apply(self, context, profile=None):
+        return routing.apply(context, profile or self.default, self.stats, self.base_url)
+
+    def local(self):
+        return {**self.stats.as_dict(), "sizes": self.stats.sizes}
+
+    def merge(self, data) -> None:
+        self.total.merge(data)
+        self.stats.sizes.update(data.get("sizes", {}))
+
+    def merged(self) -> None:
+        # големините ги запишува само controller-от – workers не се газат во фајлот
+        if self.stats.sizes:
+            self.stats.save_sizes(self.sizes_file)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        total = self.total
+        if is_worker(self.config) or not total.blocked:
+            return
+        tr = terminalreporter
+        tr.write_sep("=", f"resource routing (default profile: {self.default.name})")
+        reasons = ", ".join(f"{reason} {count}" for reason, count in total.blocked.most_common())
+        tr.write_line(f"blocked requests: {sum(total.blocked.values())} ({reasons})")
+        line = f"bytes saved: {total.saved_bytes / 1024:.1f} KiB"
+        if total.unknown:
+            line += f" (+{total.unknown} requests of unknown size – run a full-fidelity test to learn them)"
+        tr.write_line(line)
+
+
+@pytest.hookimpl(trylast=True)          # по page_budgets – треба page_metrics.active()
+def pytest_configure(config):
+    config.addinivalue_line("markers", "routing_profile(name): routing profile for this test's browser contexts")
+    config.pluginmanager.register(RoutingPlugin(config), "routing")
+
+
+@pytest.fixture(scope="session")
+def context_routing(pytestconfig, base_url) -> RoutingPlugin:
+    plugin = pytestconfig.pluginmanager.get_plugin("routing")
+    plugin.base_url = base_url
+    return plugin
+
+
+@pytest.fixture
+def routing_profile(request, context_routing) -> routing.RoutingProfile:
+    marker = request.node.get_closest_marker("routing_profile")
+    return routing.get_profile(marker.args[0]) if marker else context_routing.default
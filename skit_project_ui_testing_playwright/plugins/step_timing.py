@@ -0,0 +1,81 @@
+# plugins/step_timing.py
+"""`pytest --step-timing` – JSON со сите чекори во .perf/step-timings/ и табела
+со најбавните чекори на крај.
+"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from perf import step_timing
+from plugins.workers import WorkerResults, is_worker
+
+DEFAULT_DIR = Path(".perf") / "step-timings"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("step-timing", "per-step MainPage timings")
+    group.addoption("--step-timing", action="store_true", default=False,
+                    help="time every MainPage step and write a per-run JSON report")
+    group.addoption("--step-timing-file", default=None,
+                    help=f"output JSON path (default: {DEFAULT_DIR}/run-<timestamp>.json)")
+    group.addoption("--step-timing-top", type=int, default=10,
+                    help="slowest steps shown in the terminal summary")
+
+
+class StepTimingPlugin(WorkerResults):
+    output_key = "step_timings"
+
+    def __init__(self, config):
+        self.config = config
+        self.recorder = step_timing.enable()
+        self.records = []          # на controller-от: и записите од workers
+        self.started = time.time()
+        self.path = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self.recorder.test = item.nodeid
+        yield
+        self.recorder.test = None
+
+    def local(self):
+        return self.recorder.records
+
+    def merge(self, data) -> None:
+        self.records.extend(data)
+
+    def merged(self) -> None:
+        option = self.config.getoption("step_timing_file")
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+        self.path = Path(option) if option else Path(self.config.rootpath) / DEFAULT_DIR / f"run-{stamp}.json"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({
+            "started": self.started,
+            "finished": time.time(),
+            "steps": self.records,
+            "summary": step_timing.summarize(self.records),
+        }, indent=1, ensure_ascii=False), encoding="utf-8")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if is_worker(self.config) or not self.records:
+            return
+        tr = terminalreporter
+        tr.write_sep("=", "slowest MainPage steps")
+        tr.write_line(f"{'step':<34}{'count':>7}{'p50 s':>9}{'p95 s':>9}{'max s':>9}{'total s':>10}")
+        for row in step_timing.summarize(self.records)[: self.config.getoption("step_timing_top")]:
+            tr.write_line(
+                f"{row['step']:<34}{row['count']:>7}{row['p50']:>9.3f}{row['p95']:>9.3f}"
+                f"{row['max']:>9.3f}{row['total']:>10.2f}"
+            )
+        tr.write_line(f"step timings written to {self.path}")
+
+    def pytest_unconfigure(self, config):
+        step_timing.disable()
+
+
+def pytest_configure(config):
+    if config.getoption("step_timing"):
+        config.pluginmanager.register(StepTimingPlugin(config), "step-timing")
@@ -0,0 +1,69 @@
+# plugins/timeouts.py
+"""`pytest --adaptive-timeouts[=PATH]` – MainPage timeouts од p99 во историјата
+(`--perf-history --step-timing`) и табела со користените на крај.
+"""
+
+from perf import history, timeouts
+from plugins.workers import WorkerResults, is_worker
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("adaptive-timeouts", "timeouts learned from recorded step durations")
+    group.addoption("--adaptive-timeouts", nargs="?", const=str(history.DEFAULT_PATH), default=None,
+                    metavar="PATH", help="derive MainPage timeouts from step p99 in this history DB "
+                                         f"(default: {history.DEFAULT_PATH}); hard-coded values stay the cap")
+    group.addoption("--timeout-factor", type=float, default=timeouts.DEFAULT_FACTOR,
+                    help="safety factor applied to the recorded p99")
+    group.addoption("--timeout-floor-ms", type=float, default=timeouts.DEFAULT_FLOOR_MS,
+                    help="never go below this timeout")
+
+
+def _environment(config) -> str:
+    base_url = config.getoption("base_url", default=None) or config.getini("base_url")
+    return history.current_environment(base_url or "local")
+
+
+class AdaptiveTimeoutsPlugin(WorkerResults):
+    output_key = "adaptive_timeouts"
+
+    def __init__(self, config, policy: timeouts.TimeoutPolicy):
+        self.config = config
+        self.policy = policy
+        self.used = {}
+
+    def local(self):
+        return self.policy.used
+
+    def merge(self, data) -> None:
+        self.used.update(data)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if is_worker(self.config):
+            return
+        tr = terminalreporter
+        tr.write_sep("=", f"adaptive timeouts (p99 x {self.policy.factor:g}, {len(self.policy.p99_ms)} steps known)")
+        if not self.used:
+            tr.write_line("no adapted step was used – record history first (--perf-history --step-timing)")
+            return
+        tr.write_line(f"{'step':<34}{'p99 ms':>9}{'timeout':>9}{'cap':>9}")
+        for step, (value, cap) in sorted(self.used.items()):
+            tr.write_line(f"{step:<34}{self.policy.p99_ms.get(step, 0):>9.0f}{value:>9}{cap:>9}")
+        capped = sum(cap for _, cap in self.used.values()) / 1000
+        adapted = sum(value for value, _ in self.used.values()) / 1000
+        tr.write_line(f"worst-case wait per pass over these steps: {capped:.1f}s -> {adapted:.1f}s")
+
+    def pytest_unconfigure(self, config):
+        timeouts.disable()
+
+
+def pytest_configure(config):
+    path = config.getoption("adaptive_timeouts")
+    if not path:
+        return
+    with history.HistoryDB(path) as db:
+        policy = timeouts.TimeoutPolicy.from_history(
+            db, _environment(config), factor=config.getoption("timeout_factor"),
+            floor_ms=config.getoption("timeout_floor_ms"),
+        )
+    timeouts.enable(policy)
+    config.pluginmanager.register(AdaptiveTimeoutsPlugin(config, policy), "adaptive-timeouts")
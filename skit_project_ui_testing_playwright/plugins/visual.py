@@ -0,0 +1,94 @@
+# plugins/visual.py
+"""Fixture `visual_check(route, viewport=None)` над perf/visual.py – `pytest -m visual`
+споредува, `--visual-update` запишува baseline-и (commit-ирај ги); без baseline → skip.
+"""
+
+import pytest
+
+from perf import visual
+from plugins.workers import WorkerResults, is_worker
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("visual", "visual regression checks")
+    group.addoption("--visual-baselines", default=None,
+                    help=f"directory with baseline screenshots (default: {visual.DEFAULT_BASELINE_DIR})")
+    group.addoption("--visual-update", action="store_true", default=False,
+                    help="write baseline screenshots (new or changed) instead of comparing")
+    group.addoption("--visual-masks-file", default=None,
+                    help=f"per-route visual masks (default: {visual.DEFAULT_MASKS_FILE})")
+    group.addoption("--visual-max-distance", type=int, default=4,
+                    help="max perceptual hash distance (0-64, default: 4)")
+    group.addoption("--visual-max-changed", type=float, default=0.002,
+                    help="max ratio of changed 16px blocks (default: 0.002)")
+
+
+class VisualPlugin(WorkerResults):
+    output_key = "visual"
+
+    def __init__(self, config):
+        self.config = config
+        baselines = config.getoption("visual_baselines")
+        self.store = visual.VisualStore(
+            baseline_dir=config.rootpath / (baselines or visual.DEFAULT_BASELINE_DIR),
+            cache_file=config.rootpath / visual.DEFAULT_CACHE_FILE,
+            max_distance=config.getoption("visual_max_distance"),
+            max_changed_ratio=config.getoption("visual_max_changed"),
+            update=config.getoption("visual_update"),
+        )
+        self.masks = visual.load_masks(config.getoption("visual_masks_file"))
+        self.results = []                        # controller: од сите workers
+
+    def local(self):
+        if self.store.results:
+            self.store.save_cache()
+        return [list(r) for r in self.store.results]
+
+    def merge(self, data) -> None:
+        self.results.extend(visual.VisualDiff(*row) for row in data)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if is_worker(self.config) or not self.results:
+            return
+        tr = terminalreporter
+        tr.write_sep("=", "visual regression")
+        by_source = {}
+        for result in self.results:
+            by_source.setdefault(result.source, []).append(result)
+        compared = by_source.get("compared", [])
+        skipped = len(by_source.get("cache", [])) + len(by_source.get("identical", []))
+        line = f"screenshots: {len(self.results)}, compared: {len(compared)}, skipped by hash: {skipped}"
+        if by_source.get("new-baseline"):
+            line += f", new baselines: {len(by_source['new-baseline'])}"
+        tr.write_line(line)
+        if compared:
+            ms = sum(r.elapsed_ms for r in compared) / len(compared)
+            tr.write_line(f"avg compare: {ms:.1f} ms (decode + phash + block diff)")
+        for result in self.results:
+            if not result.passed:
+                tr.write_line(f"FAILED {visual.describe(result)}", red=True)
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "visual: screenshot comparison against a baseline (perf/visual.py)")
+    config.pluginmanager.register(VisualPlugin(config), "visual")
+
+
+@pytest.fixture
+def visual_check(pytestconfig, page):
+    """check(route, viewport=None) → VisualDiff; паѓа ако сликата отстапува од baseline-от."""
+    plugin = pytestconfig.pluginmanager.get_plugin("visual")
+
+    def _check(route: str, viewport: str = None) -> visual.VisualDiff:
+        masks = plugin.masks.get(route, {})
+        size = page.viewport_size or {}
+        key = f"{route}-{viewport or '{width}x{height}'.format(**size)}"
+        if not plugin.store.update and not plugin.store.has_baseline(key):
+            pytest.skip(f"no visual baseline for {key} (record it with --visual-update)")
+        png = page.screenshot(animations="disabled", caret="hide", scale="css",
+                              mask=[page.locator(s) for s in masks.get("selectors", [])])
+        result = plugin.store.compare(key, png, rects=masks.get("rects", ()))
+        assert result.passed, visual.describe(result)
+        return result
+
+    return _check
@@ -0,0 +1,44 @@
+# plugins/workers.py
+"""Резултати на perf plugin-ите со pytest-xdist: секој worker ги праќа преку
+`workeroutput`, а controller-от ги спојува со своите (без xdist – само своите)."""
+
+
+def is_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def add_counts(total: dict, counts: dict) -> dict:
+    """Збир по клуч (in place) – за бројачи и секунди."""
+    for key, value in counts.items():
+        total[key] = total.get(key, 0) + value
+    return total
+
+
+class WorkerResults:
+    """Mixin за plugin со `self.config`: `output_key`, `local()` – резултатите на
+    овој процес, `merge(data)` – спојување на controller-от, `merged()` – по
+    спојувањето на сите (на пр. запишување фајл)."""
+
+    output_key = ""
+
+    def local(self):
+        raise NotImplementedError
+
+    def merge(self, data) -> None:
+        raise NotImplementedError
+
+    def merged(self) -> None:
+        pass
+
+    def pytest_testnodedown(self, node, error):
+        data = getattr(node, "workeroutput", {}).get(self.output_key)
+        if data is not None:
+            self.merge(data)
+
+    def pytest_sessionfinish(self, session):
+        data = self.local()
+        if is_worker(self.config):
+            self.config.workeroutput[self.output_key] = data
+            return
+        self.merge(data)
+        self.merged()
@@ -0,0 +1,156 @@
+# tests/conftest.py
+import os, sys
+
+import pytest
+
+# Додај го root директориумот (еден кат погоре од tests/) во sys.path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from mocks import ShadyMeadowsServer
+from pages.main_page import MainPage
+from perf.feeders import Feeder, GeneratedSource, contact_record, guest_record, worker_shard
+from perf.slots import Slot, SlotAllocator, site_occupancy, site_rooms
+
+pytest_plugins = [
+    "plugins.parallel",
+    "plugins.step_timing",
+    "plugins.page_budgets",
+    "plugins.history",
+    "plugins.timeouts",
+    "plugins.page_pool",
+    "plugins.routing",
+    "plugins.har",
+    "plugins.visual",
+    "plugins.cpu_profile",
+]
+
+
+@pytest.fixture(scope="session")
+def base_url(pytestconfig):
+    """
+    Адреса на сајтот што се тестира.
+
+    - `pytest --base-url https://automationintesting.online` → live демото.
+    - Без опција → локалниот stand-in (mocks/shady_meadows.py) во истиот процес,
+      без мрежа; секој pytest процес добива своја порта.
+    """
+    url = pytestconfig.getoption("base_url", default=None) or pytestconfig.getini("base_url")
+    if url:
+        yield url.rstrip("/")
+        return
+    with ShadyMeadowsServer() as site:
+        yield site.url
+
+
+@pytest.fixture
+def new_context(new_context, context_routing, routing_profile, har_test):
+    """pytest-playwright new_context + routing профилот на тестот (perf/routing.py):
+    стандардно "functional", а `@pytest.mark.routing_profile("full-fidelity")`
+    за тестови што проверуваат изглед. Со `--har` и HAR снимање/replay
+    (perf/har.py) – replay route-от е прв, па блокираното не се бара во архивата."""
+    def _new_context(**kwargs):
+        if har_test is None:
+            return context_routing.apply(new_context(**kwargs), routing_profile)
+        context = har_test.attach(new_context(**har_test.context_args(), **kwargs))
+        return context_routing.apply(context, routing_profile)
+    return _new_context
+
+
+# ============================ ADMIN SESSION ==================================
+# Login преку формата се прави ЕДНАШ по pytest процес (по xdist worker), а
+# cookies/localStorage се зачувуваат во storage_state JSON. Тестовите што
+# треба само да се „внатре“ во админ добиваат context што е веќе најавен;
+# само тестовите за самата login форма (test_login_admin.py) го плаќаат
+# round trip-от низ формата.
+
+@pytest.fixture(scope="session")
+def admin_storage_state(browser, browser_context_args, base_url, tmp_path_factory, har_archive) -> str:
+    recording = har_archive.test("session__admin_storage_state") if har_archive else None
+    context = browser.new_context(**browser_context_args, **(recording.context_args() if recording else {}))
+    if recording:
+        recording.attach(context)
+    try:
+        MainPage(context.new_page(), base_url).login_as_admin()
+        path = tmp_path_factory.mktemp("auth") / "admin_state.json"
+        context.storage_state(path=str(path))
+    finally:
+        context.close()
+        if recording:
+            recording.finish()
+    return str(path)
+
+
+@pytest.fixture
+def admin_context(new_context, admin_storage_state):
+    """Нов (изолиран) context со веќе најавен admin. НЕ прави logout во него –
+    тоа би го поништило токенот за сите следни тестови во процесот."""
+    return new_context(storage_state=admin_storage_state)
+
+
+@pytest.fixture
+def admin_page(admin_context):
+    return admin_context.new_page()
+
+
+# =============================== TEST DATA ===================================
+# Свежи валидни податоци по тест (perf/feeders.py) наместо ист hard-coded
+# гостин/порака: секој xdist worker го зема својот shard од генераторот, па
+# е-поштите/имињата не се повторуваат меѓу паралелни тестови.
+
+@pytest.fixture(scope="session")
+def contact_feeder() -> Feeder:
+    return Feeder(GeneratedSource(contact_record), shard=worker_shard())
+
+
+@pytest.fixture(scope="session")
+def guest_feeder() -> Feeder:
+    return Feeder(GeneratedSource(guest_record), shard=worker_shard())
+
+
+@pytest.fixture
+def contact_data(contact_feeder) -> dict:
+    """Валидна contact порака (name, email, phone, subject, description)."""
+    return next(contact_feeder)
+
+
+@pytest.fixture
+def booking_guest(guest_feeder) -> dict:
+    """Валиден гостин за /reservation формата (firstname, lastname, email, phone)."""
+    return next(guest_feeder)
+
+
+# ============================== BOOKING SLOTS ================================
+# Секој booking тест добива своја соба + датуми (perf/slots.py). Lease
+# фајловите се во заеднички директориум за сите xdist workers, а зафатените
+# ноќи се читаат од сајтот → без 409/timeout и при повторен run на live демо.
+
+@pytest.fixture(scope="session")
+def slot_allocator(base_url, tmp_path_factory, har_archive) -> SlotAllocator:
+    root = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        root = root.parent          # basetemp е по worker; родителот е заеднички
+    owner = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    if har_archive is not None and har_archive.mode == "replay":
+        # HAR replay: без live барања до сајтот – слотовите доаѓаат од meta.json
+        return SlotAllocator(root / "booking-slots", [1], owner=owner)
+    return SlotAllocator(root / "booking-slots", site_rooms(base_url) or [1],
+                         occupied=site_occupancy(base_url), owner=owner)
+
+
+@pytest.fixture
+def booking_slot(slot_allocator, har_test) -> Slot:
+    """Слот за тестот; по тестот се враќа, освен ако на сајтот навистина е
+    направена резервација (тогаш lease-от останува – ноќите се зафатени).
+    Со --har record слотот се снима, а --har replay го враќа истиот."""
+    pinned = har_test.pinned_slot() if har_test else None
+    if pinned is not None:
+        yield pinned
+        return
+    slot = slot_allocator.acquire()
+    if har_test:
+        har_test.pin_slot(slot)
+    yield slot
+    if not slot_allocator.booked(slot):
+        slot_allocator.release(slot)
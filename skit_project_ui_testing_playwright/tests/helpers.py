@@ -0,0 +1,148 @@
+# tests/helpers.py
+"""Заеднички помошни функции за unit тестовите (без browser)."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from playwright.sync_api import Error as PlaywrightError
+
+
+def run_async(coro):
+    """
+    asyncio.run во посебна нишка (како perf/ui_runner.run_scenarios_blocking):
+    откако sync Playwright (pytest-playwright) ќе стартува во сесијата, главната
+    нишка има event loop што работи и директен asyncio.run паѓа – резултатот
+    би зависел од редоследот на тестовите.
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+@contextmanager
+def activated(module, value=None):
+    """
+    Привремено го менува глобалниот објект на perf модул со enable/disable/
+    active (step_timing, page_metrics, cpu_profile); None → исклучено.
+    На крај се враќа претходната состојба (на пр. од --step-timing).
+    """
+    previous = module.active()
+    if value is None:
+        module.disable()
+    else:
+        module.enable(value)
+    try:
+        yield value
+    finally:
+        if previous is None:
+            module.disable()
+        else:
+            module.enable(previous)
+
+
+class FakeContext:
+    """
+    Доволно од sync BrowserContext за perf модулите: `log` ги бележи повиците
+    (заеднички со страниците), `routes`/`handlers` – route и on, `cdp` – CDP
+    сесијата (None → како Firefox/WebKit).
+    """
+
+    def __init__(self, log=None, cdp=None):
+        self.log = [] if log is None else log
+        self.cdp = cdp
+        self.closed = False
+        self.routes = []
+        self.handlers = {}
+
+    def new_page(self):
+        return FakePage(self)
+
+    def route(self, pattern, handler):
+        self.routes.append(handler)
+
+    def unroute_all(self, behavior=None):
+        self.routes.clear()
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def clear_cookies(self):
+        self.log.append("clear_cookies")
+
+    def clear_permissions(self):
+        pass
+
+    def new_cdp_session(self, page):
+        if self.cdp is None:
+            raise RuntimeError("CDP session is only supported in Chromium")
+        return self.cdp
+
+    def close(self):
+        self.closed = True
+
+
+class FakePage:
+    """Доволно од sync Page: `evaluate` ги враќа `metrics`, `broken` → срушена страница."""
+
+    def __init__(self, context=None, metrics=None):
+        self.context = FakeContext() if context is None else context
+        self.log = self.context.log
+        self.metrics = metrics or {}
+        self.viewport_size = {"width": 1280, "height": 720}
+        self.broken = False
+        self.states = []
+
+    def goto(self, url, wait_until="load"):
+        self.log.append((url, wait_until))
+
+    def wait_for_load_state(self, state):
+        self.states.append(state)
+        if self.broken:
+            raise PlaywrightError("Target crashed")
+
+    def is_closed(self):
+        return self.context.closed
+
+    def unroute_all(self, behavior=None):
+        pass
+
+    def evaluate(self, script):
+        self.log.append("evaluate")
+        return dict(self.metrics)
+
+    def set_viewport_size(self, size):
+        self.viewport_size = size
+
+
+class FakeRequest:
+    def __init__(self, url, method="GET", resource_type="fetch", post_data=None, failure=None):
+        self.url = url
+        self.method = method
+        self.resource_type = resource_type
+        self.post_data = post_data
+        self.failure = failure
+
+
+class FakeRoute:
+    """`outcome`: (status, headers, body) по fulfill, кодот по abort, "fallback"."""
+
+    def __init__(self, url, **request):
+        self.request = FakeRequest(url, **request)
+        self.outcome = None
+
+    def fulfill(self, status, headers, body):
+        self.outcome = (status, headers, body)
+
+    def abort(self, error_code=None):
+        self.outcome = error_code
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+
+class FakeResponse:
+    def __init__(self, request, status=200, headers=None):
+        self.request = request
+        self.url = request.url
+        self.status = status
+        self.headers = headers or {}
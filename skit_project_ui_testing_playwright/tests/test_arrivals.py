@@ -0,0 +1,126 @@
+# tests/test_arrivals.py
+import asyncio
+
+import pytest
+from perf.arrivals import (
+    TokenBucket,
+    at_once_users,
+    constant_users_per_sec,
+    nothing_for,
+    parse_profile,
+    ramp_users_per_sec,
+    reach_rps,
+    run_profile,
+    spike,
+    stepped,
+)
+from tests.helpers import run_async
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class _VirtualTime(_Clock):
+    """clock + sleep за run_profile: sleep го поместува времето веднаш и само
+    го отстапува event loop-от – распоредот не зависи од оптовареноста на машината."""
+
+    async def sleep(self, delay):
+        self.now += max(delay, 0.0)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.perf
+def test_profiles_count_and_timing():
+    assert list(constant_users_per_sec(2, 3).arrivals()) == [0, 0.5, 1, 1.5, 2, 2.5]
+    assert list(at_once_users(3).arrivals()) == [0, 0, 0]
+
+    ramp = ramp_users_per_sec(0, 10, 30)           # N(t) = t²/6 → 150 корисници
+    assert ramp.total == 150
+    assert ramp.time_of(150 / 4) == pytest.approx(15)
+
+    steps = stepped(2, 2, levels=3, level_during=10)
+    assert steps.total == 2 * 10 + 4 * 10 + 6 * 10
+    assert steps.cumulative(15) == pytest.approx(20 + 4 * 5)
+
+    burst = spike(1, 50, during=60, spike_at=30, spike_during=2)
+    assert burst.total == 30 + 100 + 28
+    assert burst.time_of(30) == pytest.approx(30)
+
+
+@pytest.mark.perf
+def test_profiles_chain_and_parse():
+    chained = nothing_for(5) + constant_users_per_sec(1, 2)
+    assert list(chained.arrivals()) == [5, 6]
+    assert list(parse_profile("nothing:5+constant:1:2").arrivals()) == [5, 6]
+    assert parse_profile("stepped:2:2:3:10").total == 120
+    with pytest.raises(ValueError):
+        parse_profile("sawtooth:1")
+
+
+@pytest.mark.perf
+def test_token_bucket_follows_reach_rps_ramp():
+    clock = _Clock()
+    bucket = TokenBucket(reach_rps(10, 30, 60), clock=clock)
+
+    assert bucket.reserve() == 100
+    # во ramp-от дозволите се ретки, потоа точно 10 во секунда
+    assert bucket.profile.time_of(150) == pytest.approx(30)
+    assert bucket.profile.time_of(160) - bucket.profile.time_of(150) == pytest.approx(1.0)
+    assert bucket.reserve() == pytest.approx(100 + 30 / 150 ** 0.5)
+
+
+@pytest.mark.perf
+def test_token_bucket_burst_and_unused_tokens_expire():
+    clock = _Clock()
+    bucket = TokenBucket(constant_users_per_sec(2, 100), burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [100, 100, 100, 100.5]
+    clock.now += 10   # 10 s мирување – во корпата има најмногу 3 токени
+    assert [bucket.reserve() for _ in range(4)] == [110, 110, 110, 110.5]
+
+
+@pytest.mark.perf
+def test_token_bucket_stops_at_profile_end():
+    clock = _Clock()
+    bucket = TokenBucket(constant_users_per_sec(2, 1), clock=clock)
+
+    assert [bucket.reserve() for _ in range(2)] == [100, 100.5]
+    assert bucket.reserve() is None
+
+
+@pytest.mark.perf
+def test_scheduler_keeps_absolute_schedule_at_high_rate():
+    clock = _VirtualTime()
+    started = []
+
+    async def on_arrival(index, intended):
+        started.append(intended - 100.0)
+
+    report = run_async(run_profile(constant_users_per_sec(4000, 0.5), on_arrival, clock=clock, sleep=clock.sleep))
+
+    assert report.arrivals == len(started) == 2000
+    assert started == pytest.approx([i / 4000 for i in range(2000)])    # без акумулирано поместување
+    assert report.late == 0 and report.lag.max == 0
+    assert report.elapsed == pytest.approx(1999 / 4000)
+
+
+@pytest.mark.perf
+def test_scheduler_absorbs_loop_stall_and_reports_lag():
+    clock = _VirtualTime()
+
+    async def on_arrival(index, intended):
+        if index == 10:
+            clock.now += 0.2   # блокира event loop-от 200 ms
+
+    report = run_async(run_profile(constant_users_per_sec(100, 1), on_arrival, clock=clock, sleep=clock.sleep))
+
+    assert report.arrivals == 100
+    assert report.lag.max >= 190
+    assert report.late == 20      # пристигнувањата 0.11 s – 0.30 s тргнуваат доцна
+    # распоредот не се помести за 200 ms – заостатокот се стигна
+    assert report.elapsed == pytest.approx(0.99)
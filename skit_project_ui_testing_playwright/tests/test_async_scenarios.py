@@ -0,0 +1,20 @@
+# tests/test_async_scenarios.py
+# =============================================================================
+# Повеќе сценарија истовремено во ЕДЕН процес (AsyncMainPage + perf/ui_runner).
+# Не го користат `page` fixture-от: runner-от си крева свој async browser.
+# =============================================================================
+
+import pytest
+from perf.ui_runner import SCENARIOS, run_scenarios_blocking
+
+
+@pytest.mark.contact
+def test_concurrent_contact_scenarios(base_url):
+    results = run_scenarios_blocking([("contact", SCENARIOS["contact"])] * 6, base_url, concurrency=6)
+    assert all(r.ok for r in results), [r.error for r in results if not r.ok]
+
+
+@pytest.mark.booking
+def test_concurrent_booking_scenarios(base_url):
+    results = run_scenarios_blocking([("booking", SCENARIOS["booking"])] * 4, base_url, concurrency=4)
+    assert all(r.ok for r in results), [r.error for r in results if not r.ok]
@@ -0,0 +1,114 @@
+# tests/test_cpu_profile.py
+import json
+
+import pytest
+from perf import cpu_profile
+from perf.cpu_profile import CpuProfiler, cpu_profiled, long_tasks, self_times, summarize
+from tests.helpers import FakeContext, FakePage, activated
+
+PROFILE = {
+    "nodes": [
+        {"id": 1, "callFrame": {"functionName": "(root)", "url": ""}},
+        {"id": 2, "callFrame": {"functionName": "renderCalendar", "url": "http://x/static/main.js", "lineNumber": 41}},
+        {"id": 3, "callFrame": {"functionName": "(idle)", "url": ""}},
+        {"id": 4, "callFrame": {"functionName": "renderCalendar", "url": "http://x/static/main.js", "lineNumber": 41}},
+        {"id": 5, "callFrame": {"functionName": "", "url": "http://x/static/vendor.js", "lineNumber": 0}},
+    ],
+    "samples": [2, 2, 3, 4, 5, 3],
+    "timeDeltas": [0, 1000, 1000, 9000, 2000, 3000],     # µs; семплот i трае timeDeltas[i + 1]
+}
+
+TRACE = [
+    {"ph": "M", "name": "thread_name", "pid": 1, "tid": 7, "args": {"name": "CrRendererMain"}},
+    {"ph": "M", "name": "thread_name", "pid": 1, "tid": 9, "args": {"name": "Compositor"}},
+    {"ph": "X", "name": "RunTask", "pid": 1, "tid": 7, "dur": 120000},
+    {"ph": "X", "name": "RunTask", "pid": 1, "tid": 7, "dur": 12000},      # кратка
+    {"ph": "X", "name": "RunTask", "pid": 1, "tid": 9, "dur": 90000},      # не е main thread
+]
+
+
+class FakeSession:
+    def __init__(self):
+        self.sent = []
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def send(self, method, params=None):
+        self.sent.append(method)
+        if method == "Profiler.stop":
+            return {"profile": PROFILE}
+        if method == "Tracing.end":
+            self.handlers["Tracing.dataCollected"]({"value": TRACE})
+            self.handlers["Tracing.tracingComplete"]({})
+        return {}
+
+    def detach(self):
+        self.sent.append("detach")
+
+
+@cpu_profiled
+class _FakeMainPage:
+    def __init__(self, session):
+        self.page = FakePage(FakeContext(cdp=session))
+
+    def set_dates(self):
+        return self.select_date()
+
+    def select_date(self):
+        return "done"
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    with activated(cpu_profile, CpuProfiler(["set_dates", "select_date"], out_dir=tmp_path, top=2)) as active:
+        yield active
+
+
+@pytest.mark.perf
+def test_self_time_merges_call_paths_and_long_tasks_use_main_thread():
+    assert [(f.function, f.location, f.self_ms) for f in self_times(PROFILE)] == [
+        ("renderCalendar", "main.js:42", 4.0),
+        ("(anonymous)", "vendor.js:1", 3.0),
+    ]
+    assert long_tasks(TRACE) == [120.0]
+
+
+@pytest.mark.perf
+def test_outer_action_is_profiled_and_raw_files_are_saved(profiler, tmp_path):
+    profiler.test = "tests/test_booking_flow.py::test_x"
+    session = FakeSession()
+    assert _FakeMainPage(session).set_dates() == "done"
+
+    [record] = profiler.take("tests/test_booking_flow.py::test_x")
+    assert record.action == "set_dates" and record.busy_ms == 7.0 and record.long_tasks == [120.0]
+    assert session.sent.count("Profiler.start") == 1 and session.sent[-1] == "detach"   # вгнездената не
+    saved = json.loads(open(record.files[0], encoding="utf-8").read())
+    assert saved["samples"] == PROFILE["samples"] and record.files[1].endswith(".trace.json")
+    assert "renderCalendar" in cpu_profile.format_profile(record)
+
+    [row] = summarize([record.as_dict(), record.as_dict()])
+    assert (row["count"], row["long_tasks"], row["top"][0]) == (2, 2, (("renderCalendar", "main.js:42"), 8.0))
+
+
+@pytest.mark.perf
+def test_without_cdp_the_action_still_runs(profiler):
+    assert _FakeMainPage(None).set_dates() == "done"
+    assert profiler.records == [] and profiler.unsupported == 1
+    cpu_profile.disable()
+    assert _FakeMainPage(FakeSession()).set_dates() == "done"
+
+
+class ClosingSession(FakeSession):
+    def send(self, method, params=None):
+        if method == "Profiler.stop":
+            raise RuntimeError("Target page, context or browser has been closed")
+        return super().send(method, params)
+
+
+@pytest.mark.perf
+def test_profile_lost_when_the_page_closes_is_counted(profiler):
+    assert _FakeMainPage(ClosingSession()).set_dates() == "done"
+    assert profiler.records == [] and (profiler.lost, profiler.unsupported) == (1, 0)
+    assert "click_book_now" in cpu_profile.DEFAULT_ACTIONS
@@ -0,0 +1,62 @@
+# tests/test_crud_load.py
+import random
+from datetime import date
+
+import pytest
+from perf.crud_load import (
+    CrudSettings,
+    RequestStats,
+    booking_payload,
+    crud_happy_path,
+    crud_negative,
+    evaluate_assertions,
+    injection_profiles,
+)
+
+
+@pytest.mark.perf
+def test_injection_matches_java_setup():
+    (happy, happy_scenario), (negative, negative_scenario) = injection_profiles(
+        CrudSettings(duration_sec=120, ramp_users=5))
+
+    assert happy_scenario is crud_happy_path and negative_scenario is crud_negative
+    assert list(happy.arrivals()) == [0, 24, 48, 72, 96]
+    assert list(negative.arrivals()) == list(range(30))
+
+
+@pytest.mark.perf
+def test_booking_payload_shape():
+    payload = booking_payload(random.Random(1))
+
+    checkin = date.fromisoformat(payload["bookingdates"]["checkin"])
+    checkout = date.fromisoformat(payload["bookingdates"]["checkout"])
+    assert 1 <= (checkin - date.today()).days <= 9
+    assert 1 <= (checkout - checkin).days <= 4
+    assert 50 <= payload["totalprice"] < 500
+    assert payload["additionalneeds"] in ("Breakfast", "Late checkout")
+
+
+@pytest.mark.perf
+def test_assertions_success_rate_and_p95_for_all():
+    stats = RequestStats()
+    for i in range(100):
+        stats.record("CreateToken", 10 + i, ok=True)
+        stats.record("GetBookingById", 1500 if i >= 90 else 20, ok=i != 0)
+
+    success, *p95s = evaluate_assertions(stats)
+    by_name = {a.description.split(":")[0]: a for a in p95s}
+    assert set(by_name) == {"CreateToken", "GetBookingById"}
+    assert success.ok and success.actual == pytest.approx(99.5)
+    assert by_name["CreateToken"].ok
+    assert not by_name["GetBookingById"].ok
+    assert by_name["GetBookingById"].actual == pytest.approx(1500, rel=0.01)
+
+
+@pytest.mark.perf
+def test_stats_measure_from_intended_send_time():
+    stats = RequestStats()
+    # барањето тргна 400 ms по планираниот слот (генераторот доцнеше)
+    stats.record("CreateBooking", 100, ok=True, lag_ms=400)
+
+    assert stats.percentile("CreateBooking", 50) == pytest.approx(500, rel=0.01)
+    assert stats.percentile("CreateBooking", 50, corrected=False) == pytest.approx(100, rel=0.01)
@@ -0,0 +1,73 @@
+# tests/test_distributed.py
+import random
+
+import pytest
+from mocks import RestfulBookerServer
+from perf.arrivals import constant_users_per_sec, ramp_users_per_sec
+from perf.crud_load import CrudSettings, RequestStats
+from perf.distributed import run_distributed
+from perf.histogram import LatencyHistogram
+from tests.helpers import run_async
+
+
+@pytest.mark.perf
+def test_histogram_encode_roundtrip_is_compact():
+    histogram = LatencyHistogram()
+    rnd = random.Random(1)
+    for _ in range(100_000):
+        histogram.record(rnd.lognormvariate(3, 1))
+
+    encoded = histogram.encode()
+    decoded = LatencyHistogram.decode(encoded)
+    assert list(decoded.counts) == list(histogram.counts)
+    assert (decoded.total_count, decoded.min, decoded.max, decoded.mean) == \
+        (histogram.total_count, histogram.min, histogram.max, histogram.mean)
+    assert len(encoded) < 8 * 1024   # наспроти ~800 KB за 100k float-ови
+
+
+@pytest.mark.perf
+def test_shards_partition_the_global_schedule():
+    profile = ramp_users_per_sec(1, 50, 10) + constant_users_per_sec(50, 5)
+    shards = [list(profile.arrivals(i, 3)) for i in range(3)]
+
+    assert sorted(t for shard in shards for t in shard) == list(profile.arrivals())
+    assert profile.scaled(1 / 4).total == pytest.approx(profile.total / 4, abs=1)
+
+
+@pytest.mark.perf
+def test_drained_snapshots_merge_into_the_whole():
+    whole, worker = RequestStats(), RequestStats()
+    merged = RequestStats()
+    for i in range(1000):
+        for stats in (whole, worker):
+            stats.record("CreateBooking", 5 + i % 50, ok=i % 100 != 0, lag_ms=i % 7)
+        if i % 300 == 299:
+            merged.merge_snapshot(worker.drain())
+    merged.merge_snapshot(worker.drain())
+
+    assert worker.count() == 0
+    assert (merged.count(), merged.failures()) == (whole.count(), whole.failures())
+    assert merged.percentile("CreateBooking", 99) == whole.percentile("CreateBooking", 99)
+    assert merged.percentile(None, 50, corrected=False) == whole.percentile(None, 50, corrected=False)
+
+
+@pytest.mark.api
+def test_two_worker_processes_share_the_load():
+    with RestfulBookerServer() as api:
+        settings = CrudSettings(base_url=api.url, duration_sec=1, ramp_users=20, target_rps=200,
+                                negative_users_per_sec=4, negative_during_sec=1, throttle_ramp_sec=0)
+        coordinator = run_async(run_distributed(settings, processes=2, seed=1, interval=0.2))
+
+    stats = coordinator.stats
+    assert len(coordinator.nodes) == 2 and not coordinator.lost
+    assert all(coordinator.node_counts[node] > 0 for node in coordinator.nodes)
+    assert sum(coordinator.node_counts.values()) == stats.count()
+    # ланците што не завршиле до крајот на throttle-от се откажуваат (како
+    # Gatling maxDuration) → бројките зависат од брзината на машината; затоа
+    # граници: ист број корисници како со еден процес – поделени, не удвоени
+    users = stats.schedule_lag.total_count
+    assert 0 < users <= 24
+    assert stats.count("CreateToken") <= users
+    assert 0 < stats.count("DeleteBooking") <= min(stats.count("CreateBooking"), 20)
+    assert stats.count("CreateBooking") <= users
+    assert stats.failures() == 0
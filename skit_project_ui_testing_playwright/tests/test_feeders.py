@@ -0,0 +1,162 @@
+# tests/test_feeders.py
+import json
+import os
+import random
+import threading
+from datetime import date
+
+import pytest
+from mocks.shady_meadows import validate_booking, validate_message
+from perf.crud_load import booking_body
+from perf.feeders import (
+    CsvSource,
+    Feeder,
+    FeederExhausted,
+    GeneratedSource,
+    MmapDataset,
+    booking_record,
+    contact_record,
+    guest_record,
+    open_source,
+    worker_shard,
+)
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    ds = MmapDataset.build(tmp_path / "bookings.jsonl", GeneratedSource(booking_record, seed=3).records(), count=50)
+    yield ds
+    ds.close()
+
+
+@pytest.mark.perf
+def test_stale_index_is_rebuilt_after_data_changes(tmp_path):
+    path = tmp_path / "bookings.jsonl"
+    MmapDataset.build(path, GeneratedSource(booking_record, seed=3).records(), count=50).close()
+
+    # регенериран JSONL (други записи, 30), стариот .idx останува
+    with path.open("w", encoding="utf-8") as f:
+        for record in GeneratedSource(contact_record, seed=9).records():
+            f.write(json.dumps(record) + "\n")
+            if f.tell() > 4000:
+                break
+    index_path = path.with_name(path.name + ".idx")
+    data_mtime = path.stat().st_mtime_ns
+    os.utime(index_path, ns=(data_mtime - 10**9, data_mtime - 10**9))   # груба резолуција на mtime
+    assert MmapDataset.index_is_stale(path)
+
+    ds = MmapDataset(path)
+    try:
+        assert [r["email"] for r in ds.records()] == [json.loads(line)["email"] for line in path.open(encoding="utf-8")]
+    finally:
+        ds.close()
+    assert not MmapDataset.index_is_stale(path)
+
+
+@pytest.mark.perf
+def test_generated_records_pass_site_validation():
+    contacts = Feeder(GeneratedSource(contact_record, seed=1)).take(50)
+    guests = Feeder(GeneratedSource(guest_record, seed=1)).take(50)
+
+    assert all(not validate_message(c)[1] for c in contacts)
+    assert all(not validate_booking({**g, "bookingdates": {"checkin": "2030-01-01", "checkout": "2030-01-02"}})[1]
+               for g in guests)
+    # уникатни е-пошти → паралелните тестови не се „судираат“
+    assert len({c["email"] for c in contacts}) == len({g["email"] for g in guests}) == 50
+
+
+@pytest.mark.perf
+def test_generated_source_is_repeatable_with_seed():
+    first = Feeder(GeneratedSource(booking_record, seed=7)).take(5)
+    assert Feeder(GeneratedSource(booking_record, seed=7)).take(5) == first
+    record = first[0]
+    assert date.fromisoformat(record["checkout"]) > date.fromisoformat(record["checkin"]) > date.today()
+
+
+@pytest.mark.perf
+def test_queue_strategy_exhausts_and_circular_wraps(dataset):
+    queue = Feeder(dataset, "queue")
+    assert queue.take(50) == list(dataset.records())
+    with pytest.raises(FeederExhausted):
+        next(queue)
+
+    circular = Feeder(dataset, "circular")
+    assert circular.take(51)[50] == dataset[0]
+
+
+@pytest.mark.perf
+def test_shards_partition_the_source_without_duplicates(dataset):
+    shards = [Feeder(dataset, "queue", shard=(i, 3)).take(len(range(i, 50, 3))) for i in range(3)]
+
+    assert shards[1][0] == dataset[1] and shards[1][1] == dataset[4]
+    assert sorted(r["firstname"] + r["lastname"] for s in shards for r in s) == \
+        sorted(r["firstname"] + r["lastname"] for r in dataset.records())
+
+
+@pytest.mark.perf
+def test_random_strategy_stays_in_shard_and_needs_index(tmp_path, dataset):
+    picks = Feeder(dataset, "random", shard=(1, 2), seed=4).take(200)
+    own = [dataset[i] for i in range(1, 50, 2)]
+    assert all(p in own for p in picks)
+    assert len({p["firstname"] + p["lastname"] for p in picks}) > 10
+
+    (tmp_path / "b.csv").write_text("firstname\nAna\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        Feeder(CsvSource(tmp_path / "b.csv"), "random")
+
+
+@pytest.mark.perf
+def test_feeder_is_thread_safe(dataset):
+    feeder = Feeder(dataset, "queue")
+    taken = []
+
+    def _worker():
+        while True:
+            try:
+                taken.append(next(feeder)["firstname"] + next(feeder)["lastname"])
+            except FeederExhausted:
+                return
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(taken) == 25   # 50 записи, по 2 на итерација, без дупликати/губење
+
+
+@pytest.mark.perf
+def test_csv_source_streams_and_converts_to_booking_body(tmp_path):
+    path = tmp_path / "bookings.csv"
+    path.write_text("firstname,lastname,totalprice,depositpaid,checkin,checkout,needs\n"
+                    "Ana,Petrova,120,true,2030-01-01,2030-01-03,Breakfast\n"
+                    "Marko,Nikolov,99,false,2030-02-01,2030-02-02,\n", encoding="utf-8")
+    bodies = [booking_body(r) for r in Feeder(open_source(path)).take(2)]
+
+    assert bodies[0] == {"firstname": "Ana", "lastname": "Petrova", "totalprice": 120, "depositpaid": True,
+                         "bookingdates": {"checkin": "2030-01-01", "checkout": "2030-01-03"},
+                         "additionalneeds": "Breakfast"}
+    assert bodies[1]["depositpaid"] is False and bodies[1]["totalprice"] == 99
+
+
+@pytest.mark.perf
+def test_mmap_dataset_reindexes_existing_jsonl(tmp_path):
+    path = tmp_path / "contacts.jsonl"
+    rnd = random.Random(2)
+    path.write_text("\n".join(f'{{"i": {i}}}' for i in range(10)) + "\n\n", encoding="utf-8")
+
+    ds = open_source(path)
+    try:
+        assert len(ds) == 10 and ds[7] == {"i": 7} and ds[-1] == {"i": 9}
+        assert ds[rnd.randrange(10)]["i"] in range(10)
+    finally:
+        ds.close()
+
+
+@pytest.mark.perf
+def test_worker_shard_reads_xdist_environment(monkeypatch):
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    assert worker_shard() == (0, 1)
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "4")
+    assert worker_shard() == (2, 4)
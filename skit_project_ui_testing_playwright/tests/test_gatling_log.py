@@ -0,0 +1,118 @@
+# tests/test_gatling_log.py
+import math
+import random
+
+import numpy as np
+import pytest
+from perf.gatling_log import LogParser, RequestLog, UnsupportedLogFormat, build_store, main, parse
+
+T0 = 1_700_000_000_000
+NAMES = ("CreateToken", "CreateBooking", "GetBookingById")
+
+
+def _write_log(path, requests):
+    lines = [f"RUN\tperf.RestfulBookerCrudSimulation\trestfulbookercrudsimulation-1\t{T0}\t \t3.10.5",
+             f"USER\tCRUD Happy Path\tSTART\t{T0}"]
+    for name, start, latency, ok in requests:
+        status = "OK" if ok else "KO"
+        message = "" if ok else "status.find.in(200), but actually found 500"
+        lines.append(f"REQUEST\t\t{name}\t{start}\t{start + latency}\t{status}\t{message}")
+    lines += [f"ERROR\tstatus.find.in(200), but actually found 500\t{T0}", f"USER\tCRUD Happy Path\tEND\t{T0}"]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _requests(count: int, seed: int = 1):
+    rnd = random.Random(seed)
+    return [(rnd.choice(NAMES), T0 + rnd.randrange(10_000), rnd.randrange(1, 800), rnd.random() > 0.1)
+            for _ in range(count)]
+
+
+def _nearest_rank(values, pct):
+    values = sorted(values)
+    return values[max(1, math.ceil(pct / 100 * len(values))) - 1]
+
+
+@pytest.mark.perf
+def test_parse_builds_columns_and_run_metadata(tmp_path):
+    requests = _requests(50)
+    log = parse(_write_log(tmp_path / "simulation.log", requests))
+
+    assert len(log) == 50 and log.users == 1
+    assert log.run.simulation == "perf.RestfulBookerCrudSimulation" and log.run.start_ms == T0
+    assert [log.names[c] for c in log.name] == [r[0] for r in requests]
+    assert log.latency.tolist() == [r[2] for r in requests]
+    assert log.ok.tolist() == [r[3] for r in requests]
+    assert log.errors == {"status.find.in(200), but actually found 500": 1}
+
+
+@pytest.mark.perf
+def test_vectorized_percentiles_match_nearest_rank(tmp_path):
+    requests = _requests(2000, seed=3)
+    log = parse(_write_log(tmp_path / "simulation.log", requests))
+    table = log.percentiles((50, 95, 99))
+    ok_table = log.percentiles((95,), status="ok")
+
+    for name in NAMES:
+        latencies = [r[2] for r in requests if r[0] == name]
+        assert table[name].tolist() == [_nearest_rank(latencies, p) for p in (50, 95, 99)]
+        assert ok_table[name][0] == _nearest_rank([r[2] for r in requests if r[0] == name and r[3]], 95)
+    assert table["Global"][2] == _nearest_rank([r[2] for r in requests], 99)
+
+
+@pytest.mark.perf
+def test_throughput_windows_include_empty_ones(tmp_path):
+    requests = [("CreateToken", T0 + 100, 5, True), ("CreateToken", T0 + 900, 5, False),
+                ("CreateBooking", T0 + 3500, 5, True)]
+    log = parse(_write_log(tmp_path / "simulation.log", requests))
+
+    windows, total, ko = log.throughput(1000)
+    assert (windows - T0).tolist() == [0, 1000, 2000, 3000]
+    assert total.tolist() == [2, 0, 0, 1] and ko.tolist() == [1, 0, 0, 0]
+    assert log.throughput(1000, name="CreateBooking")[1].tolist() == [1]
+
+
+@pytest.mark.perf
+def test_store_streams_chunks_to_memmap(tmp_path):
+    path = _write_log(tmp_path / "simulation.log", _requests(1234, seed=5))
+    stored = build_store(path, tmp_path / "store", chunk_rows=100)
+    in_memory = parse(path)
+
+    assert isinstance(stored.latency, np.memmap)
+    assert stored.names == in_memory.names and stored.run == in_memory.run
+    assert np.array_equal(stored.start, in_memory.start) and np.array_equal(stored.ok, in_memory.ok)
+    assert np.array_equal(RequestLog.load(tmp_path / "store").percentiles()["Global"],
+                          in_memory.percentiles()["Global"])
+
+
+@pytest.mark.perf
+def test_parser_handles_gatling2_lines_and_truncated_tail(tmp_path):
+    path = tmp_path / "simulation.log"
+    path.write_text(f"REQUEST\tCRUD\t1\t\tCreateToken\t{T0}\t{T0 + 42}\tOK\t \n"
+                    f"REQUEST\t\tCreateToken\t{T0}\t", encoding="utf-8")   # run уште пишува
+    parser = LogParser(path)
+    chunks = list(parser.chunks())
+
+    assert parser.names == ["CreateToken"] and chunks[0].latency.tolist() == [42]
+
+
+@pytest.mark.perf
+def test_binary_log_is_rejected(tmp_path, capsys):
+    path = tmp_path / "run" / "simulation.log"
+    path.parent.mkdir()
+    path.write_bytes(b"\x00\x00\x00\x063.14.5\x01\x02")
+
+    with pytest.raises(UnsupportedLogFormat):
+        parse(path)
+    assert main([str(tmp_path)]) == 2
+    assert "binary" in capsys.readouterr().err
+
+
+@pytest.mark.perf
+def test_cli_report_from_directory(tmp_path, capsys):
+    (tmp_path / "run-1").mkdir()
+    _write_log(tmp_path / "run-1" / "simulation.log", _requests(20))
+
+    assert main([str(tmp_path), "--percentile", "95"]) == 0
+    out = capsys.readouterr().out
+    assert "p95" in out and "Global" in out and "throughput" in out
@@ -0,0 +1,107 @@
+# tests/test_har.py
+import json
+from datetime import date
+
+import pytest
+from perf.har import HarArchive, HarReplayer, har_name
+from perf.slots import Slot
+from tests.helpers import FakeRoute
+
+LIVE = "https://automationintesting.online"
+BUNDLE = b"console.log('shady meadows');" * 2000
+
+
+def _playwright_har(directory, name, entries):
+    """Како record_har_content="attach": телата се фајлови до .har-от."""
+    directory.mkdir(parents=True, exist_ok=True)
+    har_entries = []
+    for method, url, status, body, post in entries:
+        content = {"size": len(body), "mimeType": "application/json"}
+        if body:
+            file_name = f"{abs(hash(body))}.bin"
+            (directory / file_name).write_bytes(body)
+            content["_file"] = file_name
+        request = {"method": method, "url": url, "headers": []}
+        if post is not None:
+            request["postData"] = {"mimeType": "application/json", "text": post}
+        har_entries.append({"request": request, "response": {
+            "status": status, "headers": [{"name": "Content-Type", "value": "application/json"},
+                                          {"name": "Content-Encoding", "value": "gzip"}],
+            "content": content}})
+    path = directory / name
+    path.write_text(json.dumps({"log": {"version": "1.2", "entries": har_entries}}), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = HarArchive(tmp_path / "har")
+    for index in range(2):
+        har = _playwright_har(tmp_path / f"tmp{index}", "context-0.har", [
+            ("GET", f"{LIVE}/static/app.js", 200, BUNDLE, None),
+            ("GET", f"{LIVE}/api/room", 200, b'{"rooms": []}', None),
+            ("POST", f"{LIVE}/api/booking", 201, b'{"bookingid": 1}', '{"firstname": "Ana"}'),
+            ("POST", f"{LIVE}/api/booking", 409, b"", '{"firstname": "Ana"}'),
+            ("GET", f"{LIVE}/api/room", 200, b'{"rooms": [1]}', None),
+        ])
+        archive.ingest(har_name(f"tests/test_booking_flow.py::test_{index}[a b]"), [har, har.parent / "missing.har"])
+    archive.save_meta(LIVE)
+    return HarArchive(tmp_path / "har")
+
+
+@pytest.mark.perf
+def test_bodies_are_deduplicated_and_compressed(archive):
+    name = har_name("tests/test_booking_flow.py::test_0[a b]")
+    assert name == "tests_test_booking_flow.py__test_0_a_b_"
+    assert len(list((archive.root / "content").rglob("*.gz"))) == 4      # 2 теста, исти тела
+    assert archive.size()["content"] < len(BUNDLE) / 10
+    content = archive.entries(name)[0]["response"]["content"]
+    assert "_file" not in content and archive.body(content) == BUNDLE
+    assert archive.meta["base_url"] == LIVE
+
+
+@pytest.mark.perf
+def test_replay_serves_in_recorded_order_on_another_host(archive):
+    replayer = HarReplayer(archive, archive.entries(har_name("tests/test_booking_flow.py::test_1[a b]")),
+                           "http://127.0.0.1:8123")
+    routes = [FakeRoute("http://127.0.0.1:8123/api/room"),
+              FakeRoute("http://127.0.0.1:8123/api/booking", method="POST", post_data='{"firstname": "Bo"}'),
+              FakeRoute("http://127.0.0.1:8123/api/room"),
+              FakeRoute("http://127.0.0.1:8123/api/room"),
+              FakeRoute("http://127.0.0.1:8123/api/message")]
+    for route in routes:
+        replayer.handle(route)
+
+    assert routes[0].outcome == (200, {"Content-Type": "application/json"}, b'{"rooms": []}')
+    assert routes[1].outcome[0] == 201                        # различно тело → по редослед
+    assert routes[2].outcome[2] == routes[3].outcome[2] == b'{"rooms": [1]}'  # последниот се повторува
+    assert routes[4].outcome == "internetdisconnected" and replayer.unmatched == ["GET http://127.0.0.1:8123/api/message"]
+    assert replayer.served == 4
+
+
+@pytest.mark.perf
+def test_lenient_replay_sends_unrecorded_requests_to_network(archive):
+    replayer = HarReplayer(archive, [], LIVE, strict=False)
+    route = FakeRoute(f"{LIVE}/api/room")
+    replayer.handle(route)
+    assert route.outcome == "fallback" and len(replayer.unmatched) == 1
+
+
+@pytest.mark.perf
+def test_dates_are_not_part_of_the_key_and_slots_are_pinned(tmp_path):
+    har = _playwright_har(tmp_path / "tmp", "context-0.har", [
+        ("GET", f"{LIVE}/api/room?checkin=2026-10-18&checkout=2026-10-19", 200, b'{"rooms": [2]}', None)])
+    archive = HarArchive(tmp_path / "har")
+    name = har_name("tests/test_booking_flow.py::test_booking")
+    archive.ingest(name, [har])
+    archive.pin_slot(name, Slot(2, date(2026, 10, 18), date(2026, 10, 19)))
+    archive.save_meta(LIVE)
+
+    archive = HarArchive(tmp_path / "har")                    # следен ден, replay
+    replayer = HarReplayer(archive, archive.entries(name), "http://127.0.0.1:8123")
+    route = FakeRoute("http://127.0.0.1:8123/api/room?checkin=2026-11-02&checkout=2026-11-03")
+    replayer.handle(route)
+
+    assert route.outcome[2] == b'{"rooms": [2]}'
+    assert archive.pinned_slot(name) == Slot(2, date(2026, 10, 18), date(2026, 10, 19))
+    assert archive.pinned_slot(har_name("tests/test_booking_flow.py::test_other")) is None
@@ -0,0 +1,62 @@
+# tests/test_histogram.py
+import random
+
+import pytest
+from perf.histogram import LatencyHistogram
+from perf.step_timing import percentile
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("pct", [50, 90, 95, 99, 99.9])
+def test_percentiles_within_one_percent_of_exact(pct):
+    rnd = random.Random(7)
+    values = [rnd.lognormvariate(3, 1.2) for _ in range(20000)]   # ~20 ms медијана, долга опашка
+    histogram = LatencyHistogram(significant_digits=2)
+    for v in values:
+        histogram.record(v)
+
+    exact = percentile(sorted(values), pct)
+    assert histogram.percentile(pct) == pytest.approx(exact, rel=0.01, abs=0.002)
+    assert histogram.total_count == 20000
+
+
+@pytest.mark.perf
+def test_memory_is_fixed_and_extremes_are_exact():
+    histogram = LatencyHistogram(highest_ms=60_000)
+    size = len(histogram.counts)
+    for v in (0.001, 5, 59_999, 120_000):   # последната се сече на highest
+        histogram.record(v)
+
+    assert len(histogram.counts) == size
+    assert histogram.min == 0.001
+    assert histogram.max == 60_000
+    assert histogram.percentile(100) == 60_000
+
+
+@pytest.mark.perf
+def test_merge_equals_recording_into_one():
+    rnd = random.Random(3)
+    a, b, together = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for i in range(5000):
+        v = rnd.expovariate(1 / 50)
+        (a if i % 2 else b).record(v)
+        together.record(v)
+
+    merged = LatencyHistogram().merge(a).merge(b)
+    assert list(merged.counts) == list(together.counts)
+    assert (merged.total_count, merged.min, merged.max) == (together.total_count, together.min, together.max)
+    with pytest.raises(ValueError):
+        merged.merge(LatencyHistogram(significant_digits=3))
+
+
+@pytest.mark.perf
+def test_coordinated_omission_backfill():
+    histogram = LatencyHistogram()
+    for _ in range(99):
+        histogram.record_corrected(10, expected_interval_ms=100)
+    # една пауза од 1 s → 9 барања што не стигнаа да тргнат (900, 800, ... 100 ms)
+    histogram.record_corrected(1000, expected_interval_ms=100)
+
+    assert histogram.total_count == 109
+    assert histogram.percentile(50) == pytest.approx(10, rel=0.01)
+    assert histogram.percentile(95) == pytest.approx(500, rel=0.01)   # без корекција би било 10
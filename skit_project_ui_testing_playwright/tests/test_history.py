@@ -0,0 +1,84 @@
+# tests/test_history.py
+import random
+
+import pytest
+from perf.crud_load import RequestStats
+from perf.history import (
+    HistoryDB,
+    detect,
+    mann_whitney_greater,
+    pytest_samples,
+    record_crud_stats,
+    regressions,
+)
+
+
+def _noisy(rnd, center, count, spread=0.03):
+    return [center * (1 + rnd.uniform(-spread, spread)) for _ in range(count)]
+
+
+@pytest.fixture
+def db(tmp_path):
+    with HistoryDB(tmp_path / "history.sqlite") as history:
+        yield history
+
+
+@pytest.mark.perf
+def test_mann_whitney_separates_shifted_samples():
+    rnd = random.Random(1)
+    same = mann_whitney_greater(_noisy(rnd, 1.0, 10), _noisy(rnd, 1.0, 10))
+    slower = mann_whitney_greater(_noisy(rnd, 1.0, 10), _noisy(rnd, 1.3, 10))
+
+    assert same > 0.05 and slower < 0.001
+    assert mann_whitney_greater([1.0, 1.0, 1.0], [1.0, 1.0]) == 1.0   # сите изедначени → нема доказ
+
+
+@pytest.mark.perf
+def test_detect_finds_change_point_and_ignores_noise():
+    rnd = random.Random(2)
+    assert detect(_noisy(rnd, 2.0, 20, spread=0.08)) is None
+
+    index, p_value, method = detect(_noisy(rnd, 2.0, 10) + _noisy(rnd, 2.6, 6))
+    assert (index, method) == (10, "change-point") and p_value < 0.01
+    # статистички јасно, но под min_change (10%) → не е регресија
+    assert detect(_noisy(rnd, 2.0, 10, 0.001) + _noisy(rnd, 2.1, 6, 0.001)) is None
+
+
+@pytest.mark.perf
+def test_detect_flags_a_spike_in_the_latest_run():
+    rnd = random.Random(3)
+    assert detect(_noisy(rnd, 1.0, 12) + [1.8])[1:] == (pytest.approx(0, abs=1e-6), "latest")
+    assert detect(_noisy(rnd, 1.0, 12) + [1.02]) is None
+
+
+@pytest.mark.perf
+def test_regressions_report_first_slow_run_per_environment(db):
+    rnd = random.Random(4)
+    for i, seconds in enumerate(_noisy(rnd, 5.0, 8) + _noisy(rnd, 7.5, 4)):
+        durations = {"tests/test_booking_flow.py::test_submit": seconds, "tests/test_smoke.py::test_home": 0.5}
+        db.add_run("pytest", pytest_samples(durations), environment="local", commit=f"c{i}", started=1000 + i)
+    db.add_run("pytest", pytest_samples({"tests/test_booking_flow.py::test_submit": 50.0}),
+               environment="https://automationintesting.online", commit="live", started=2000)
+
+    (found,) = regressions(db, kind="test", environment="local")
+    assert found.name == "tests/test_booking_flow.py::test_submit" and found.since_commit == "c8"
+    assert 0.4 < found.change < 0.6
+    assert [p.commit for p in db.series("test", found.name, "duration", "local")][-2:] == ["c10", "c11"]
+    assert regressions(db, kind="test", environment="https://automationintesting.online") == []
+
+
+@pytest.mark.perf
+def test_records_steps_and_crud_percentiles(db):
+    steps = [{"step": "goto_booking", "count": 3, "p50": 0.4, "p95": 0.9, "max": 1.0, "total": 1.9}]
+    stats = RequestStats()
+    for ms in (10, 20, 30):
+        stats.record("CreateToken", ms, True)
+    stats.record("CreateToken", 500, False)
+
+    db.add_run("pytest", pytest_samples({}, steps), commit="abc", branch="main")
+    run_id = record_crud_stats(db, stats, environment="local")
+
+    assert db.series("step", "goto_booking", "p95")[0].value == 0.9
+    assert db.series("request", "CreateToken", "ko")[0].value == 1
+    assert db.series("request", "Global", "p99")[0].value == pytest.approx(500, rel=0.01)
+    assert db.runs(1)[0].id == run_id and db.runs(1)[0].source == "crud_load"
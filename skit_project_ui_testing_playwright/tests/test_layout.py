@@ -0,0 +1,67 @@
+# tests/test_layout.py
+import numpy as np
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from perf import layout
+from perf.layout import Viewport, snapshot
+
+PHONE, LAPTOP = Viewport("phone", 375, 812), Viewport("laptop", 1366, 800)
+
+
+class FakePage:
+    """Reservation страница: под 992px Price Summary е под формата, над – десно."""
+
+    def __init__(self, settles=True):
+        self.viewport_size = {"width": 1280, "height": 720}
+        self.settles = settles
+        self.calls = []
+
+    def set_viewport_size(self, size):
+        self.calls.append(("resize", size["width"]))
+        self.viewport_size = size
+
+    def evaluate(self, script, arg):
+        self.calls.append(("evaluate", arg["width"]))
+        width = arg["width"]
+        if width < 992:
+            rects = [[16, 900, width - 32, 30], [16, 200, width - 32, 38], None]
+        else:
+            rects = [[width * 0.66, 200, 300, 30], [width * 0.1, 200, 500, 38], None]
+        return {"settled": self.settles, "frames": 3, "rects": rects}
+
+
+ELEMENTS = {"price": "text=Price Summary", "firstname": "input[placeholder='Firstname']", "toggler": ".navbar-toggler"}
+
+
+@pytest.mark.perf
+def test_snapshot_measures_every_viewport_without_reload():
+    page = FakePage()
+    table = snapshot(page, ELEMENTS, viewports=(PHONE, LAPTOP))
+
+    assert page.calls == [("resize", 375), ("evaluate", 375), ("resize", 1366), ("evaluate", 1366), ("resize", 1280)]
+    assert table.rects.shape == (2, 3, 4) and table.visible.tolist() == [[True, True, False], [True, True, False]]
+    assert table.box("phone", "price") == {"x": 16, "y": 900, "width": 343, "height": 30}
+    assert np.array_equal(table.column("firstname", "y"), [200, 200])
+    assert "phone 375" in table.format() and "16,900 343x30" in table.format()
+
+
+@pytest.mark.perf
+def test_rules_are_checked_for_all_viewports_at_once():
+    table = snapshot(FakePage(), ELEMENTS, viewports=layout.VIEWPORTS)
+
+    assert table.check([
+        layout.right_of("price", "firstname", gap=250, min_width=992),
+        layout.below("price", "firstname", gap=150, max_width=992),
+        layout.inside_viewport("price"),
+    ]) == []
+    failures = table.check([layout.below("price", "firstname", gap=150), layout.visible("toggler", max_width=992)])
+    assert len(failures) == 3 + 3                         # 3 широки viewports + 3 тесни без toggler
+    assert failures[0].startswith("tablet-l (1024px): below(price, firstname")
+
+
+@pytest.mark.perf
+def test_unsettled_layout_raises_in_strict_mode():
+    with pytest.raises(PlaywrightTimeoutError, match="phone"):
+        snapshot(FakePage(settles=False), ELEMENTS, viewports=(PHONE,))
+    table = snapshot(FakePage(settles=False), ELEMENTS, viewports=(PHONE,), strict=False)
+    assert "(not settled)" in table.format()
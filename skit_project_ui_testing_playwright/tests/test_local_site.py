@@ -0,0 +1,105 @@
+# tests/test_local_site.py
+# =============================================================================
+# Backend проверки за локалниот stand-in (mocks/shady_meadows.py).
+#
+# Овие тестови НЕ отвораат browser – одат директно на JSON API-то со urllib,
+# за да бидеме сигурни дека правилата за валидација се исти како што ги
+# очекуваат UI тестовите (contact/booking/login).
+# =============================================================================
+
+import json
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+from mocks import ShadyMeadowsServer
+
+
+@pytest.fixture(scope="module")
+def site():
+    with ShadyMeadowsServer() as server:
+        yield server
+
+
+def _call(site, method: str, path: str, payload=None, cookie: str = ""):
+    data = json.dumps(payload).encode() if payload is not None else None
+    req = Request(f"{site.url}{path}", data=data, method=method,
+                  headers={"Content-Type": "application/json", "Cookie": cookie})
+    try:
+        with urlopen(req, timeout=5) as resp:
+            return resp.status, resp.headers, json.loads(resp.read() or b"{}")
+    except HTTPError as e:
+        return e.code, e.headers, json.loads(e.read() or b"{}")
+
+
+VALID_MESSAGE = {
+    "name": "Мила Тестова",
+    "email": "mila.tester@example.com",
+    "phone": "+38971234567",
+    "subject": "Прашање за сместување",
+    "description": "Ова е тест порака со доволна должина за да помине валидаторот.",
+}
+
+
+@pytest.mark.api
+@pytest.mark.parametrize(
+    "override,accepted",
+    [
+        pytest.param({}, True, id="valid"),
+        pytest.param({"email": "mila@domain"}, True, id="email-without-tld"),
+        pytest.param({"email": "  MILA.TESTER@EXAMPLE.COM  "}, True, id="email-upper-trimmed"),
+        pytest.param({"email": "mila@domain..com"}, False, id="email-double-dot"),
+        pytest.param({"email": "@domain.com"}, False, id="email-no-local-part"),
+        pytest.param({"phone": "12345"}, False, id="phone-too-short"),
+        pytest.param({"phone": "+389 71-ABV-123"}, False, id="phone-letters"),
+        pytest.param({"subject": "ab"}, False, id="subject-too-short"),
+        pytest.param({"description": "кратко"}, False, id="message-too-short"),
+        pytest.param({"name": ""}, False, id="no-name"),
+    ],
+)
+def test_message_validation(site, override, accepted):
+    status, _, body = _call(site, "POST", "/api/message", {**VALID_MESSAGE, **override})
+    assert status == (201 if accepted else 400), body
+
+
+@pytest.mark.api
+def test_booking_conflict_and_availability(site):
+    booking = {
+        "roomid": 2,
+        "firstname": "Мила",
+        "lastname": "Тестова",
+        "email": "mila.tester@example.com",
+        "phone": "+38971234567",
+        "bookingdates": {"checkin": "2030-01-10", "checkout": "2030-01-12"},
+    }
+    status, _, body = _call(site, "POST", "/api/booking", booking)
+    assert status == 201 and body["bookingid"]
+
+    # истата соба, преклопени датуми → 409
+    overlapping = {**booking, "bookingdates": {"checkin": "2030-01-11", "checkout": "2030-01-13"}}
+    assert _call(site, "POST", "/api/booking", overlapping)[0] == 409
+
+    # зафатената соба не се нуди за тие датуми
+    _, _, rooms = _call(site, "GET", "/api/room?checkin=2030-01-11&checkout=2030-01-12")
+    assert 2 not in [r["roomid"] for r in rooms["rooms"]]
+
+
+@pytest.mark.api
+@pytest.mark.parametrize("dates", [None, "2030-01-10", ["2030-01-10", "2030-01-12"]])
+def test_booking_with_malformed_dates_is_a_validation_error(site, dates):
+    booking = {"roomid": 2, "firstname": "Мила", "lastname": "Тестова", "email": "mila.tester@example.com",
+               "phone": "+38971234567", "bookingdates": dates}
+    status, _, body = _call(site, "POST", "/api/booking", booking)
+    assert status == 400 and "Booking dates must be valid dates (YYYY-MM-DD)" in body["errors"]
+
+
+@pytest.mark.api
+def test_login_sets_token_cookie(site):
+    assert _call(site, "POST", "/api/auth/login", {"username": "admin", "password": "wrong"})[0] == 401
+
+    status, headers, body = _call(site, "POST", "/api/auth/login", {"username": "admin", "password": "password"})
+    assert status == 200
+    assert f"token={body['token']}" in headers["Set-Cookie"]
+
+    assert _call(site, "GET", "/api/booking")[0] == 403
+    assert _call(site, "GET", "/api/booking", cookie=f"token={body['token']}")[0] == 200
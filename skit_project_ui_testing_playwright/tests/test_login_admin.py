@@ -13,171 +13,134 @@
 
 import pytest
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from pages.main_page import MainPage
+from pages.main_page import ADMIN_DASHBOARD_SELECTORS, MainPage
+from perf.step_timing import timed
+from perf.timeouts import adaptive
 
 
 # ------------------------------ Helpers --------------------------------------
 
+LOGIN_API = "/api/auth/login"
+ALERTS = ".alert, [role='alert']"
+
+
+@timed
+@adaptive
 def expect_login_success(page, timeout: int = 15000) -> None:
     """
     Чека индикатор дека сме внатре во админ (dashboard/менито).
-    Пробаваме низа селектори за поголема робусност.
-    """
-    candidates = [
-        ".reservations",                      # најчесто присутно по успешен login
-        "text=Reservations",                  # текст fallback
-        "a:has-text('Rooms')",                # линк во менито
-        "a:has-text('Branding')",             # линк во менито
-    ]
-    last_err = None
-    slice_timeout = max(timeout // len(candidates), 2000)
-    for sel in candidates:
-        try:
-            page.wait_for_selector(sel, timeout=slice_timeout)
-            return
-        except Exception as e:
-            last_err = e
-    raise PlaywrightTimeoutError(
-        f"Admin UI not detected via any success selector. Last: {last_err}"
-    )
+    Сите селектори се следат ИСТОВРЕМЕНО (MainPage.wait_first) – нема делење
+    на timeout, па и последниот кандидат се детектира веднаш.
+    """
+    try:
+        MainPage(page).wait_first(ADMIN_DASHBOARD_SELECTORS, timeout=timeout)
+    except PlaywrightTimeoutError as e:
+        raise PlaywrightTimeoutError(f"Admin UI not detected via any success selector. Last: {e}")
 
 
+@timed
+@adaptive
 def expect_login_error(page, timeout: int = 7000) -> None:
     """
-    Чека визуелен сигнал за неуспешен login.
-    ВАЖНО: не мешај CSS и 'text=' во еден селектор — пробуваме последователно.
-    """
-    css_candidates = [
-        ".alert-danger",
-        ".alert",
-        "[role='alert']",
-    ]
-    text_candidates = ["invalid", "unauthorized", "error", "wrong", "fail"]
-
-    # делиме време отприлика 40/60
-    css_timeout = max(int(timeout * 0.4 / max(len(css_candidates), 1)), 1000)
-    text_timeout = max(int(timeout * 0.6 / max(len(text_candidates), 1)), 800)
-
-    last_err = None
-
-    # 1) CSS alerts
-    for sel in css_candidates:
-        try:
-            page.wait_for_selector(sel, timeout=css_timeout)
-            return
-        except Exception as e:
-            last_err = e
-
-    # 2) Текстови (case-insensitive)
-    for t in text_candidates:
-        try:
-            page.get_by_text(t, exact=False).first.wait_for(timeout=text_timeout)
-            return
-        except Exception as e:
-            last_err = e
-
-    raise PlaywrightTimeoutError(
-        f"Login error UI not detected. Last: {last_err}"
-    )
+    Чека визуелен сигнал за неуспешен login: CSS alert-и ИЛИ текстови
+    (invalid/unauthorized/error/...), сите истовремено.
+    """
+    main = MainPage(page)
+    try:
+        main.wait_first(main.login_error_candidates(), timeout=timeout)
+    except PlaywrightTimeoutError as e:
+        raise PlaywrightTimeoutError(f"Login error UI not detected. Last: {e}")
 
 
 # ------------------------------- Tests ---------------------------------------
 
 @pytest.mark.login
-def test_login_smoke_fields_present(page):
+def test_login_smoke_fields_present(warm_main):
     """
     Smoke: проверка дека страната се вчитува и елементите постојат/видливи.
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
-    main.login_username_input.wait_for(timeout=5000)
-    main.login_password_input.wait_for(timeout=5000)
-    main.login_button.wait_for(timeout=5000)
-
-    assert main.login_username_input.is_visible()
-    assert main.login_password_input.is_visible()
-    assert main.login_button.is_visible()
+    # едно чекање + една евалуација наместо 3× wait_for + 3× is_visible
+    fields = main.query_elements(
+        {"username": "#username", "password": "#password", "submit": "button[type='submit']"},
+        attributes=("type",), wait=True, timeout=5000,
+    )
+    assert fields["password"].attrs["type"] == "password"
 
 
 @pytest.mark.login
-def test_login_positive(page):
+def test_login_positive(warm_main):
     """
     Happy-path: валидни креденцијали → треба да видиме админ UI.
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     main.login("admin", "password")
-    expect_login_success(page, timeout=15000)
+    expect_login_success(main.page, timeout=15000)
 
 
 @pytest.mark.login
-def test_login_blank_fields(page):
+def test_login_blank_fields(warm_main):
     """
     Празни полиња: submit без username/password → треба да видиме грешка.
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     main.login("", "")
-    expect_login_error(page)
+    expect_login_error(main.page)
 
 
 @pytest.mark.login
-def test_login_invalid_username(page):
+def test_login_invalid_username(warm_main):
     """
     Погрешно корисничко име: wronguser/password → грешка.
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     main.login("wronguser", "password")
-    expect_login_error(page)
+    expect_login_error(main.page)
 
 
 @pytest.mark.login
-def test_login_invalid_password(page):
+def test_login_invalid_password(warm_main):
     """
     Погрешна лозинка: admin/wrongpass → грешка.
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     main.login("admin", "wrongpass")
-    expect_login_error(page)
+    expect_login_error(main.page)
 
 
 @pytest.mark.login
-def test_login_sql_injection(page):
+def test_login_sql_injection(warm_main):
     """
     Едноставен SQLi обид: не смее да помине.
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     payload = "' OR '1'='1"
     main.login(payload, payload)
-    expect_login_error(page)
+    expect_login_error(main.page)
 
 
 @pytest.mark.login
-def test_login_long_credentials(page):
+def test_login_long_credentials(warm_main):
     """
     Робустност: многу долги креденцијали → очекуваме грешка, не login.
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     long_text = "a" * 300
     main.login(long_text, long_text)
-    expect_login_error(page)
+    expect_login_error(main.page)
 
 
 # --------------------------- NEW TESTS (added) -------------------------------
 
 @pytest.mark.login
-def test_login_username_case_sensitivity(page):
+def test_login_username_case_sensitivity(warm_main):
     """
     ЦЕЛ:
         - Да провериме дека системот прави разлика меѓу 'admin' и 'Admin'
@@ -193,15 +156,14 @@ def test_login_username_case_sensitivity(page):
         - Да добиеме индикатор за грешка (неуспешен login),
           бидејќи очекуваме валидно е само 'admin'.
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     main.login("Admin", "password")  # само првата буква е голема
-    expect_login_error(page)
+    expect_login_error(main.page)
 
 
 @pytest.mark.login
-def test_login_password_case_sensitivity(page):
+def test_login_password_case_sensitivity(warm_main):
     """
     ЦЕЛ:
         - Да провериме дека лозинката е *case-sensitive*.
@@ -215,15 +177,14 @@ def test_login_password_case_sensitivity(page):
     ОЧЕКУВАЊЕ:
         - Да добиеме индикатор за грешка (неуспешен login).
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     main.login("admin", "Password")  # погрешен case во лозинка
-    expect_login_error(page)
+    expect_login_error(main.page)
 
 
 @pytest.mark.login
-def test_login_submit_with_enter_key(page):
+def test_login_submit_with_enter_key(warm_main):
     """
     ЦЕЛ:
         - Да провериме UX-поведението: сабмит преку копче ENTER (без клик на 'Submit').
@@ -237,21 +198,20 @@ def test_login_submit_with_enter_key(page):
     ОЧЕКУВАЊЕ:
         - Успешен login (го гледаме админ интерфејсот).
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     # рачно пополнување, без повик на main.login, за да тестираме ENTER submit
     main.login_username_input.fill("admin")
     main.login_password_input.fill("password")
     main.login_password_input.press("Enter")
 
-    expect_login_success(page, timeout=15000)
+    expect_login_success(main.page, timeout=15000)
 
 # --------------------------- EXTRA TESTS (whitespace & throttle) -------------
 
 
 @pytest.mark.login
-def test_login_username_whitespace_behavior_documented(page):
+def test_login_username_whitespace_behavior_documented(warm_main):
     """
     ЦЕЛ:
         - Да ја документираме реалната логика на демото околу
@@ -271,22 +231,17 @@ def test_login_username_whitespace_behavior_documented(page):
         - Ако сакаш строго правило, смени ја логиката: очекувај успех или грешка
           според политиката на твојот продукт.
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     main.login("  admin  ", "password")
 
-    try:
-        # ако има trimming → ќе успее за < 6s
-        expect_login_success(page, timeout=6000)
-        # ако стигне тука, значи системот trim-ира → документриано е како „валидно“
-    except PlaywrightTimeoutError:
-        # во спротивно очекуваме грешка
-        expect_login_error(page, timeout=6000)
+    # една трка success vs. error – завршува штом се појави едното
+    outcome = main.wait_login_outcome(timeout=12000)
+    assert outcome in ("success", "error")
 
 
 @pytest.mark.login
-def test_login_password_whitespace_strict_fails(page):
+def test_login_password_whitespace_strict_fails(warm_main):
     """
     ЦЕЛ:
         - Да потврдиме дека ЛОЗИНКАТА е *строго* case/char sensitive и НЕ се trim-ира.
@@ -298,15 +253,14 @@ def test_login_password_whitespace_strict_fails(page):
     ОЧЕКУВАЊЕ:
         - Грешка (неуспешен login).
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
     main.login("admin", "  password  ")
-    expect_login_error(page)
+    expect_login_error(main.page)
 
 
 @pytest.mark.login
-def test_login_multiple_failed_then_success(page):
+def test_login_multiple_failed_then_success(warm_main):
     """
     ЦЕЛ:
         - „Throttle/lockout“ санитарна проверка: повеќе брзи неуспешни обиди
@@ -321,14 +275,45 @@ def test_login_multiple_failed_then_success(page):
         - Првите два обиди → грешка.
         - Третиот (валиден) → успех (админ UI видлив).
     """
-    main = MainPage(page)
-    main.goto_admin()
+    main = warm_main("admin")
 
-    # два брзи неуспешни обиди
-    for _ in range(2):
+    # два брзи неуспешни обиди; вториот се проверува дури откако backend-от
+    # одговорил и се појавил НОВ alert – стариот од првиот обид не се брои
+    main.login("admin", "wrongpass")
+    expect_login_error(main.page, timeout=5000)
+    main.page.eval_on_selector_all(ALERTS, "els => els.forEach(e => e.setAttribute('data-stale', ''))")
+    with main.page.expect_response(lambda r: r.url.endswith(LOGIN_API), timeout=5000) as response:
         main.login("admin", "wrongpass")
-        expect_login_error(page, timeout=5000)
+    assert response.value.status != 200, "Вториот погрешен обид беше прифатен"
+    main.wait_first([f"{a}:not([data-stale])" for a in ALERTS.split(", ")], timeout=5000)
 
     # веднаш потоа валиден обид
     main.login("admin", "password")
-    expect_login_success(page, timeout=15000)
+    expect_login_success(main.page, timeout=15000)
+
+
+# ---------------------- ADMIN SESSION (storage state) ------------------------
+
+@pytest.mark.login
+def test_admin_session_reused_without_login_form(admin_page, base_url):
+    """
+    ЦЕЛ:
+        - admin_page доаѓа со веќе зачуван token (storage_state), па /admin
+          веднаш го отвора админ UI-то без login форма.
+    """
+    main = MainPage(admin_page, base_url)
+    main.goto_admin()
+
+    expect_login_success(admin_page, timeout=15000)
+    assert not main.login_username_input.is_visible()
+
+
+@pytest.mark.login
+def test_admin_session_opens_messages(admin_page, base_url):
+    """
+    ЦЕЛ:
+        - Внатрешна админ страница (Messages) е достапна директно со зачуваната сесија.
+    """
+    admin_page.goto(f"{base_url}/admin/message")
+    admin_page.get_by_role("link", name="Logout").wait_for(timeout=15000)
+    assert "/admin" in admin_page.url
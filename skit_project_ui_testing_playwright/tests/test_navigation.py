@@ -2,9 +2,11 @@
 import pytest
 from pages.main_page import MainPage
 
+NAV_ITEMS = ("Rooms", "Booking", "Amenities", "Location", "Contact", "Admin")
+
 
 @pytest.mark.nav
-def test_top_nav_links_navigate(page):
+def test_top_nav_links_navigate(page, base_url):
     """
     Цел:
       - Потврда дека секој линк од NAVBAR те носи на соодветна секција/страница.
@@ -15,9 +17,13 @@ def test_top_nav_links_navigate(page):
     Очекување:
       - Да се појави клучен елемент за секоја дестинација.
     """
-    main = MainPage(page)
+    main = MainPage(page, base_url)
     main.goto_home()
 
+    # сите линкови од менито – една евалуација (текст + href)
+    links = main.query_elements({item: f"nav >> text={item}" for item in NAV_ITEMS}, attributes=("href",), wait=True)
+    assert all(link.attrs["href"] for link in links.values()), links
+
     # Rooms
     main.open_nav("Rooms")
     main.wait_any([
@@ -57,21 +63,21 @@ def test_top_nav_links_navigate(page):
 
 
 @pytest.mark.nav
-def test_brand_click_returns_home(page):
+def test_brand_click_returns_home(page, base_url):
     """
     Цел:
       - Клик на бренд-логото враќа на почетна.
     Очекување:
       - Да видиме booking секција или 'Check Availability' копче.
     """
-    main = MainPage(page)
+    main = MainPage(page, base_url)
     main.goto_contact()  # од друга страница
     main.brand_link.click()
     main.wait_any(["section#booking", "button:has-text('Check Availability')"])
 
 
 @pytest.mark.nav
-def test_rooms_book_now_opens_reservation(page):
+def test_rooms_book_now_opens_reservation(page, base_url):
     """
     Цел:
       - Од Rooms → 'Book now' отвора /reservation/... (не од footer, туку од секцијата).
@@ -81,7 +87,7 @@ def test_rooms_book_now_opens_reservation(page):
       3) Кликни 'Book now' токму во 'section#rooms' (scoped).
       4) Потврди URL содржи '/reservation/'.
     """
-    main = MainPage(page)
+    main = MainPage(page, base_url)
     main.goto_home()
     main.open_nav("Rooms")
 
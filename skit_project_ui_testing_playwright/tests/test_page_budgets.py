@@ -0,0 +1,78 @@
+# tests/test_page_budgets.py
+import pytest
+from perf import page_metrics
+from perf.page_metrics import (
+    PageBudgetExceeded,
+    PageBudgetWarning,
+    PageMetricsCollector,
+    check_budgets,
+    load_budgets,
+)
+from tests.helpers import FakePage, activated
+
+BUDGETS = {"home": {"fcp": 1800, "lcp": 2500}}
+
+
+@pytest.fixture
+def collector():
+    with activated(page_metrics, PageMetricsCollector(BUDGETS, "warn")) as active:
+        yield active
+
+
+@pytest.mark.perf
+def test_default_budgets_cover_every_goto_route():
+    budgets = load_budgets()
+    assert set(budgets) == {"home", "booking", "contact", "admin", "reservation"}
+    assert all(limit > 0 for limits in budgets.values() for limit in limits.values())
+
+
+@pytest.mark.perf
+def test_check_budgets_reports_only_breaches():
+    assert check_budgets("home", {"fcp": 900, "lcp": 2400}, BUDGETS) == []
+    # LCP=None (Firefox/WebKit) не е прекршување; рута без budget – исто
+    assert check_budgets("home", {"fcp": 900, "lcp": None}, BUDGETS) == []
+    assert check_budgets("admin", {"lcp": 99999}, BUDGETS) == []
+    assert check_budgets("home", {"fcp": 2000, "lcp": 3100}, BUDGETS) == [
+        "home: fcp 2000ms > budget 1800ms",
+        "home: lcp 3100ms > budget 2500ms",
+    ]
+
+
+@pytest.mark.perf
+def test_warn_mode_records_and_warns(collector):
+    page = FakePage(metrics={"time_origin": 1.0, "fcp": 500, "lcp": 3000})
+    with pytest.warns(PageBudgetWarning, match="lcp 3000ms"):
+        page_metrics.capture(page, "home")
+
+    assert page.states == ["load"]
+    [record] = collector.reset()
+    assert record["route"] == "home" and record["violations"] == ["home: lcp 3000ms > budget 2500ms"]
+
+
+@pytest.mark.perf
+def test_fail_mode_raises(collector):
+    collector.mode = "fail"
+    with pytest.raises(PageBudgetExceeded):
+        page_metrics.capture(FakePage(metrics={"time_origin": 1.0, "fcp": 2500}), "home")
+
+
+@pytest.mark.perf
+def test_same_document_navigation_is_not_counted_twice(collector):
+    # /#/booking по веќе вчитана почетна – ист timeOrigin, нема ново вчитување
+    page_metrics.capture(FakePage(metrics={"time_origin": 1.0, "fcp": 500}), "home")
+    page_metrics.capture(FakePage(metrics={"time_origin": 1.0, "fcp": 500}), "booking")
+    page_metrics.capture(FakePage(metrics={"time_origin": 2.0, "fcp": 500}), "booking")
+
+    assert [r["route"] for r in collector.reset()] == ["home", "booking"]
+
+    collector.start_test()                  # следен тест – истиот timeOrigin не е „same-document“
+    page_metrics.capture(FakePage(metrics={"time_origin": 2.0, "fcp": 500}), "home")
+    assert [r["route"] for r in collector.reset()] == ["home"]
+
+
+@pytest.mark.perf
+def test_capture_is_noop_when_disabled():
+    with activated(page_metrics, None):
+        page = FakePage(metrics={"fcp": 1})
+        assert page_metrics.capture(page, "home") is None
+        assert page.states == []
@@ -0,0 +1,91 @@
+# tests/test_page_pool.py
+from types import SimpleNamespace
+
+import pytest
+from perf import routing
+from perf.page_pool import PagePool
+from tests.helpers import FakeContext, FakeRoute
+
+BASE = "http://127.0.0.1:9"
+
+
+@pytest.fixture
+def log():
+    return []
+
+
+def _pool(log, size=2):
+    return PagePool(lambda: FakeContext(log), BASE, size=size)
+
+
+@pytest.mark.perf
+def test_first_checkout_fills_route_and_later_ones_are_warm(log):
+    pool = _pool(log)
+    page = pool.checkout("contact")
+
+    assert log == [(f"{BASE}/#/contact", "commit")] * 2       # двете се вчитуваат паралелно
+    assert len(pool.warm["contact"]) == 1 and pool.stats["hits"] == 1
+
+    page.set_viewport_size({"width": 375, "height": 667})
+    log.clear()
+    pool.checkin(page, "contact")
+    assert log == ["evaluate", "clear_cookies", ("about:blank", "load"), (f"{BASE}/#/contact", "commit")]
+    assert page.viewport_size == {"width": 1280, "height": 720}
+    assert pool.checkout("contact") is not page and pool.checkout("contact") is page
+    assert pool.stats["misses"] == 0
+
+
+@pytest.mark.perf
+def test_empty_pool_falls_back_to_cold_page(log):
+    pool = _pool(log, size=0)
+    page = pool.checkout("admin")
+    pool.checkin(page, "admin")
+
+    assert log == [(f"{BASE}/admin", "load")]
+    assert page.context.closed and pool.stats["misses"] == 1 and pool.stats["hits"] == 0
+    with pytest.raises(KeyError):
+        pool.checkout("nowhere")
+
+
+@pytest.mark.perf
+def test_broken_pages_are_discarded(log):
+    pool = _pool(log)
+    pool.checkout("home")
+    crashed = pool.warm["home"][0]
+    crashed.broken = True
+    page = pool.checkout("home")                      # crashed се фрла → ладна страница
+
+    assert page is not crashed and crashed.context.closed
+    page.context.close()                              # тестот го затворил context-от
+    pool.checkin(page, "home")
+    assert pool.warm["home"] == [] and pool.stats["discarded"] == 2
+    pool.close()
+
+
+@pytest.mark.perf
+def test_plugin_sums_stats_of_all_pools(log):
+    from plugins.page_pool import PagePoolPlugin
+
+    config = SimpleNamespace(workerinput={}, workeroutput={})
+    plugin = PagePoolPlugin(config)
+    plugin.pools = [_pool(log, size=0), _pool(log, size=0)]      # по еден pool по routing профил
+    for pool in plugin.pools:
+        pool.checkin(pool.checkout("home"), "home")
+    plugin.pytest_sessionfinish(None)
+
+    assert config.workeroutput["page_pool"]["misses"] == 2
+
+
+@pytest.mark.perf
+def test_recycled_page_keeps_the_routing_profile(log):
+    stats = routing.RoutingStats()
+    pool = PagePool(lambda: routing.apply(FakeContext(log), routing.get_profile("functional"), stats, BASE),
+                    BASE, size=1)
+    page = pool.checkout("home")
+    pool.checkin(page, "home")
+    assert pool.checkout("home") is page                      # втор checkout на истиот context
+
+    route = FakeRoute(f"{BASE}/images/room1.svg", resource_type="image")
+    for handler in page.context.routes:
+        handler(route)
+    assert route.outcome == "blockedbyclient" and stats.blocked == {"image": 1}
@@ -0,0 +1,41 @@
+# tests/test_parallel_plugin.py
+import os
+import subprocess
+import sys
+
+import pytest
+from plugins.parallel import merge_durations, order_longest_first, suite_key
+
+
+@pytest.mark.perf
+def test_order_longest_first_uses_median_for_unknown():
+    durations = {"a": 1.0, "b": 9.0, "c": 3.0}
+    # "new" нема историја → добива медијана (3.0), а со ист број се сортира по име
+    assert order_longest_first(["a", "new", "b", "c"], durations) == ["b", "c", "new", "a"]
+
+
+@pytest.mark.perf
+def test_merge_durations_smooths_and_keeps_unseen():
+    merged = merge_durations({"a": 10.0, "b": 2.0}, {"a": 4.0, "c": 1.0}, alpha=0.5)
+    assert merged == {"a": 7.0, "b": 2.0, "c": 1.0}
+
+
+@pytest.mark.perf
+def test_suite_key_ignores_order_but_not_subsets():
+    full = ["t.py::a", "t.py::b", "u.py::c"]
+    assert suite_key(full) == suite_key(reversed(full))
+    assert suite_key(full[:2]) != suite_key(full)           # -k/-m подмножество – друг сериски baseline
+
+
+@pytest.mark.perf
+def test_plugin_runs_without_cacheprovider(tmp_path):
+    # -p no:cacheprovider → config.cache не постои; plugin-от треба само да не памети траења
+    (tmp_path / "test_one.py").write_text("def test_one():\n    pass\n", encoding="utf-8")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-p", "plugins.parallel", str(tmp_path)],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "1 passed" in result.stdout
@@ -0,0 +1,46 @@
+# tests/test_query_elements.py
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from pages.main_page import QUERY_ELEMENTS_JS, ElementState, MainPage
+
+
+class FakePage:
+    """Само page.evaluate; локаторите од MainPage.__init__ не се користат."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def evaluate(self, script, arg):
+        self.calls.append((script, arg))
+        return self.result
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def _state(visible, box=None, **attrs):
+    return {"count": int(visible), "visible": visible, "text": "x" if visible else None, "attrs": attrs, "box": box}
+
+
+@pytest.mark.perf
+def test_all_selectors_in_one_evaluation():
+    page = FakePage({"user": _state(True, {"x": 1, "y": 2, "width": 3, "height": 4}, type="text"),
+                     "alert": _state(False)})
+    states = MainPage(page, "http://site").query_elements({"user": "#username", "alert": ".alert"},
+                                                         attributes=("type",), wait=["user"], timeout=500)
+
+    assert page.calls == [(QUERY_ELEMENTS_JS, {"selectors": {"user": "#username", "alert": ".alert"},
+                                               "attributes": ["type"], "wait": ["user"], "timeout": 500})]
+    assert states["user"] == ElementState(1, True, "x", {"type": "text"}, {"x": 1, "y": 2, "width": 3, "height": 4})
+    assert not states["alert"].visible and states["alert"].box is None
+
+
+@pytest.mark.perf
+def test_waited_names_must_be_visible():
+    main = MainPage(FakePage({"price": _state(True), "firstname": _state(False)}), "http://site")
+
+    with pytest.raises(PlaywrightTimeoutError, match="firstname"):
+        main.query_elements({"price": "text=Price Summary", "firstname": "#firstname"}, wait=True, timeout=10)
+    with pytest.raises(KeyError):
+        main.query_elements({"price": "text=Price Summary"}, wait=["firstname"])
@@ -0,0 +1,122 @@
+# tests/test_restful_booker.py
+# =============================================================================
+# Проверки за локалниот restful-booker (mocks/restful_booker.py) – статусите
+# мора да се исти како кај оригиналот, за да важат Gatling/crud_load checks.
+# Без browser; барањата одат со urllib.
+# =============================================================================
+
+import json
+import random
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+from mocks.restful_booker import BookingStore, Fault, Latency, RestfulBookerServer
+from perf.crud_load import CrudSettings, booking_payload, evaluate_assertions, run_crud_load
+from tests.helpers import run_async
+
+
+@pytest.fixture(scope="module")
+def api():
+    with RestfulBookerServer() as server:
+        yield server
+
+
+def _call(api, method: str, path: str, payload=None, cookie: str = ""):
+    data = json.dumps(payload).encode() if payload is not None else None
+    req = Request(f"{api.url}{path}", data=data, method=method,
+                  headers={"Content-Type": "application/json", "Cookie": cookie})
+    try:
+        with urlopen(req, timeout=5) as resp:
+            body = resp.read()
+            status = resp.status
+    except HTTPError as e:
+        body, status = e.read(), e.code
+    try:
+        return status, json.loads(body)
+    except ValueError:
+        return status, body.decode()
+
+
+def _token(api) -> str:
+    return _call(api, "POST", "/auth", {"username": "admin", "password": "password123"})[1]["token"]
+
+
+@pytest.mark.api
+def test_ping_and_auth(api):
+    assert _call(api, "GET", "/ping") == (201, "Created")
+    assert _call(api, "POST", "/auth", {"username": "admin", "password": "nope"}) == (200, {"reason": "Bad credentials"})
+    assert len(_token(api)) == 15
+
+
+@pytest.mark.api
+def test_crud_with_cookie_token(api):
+    token = _token(api)
+    status, created = _call(api, "POST", "/booking", booking_payload(random.Random(1)))
+    assert status == 200
+    booking_id = created["bookingid"]
+    assert _call(api, "GET", f"/booking/{booking_id}") == (200, created["booking"])
+
+    update = booking_payload(random.Random(2))
+    assert _call(api, "PUT", f"/booking/{booking_id}", update, f"token={token}") == (200, update)
+    status, patched = _call(api, "PATCH", f"/booking/{booking_id}", {"firstname": "Мила"}, f"token={token}")
+    assert status == 200 and patched["firstname"] == "Мила" and patched["lastname"] == update["lastname"]
+
+    assert _call(api, "DELETE", f"/booking/{booking_id}", cookie=f"token={token}") == (201, "Created")
+    assert _call(api, "GET", f"/booking/{booking_id}") == (404, "Not Found")
+
+
+@pytest.mark.api
+def test_bad_token_and_bad_payload(api):
+    booking_id = _call(api, "POST", "/booking", booking_payload())[1]["bookingid"]
+    assert _call(api, "PUT", f"/booking/{booking_id}", booking_payload(), "token=BADTOKEN") == (403, "Forbidden")
+    assert _call(api, "DELETE", f"/booking/{booking_id}", cookie="token=BADTOKEN") == (403, "Forbidden")
+    assert _call(api, "POST", "/booking", {"firstname": "Мила"})[0] == 500
+
+
+@pytest.mark.api
+def test_list_filters(api):
+    api.reset()
+    first = booking_payload(random.Random(5))
+    first["firstname"] = "Filtered"
+    booking_id = _call(api, "POST", "/booking", first)[1]["bookingid"]
+    _call(api, "POST", "/booking", booking_payload(random.Random(6)))
+
+    assert _call(api, "GET", "/booking?firstname=Filtered") == (200, [{"bookingid": booking_id}])
+    assert len(_call(api, "GET", "/booking")[1]) == 2
+
+
+@pytest.mark.api
+def test_store_holds_tens_of_thousands():
+    store = BookingStore()
+    store.seed(50_000, random.Random(1))
+
+    assert len(store) == 50_000
+    assert sum(1 for _ in store.filter(firstname="User7")) > 0
+
+
+@pytest.mark.api
+def test_latency_and_error_injection():
+    faults = {"ping": Fault(Latency("fixed", 50)), "get": Fault(error_rate=1.0)}
+    with RestfulBookerServer(faults=faults, seed=1) as slow:
+        started = time.perf_counter()
+        assert _call(slow, "GET", "/ping")[0] == 201
+        assert time.perf_counter() - started >= 0.05
+        assert _call(slow, "GET", "/booking/1")[0] == 503
+
+    assert Latency.parse("uniform:10:50") == Latency("uniform", 10, 50)
+    with pytest.raises(ValueError):
+        RestfulBookerServer(faults={"nope": Fault()})
+
+
+@pytest.mark.api
+def test_crud_load_passes_against_stand_in():
+    with RestfulBookerServer(faults={"*": Fault(Latency("uniform", 1, 5))}, seed=3) as api:
+        settings = CrudSettings(base_url=api.url, duration_sec=2, ramp_users=10, target_rps=100,
+                                negative_users_per_sec=5, negative_during_sec=1, throttle_ramp_sec=0)
+        stats = run_async(run_crud_load(settings, seed=3))
+
+    assert stats.count("CreateToken") == 15
+    assert stats.count("UpdateBooking - Invalid Token") == 5
+    assert all(a.ok for a in evaluate_assertions(stats))
@@ -0,0 +1,62 @@
+# tests/test_routing.py
+import pytest
+from perf.routing import PROFILES, RoutingStats, apply, get_profile, size_key
+from tests.helpers import FakeContext, FakeRequest, FakeResponse, FakeRoute
+
+SITE = "http://127.0.0.1:8123"
+
+
+@pytest.mark.perf
+def test_functional_profile_blocks_assets_and_external_hosts():
+    functional = get_profile("functional")
+
+    assert functional.reason(f"{SITE}/images/room1.svg", "image", "127.0.0.1:8123") == "image"
+    assert functional.reason("https://fonts.gstatic.com/x.woff2", "font", "127.0.0.1:8123") == "font"
+    assert functional.reason("https://maps.example.com/embed.js", "script", "127.0.0.1:8123") == "external"
+    assert functional.reason(f"{SITE}/api/room", "fetch", "127.0.0.1:8123") is None
+    assert functional.reason("data:image/png;base64,AAAA", "other", "127.0.0.1:8123") is None
+    assert not PROFILES["full-fidelity"].blocks_anything
+    with pytest.raises(ValueError):
+        get_profile("fast")
+
+
+@pytest.mark.perf
+def test_bytes_saved_come_from_sizes_seen_in_full_fidelity(tmp_path):
+    stats = RoutingStats()
+    full = apply(FakeContext(), get_profile("full-fidelity"), stats, SITE)
+    full.handlers["response"](FakeResponse(FakeRequest(f"{SITE}/images/room1.svg", resource_type="image"),
+                                            headers={"content-length": "2048"}))
+    full.handlers["response"](FakeResponse(FakeRequest(f"{SITE}/api/room"), headers={"content-length": "512"}))   # не би се блокирало
+    assert full.routes == [] and stats.sizes == {"/images/room1.svg": 2048}
+
+    stats.save_sizes(tmp_path / "sizes.json")
+    stats = RoutingStats.load(tmp_path / "sizes.json")
+    functional = apply(FakeContext(), get_profile("functional"), stats, "http://127.0.0.1:9999")   # нова порта
+    routes = [FakeRoute(url, resource_type=kind) for url, kind in (
+        ("http://127.0.0.1:9999/images/room1.svg", "image"),
+        ("http://127.0.0.1:9999/images/map.svg", "image"),
+        ("http://127.0.0.1:9999/api/room", "fetch"),
+    )]
+    for route in routes:
+        functional.routes[0](route)
+
+    assert [r.outcome for r in routes] == ["blockedbyclient", "blockedbyclient", "fallback"]
+    assert stats.as_dict() == {"blocked": {"image": 2}, "saved_bytes": 2048, "unknown": 1}
+    assert size_key("https://cdn.example.com/a.js", "127.0.0.1:9999") == "https://cdn.example.com/a.js"
+
+
+@pytest.mark.perf
+def test_controller_merges_worker_sizes_and_writes_once(tmp_path):
+    from types import SimpleNamespace
+    from plugins.routing import RoutingPlugin
+
+    options = {"routing_profile": "functional", "resource_sizes_file": "sizes.json"}
+    config = SimpleNamespace(getoption=options.get, rootpath=tmp_path)
+    plugin = RoutingPlugin(config)
+    for sizes in ({"/a.svg": 10}, {"/b.woff2": 20}):            # два workers
+        output = {"blocked": {"image": 1}, "saved_bytes": 0, "unknown": 1, "sizes": sizes}
+        plugin.pytest_testnodedown(SimpleNamespace(workeroutput={"routing": output}), None)
+    plugin.pytest_sessionfinish(None)
+
+    assert RoutingStats.load(tmp_path / "sizes.json").sizes == {"/a.svg": 10, "/b.woff2": 20}
+    assert plugin.total.blocked == {"image": 2} and list(tmp_path.glob("*.tmp")) == []
@@ -0,0 +1,122 @@
+# tests/test_slots.py
+import json
+import threading
+from datetime import date, timedelta
+from types import SimpleNamespace
+from urllib.request import Request, urlopen
+
+import pytest
+from mocks import ShadyMeadowsServer
+from perf.slots import Slot, SlotAllocator, SlotGrid, SlotsExhausted, site_occupancy, site_rooms
+
+START = date(2030, 1, 1)
+
+
+def _overlap(a: Slot, b: Slot) -> bool:
+    return a.room_id == b.room_id and a.checkin < b.checkout and b.checkin < a.checkout
+
+
+@pytest.mark.perf
+def test_grid_maps_indices_to_disjoint_slots():
+    grid = SlotGrid([1, 2, 3], START, nights=2)
+    slots = [grid.slot(i) for i in range(30)]
+
+    assert slots[0] == Slot(1, START, START + timedelta(days=2))
+    assert slots[4] == Slot(2, START + timedelta(days=3), START + timedelta(days=5))
+    assert not any(_overlap(a, b) for i, a in enumerate(slots) for b in slots[i + 1:])
+    assert slots[0].ddmmyyyy() == ("01/01/2030", "03/01/2030")
+
+
+@pytest.mark.perf
+def test_concurrent_allocators_never_overlap(tmp_path):
+    # посебен allocator по нишка = посебен процес; делат само lease директориум
+    taken = []
+
+    def _worker(n: int):
+        allocator = SlotAllocator(tmp_path, [1, 2], start=START, owner=f"w{n}")
+        for i in range(10):
+            taken.append(allocator.acquire(nights=1 + i % 3))
+
+    threads = [threading.Thread(target=_worker, args=(n,)) for n in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(taken) == 60
+    assert not any(_overlap(a, b) for i, a in enumerate(taken) for b in taken[i + 1:])
+
+
+@pytest.mark.perf
+def test_free_slots_skip_leases_and_occupied_nights(tmp_path):
+    occupied = {1: [(START, START + timedelta(days=2))], 2: []}
+    allocator = SlotAllocator(tmp_path, [1, 2], start=START, occupied=lambda room: occupied[room])
+
+    first = allocator.acquire()
+    assert first == Slot(2, START, START + timedelta(days=1))
+    # lookup не закупува – два повика враќаат исто
+    assert allocator.free_slots(limit=2) == allocator.free_slots(limit=2) == [
+        Slot(2, START + timedelta(days=1), START + timedelta(days=2)),
+        Slot(1, START + timedelta(days=2), START + timedelta(days=3)),
+    ]
+
+    allocator.release(first)
+    assert allocator.acquire(room_ids=[2]) == first
+
+
+@pytest.mark.perf
+def test_allocator_reports_exhausted_horizon(tmp_path):
+    allocator = SlotAllocator(tmp_path, [1], start=START, horizon_days=3)
+    allocator.acquire(nights=2)
+    with pytest.raises(SlotsExhausted):
+        allocator.acquire(nights=2)   # остана само ноќта 03/01 – премалку
+
+
+@pytest.mark.api
+def test_site_lookups_see_existing_bookings(tmp_path):
+    with ShadyMeadowsServer() as site:
+        rooms = site_rooms(site.url)
+        booking = {"roomid": rooms[0], "firstname": "Мила", "lastname": "Тестова",
+                   "email": "mila.tester@example.com", "phone": "+38971234567",
+                   "bookingdates": {"checkin": START.isoformat(), "checkout": "2030-01-03"}}
+        req = Request(f"{site.url}/api/booking", data=json.dumps(booking).encode(), method="POST",
+                      headers={"Content-Type": "application/json"})
+        with urlopen(req, timeout=5) as resp:
+            assert resp.status == 201
+
+        allocator = SlotAllocator(tmp_path, rooms, start=START, occupied=site_occupancy(site.url))
+        assert list(site_occupancy(site.url)(rooms[0])) == [(START, date(2030, 1, 3))]
+        assert allocator.acquire(room_ids=rooms[:1]).checkin == date(2030, 1, 3)
+        # booking_slot teardown: резервираниот слот останува закупен, другите се враќаат
+        assert allocator.booked(Slot(rooms[0], START, START + timedelta(days=1)))
+        assert not allocator.booked(Slot(rooms[0], date(2030, 1, 3), date(2030, 1, 4)))
+
+    assert site_rooms(site.url, timeout=1) == []   # серверот е спуштен → без соби, без грешка
+
+
+@pytest.mark.api
+def test_ui_runner_booking_slots_skip_nights_booked_by_a_previous_run(monkeypatch):
+    from perf import ui_runner
+    from tests.helpers import run_async
+
+    booked = []
+
+    async def _book(main, index, slot):                  # без browser: резервација директно преку API
+        body = {"roomid": slot.room_id, "firstname": "Мила", "lastname": "Тестова",
+                "email": f"load.user{index}@example.com", "phone": "+38971234567",
+                "bookingdates": dict(zip(("checkin", "checkout"), slot.iso()))}
+        req = Request(f"{main.base_url}/api/booking", data=json.dumps(body).encode(), method="POST",
+                      headers={"Content-Type": "application/json"})
+        with urlopen(req, timeout=5) as resp:
+            assert resp.status == 201
+        booked.append(slot)
+
+    monkeypatch.setattr(ui_runner, "_book", _book)
+    with ShadyMeadowsServer() as site:
+        main = SimpleNamespace(base_url=site.url)
+        for _ in range(2):                               # два посебни runs против истиот сервер
+            ui_runner._booking_slots.cache_clear()
+            run_async(ui_runner.booking_scenario(main, 0))       # ист index
+    ui_runner._booking_slots.cache_clear()
+
+    assert len(booked) == 2 and not _overlap(*booked)
@@ -1,4 +1,4 @@
-def test_open_home(page):
-    page.goto("https://automationintesting.online")
+def test_open_home(page, base_url):
+    page.goto(base_url)
     assert "Restful" in page.title()
 
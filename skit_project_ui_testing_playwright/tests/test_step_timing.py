@@ -0,0 +1,85 @@
+# tests/test_step_timing.py
+import asyncio
+import json
+
+import pytest
+from perf import step_timing
+from perf.step_timing import StepRecorder, percentile, summarize, timed, timed_methods
+from tests.helpers import activated, run_async
+
+
+@timed_methods
+class _FakePage:
+    def outer(self):
+        self.inner()
+        self._private()
+
+    def inner(self):
+        pass
+
+    def _private(self):
+        pass
+
+    async def async_step(self):
+        self.inner()
+
+
+@pytest.fixture
+def recorder():
+    # привремено сопствен recorder; глобалниот (од --step-timing) се враќа после
+    with activated(step_timing, StepRecorder()) as active:
+        yield active
+
+
+@pytest.mark.perf
+def test_public_methods_are_timed_with_nesting(recorder):
+    timed("helper")(_FakePage().outer)()
+
+    paths = [r["path"] for r in recorder.records]
+    # внатрешните завршуваат прв; приватните методи не се мерат
+    assert paths == ["helper > outer > inner", "helper > outer", "helper"]
+    assert [r["depth"] for r in recorder.records] == [2, 1, 0]
+
+
+@pytest.mark.perf
+def test_async_methods_nest_per_task(recorder):
+    async def _run():
+        await asyncio.gather(_FakePage().async_step(), _FakePage().async_step())
+
+    run_async(_run())
+    assert sorted(r["path"] for r in recorder.records) == [
+        "async_step", "async_step", "async_step > inner", "async_step > inner",
+    ]
+
+
+@pytest.mark.perf
+def test_disabled_records_nothing(recorder):
+    step_timing.disable()
+    _FakePage().outer()
+    assert recorder.records == []
+
+
+@pytest.mark.perf
+def test_summary_percentiles():
+    records = [{"step": "goto_home", "duration": d} for d in range(1, 21)]
+    (row,) = summarize(records)
+    assert (row["count"], row["p50"], row["p95"], row["max"]) == (20, 10.5, 19, 20)
+    assert percentile([], 95) == 0.0
+
+
+@pytest.mark.perf
+def test_controller_merges_worker_records(tmp_path):
+    from types import SimpleNamespace
+    from plugins.step_timing import StepTimingPlugin
+
+    options = {"step_timing_file": str(tmp_path / "run.json")}
+    config = SimpleNamespace(getoption=options.get, rootpath=tmp_path)
+    with activated(step_timing):
+        plugin = StepTimingPlugin(config)
+        plugin.recorder.records.append({"step": "goto_home", "duration": 1.0})
+        worker = {"step": "goto_booking", "duration": 2.0}
+        plugin.pytest_testnodedown(SimpleNamespace(workeroutput={"step_timings": [worker]}), None)
+        plugin.pytest_testnodedown(SimpleNamespace(), None)   # worker што паднал
+        plugin.pytest_sessionfinish(None)
+    steps = json.loads(plugin.path.read_text(encoding="utf-8"))["steps"]
+    assert sorted(s["step"] for s in steps) == ["goto_booking", "goto_home"]
@@ -0,0 +1,34 @@
+# tests/test_submit_watch.py
+import pytest
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from pages.main_page import CLIENT_VALIDATION_GRACE_MS, CONTACT_API, SubmitResult, SubmitWatch
+from tests.helpers import FakeRequest, FakeResponse
+
+SITE = "http://127.0.0.1:8123"
+
+
+@pytest.mark.perf
+def test_sent_post_is_decided_by_the_backend_only():
+    watch = SubmitWatch(CONTACT_API)
+    request = FakeRequest(f"{SITE}{CONTACT_API}", method="POST")
+    watch.on_request(FakeRequest(f"{SITE}{CONTACT_API}", method="GET"))       # не е наш
+    watch.on_request(request)
+
+    # POST тргнал → нема проверка на клиентска валидација, се чека одговорот
+    assert watch.outcome(CLIENT_VALIDATION_GRACE_MS * 2, 5000) is None
+    assert not watch.may_check_client(CLIENT_VALIDATION_GRACE_MS * 2)
+    watch.on_response(FakeResponse(request, 400))
+    assert watch.outcome(10, 5000) == SubmitResult(False, 400, "response")
+
+
+@pytest.mark.perf
+def test_client_validation_only_after_grace_and_timeout_is_not_a_rejection():
+    watch = SubmitWatch(CONTACT_API)
+    assert not watch.may_check_client(CLIENT_VALIDATION_GRACE_MS - 1)
+    assert watch.may_check_client(CLIENT_VALIDATION_GRACE_MS)
+    with pytest.raises(PlaywrightTimeoutError):
+        watch.outcome(5000, 5000)
+
+    watch.on_request_failed(FakeRequest(f"{SITE}{CONTACT_API}/", method="POST", failure="net::ERR_CONNECTION_RESET"))
+    with pytest.raises(PlaywrightError, match="ERR_CONNECTION_RESET"):
+        watch.outcome(10, 5000)
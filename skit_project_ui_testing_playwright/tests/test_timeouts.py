@@ -0,0 +1,86 @@
+# tests/test_timeouts.py
+import pytest
+from perf import timeouts
+from perf.history import HistoryDB, pytest_samples
+from perf.timeouts import TimeoutPolicy, adaptive, adaptive_timeouts
+from tests.helpers import run_async
+
+
+@adaptive_timeouts(skip=("wait_any",))
+class FakePage:
+    def __init__(self):
+        self.seen = []
+
+    def wait_any(self, selectors, timeout: int = 20000):
+        self.seen.append(("wait_any", timeout))
+
+    def wait_booking_confirmed(self, timeout: int = 25000):
+        self.seen.append(("wait_booking_confirmed", timeout))
+        self.wait_any([], timeout=timeout)
+
+    def goto(self, url):
+        self.seen.append(("goto", url))
+
+    async def wait_heading(self, timeout: int = 10000):
+        self.seen.append(("wait_heading", timeout))
+
+
+@pytest.fixture
+def policy():
+    policy = timeouts.enable(TimeoutPolicy({"wait_booking_confirmed": 1200, "wait_heading": 100,
+                                            "wait_any": 50, "expect_error": 900}))
+    yield policy
+    timeouts.disable()
+
+
+@pytest.mark.perf
+def test_limit_is_p99_times_factor_between_floor_and_cap():
+    policy = TimeoutPolicy({"fast": 100, "normal": 1200, "slow": 20000})
+
+    assert policy.limit("fast", 25000) == 2000           # floor
+    assert policy.limit("normal", 25000) == 3600         # 3 × p99
+    assert policy.limit("slow", 25000) == 25000          # hard-coded вредноста е cap
+    assert policy.limit("unknown", 7000) == 7000
+    assert policy.used == {"fast": (2000, 25000), "normal": (3600, 25000), "slow": (25000, 25000)}
+
+
+@pytest.mark.perf
+def test_outermost_method_is_adapted_and_nested_waits_pass_through(policy):
+    page = FakePage()
+    page.wait_booking_confirmed()
+    page.wait_any([])                                    # skip → генерички wait не се менува
+    page.wait_booking_confirmed(timeout=3000)            # експлицитен timeout е cap
+    page.goto("/")
+
+    assert page.seen == [("wait_booking_confirmed", 3600), ("wait_any", 3600), ("wait_any", 20000),
+                         ("wait_booking_confirmed", 3000), ("wait_any", 3000), ("goto", "/")]
+
+
+@pytest.mark.perf
+def test_async_methods_and_helpers_without_policy(policy):
+    page = FakePage()
+    run_async(page.wait_heading())
+
+    @adaptive("expect_error")
+    def expect_error(page, timeout: int = 7000):
+        return timeout
+
+    assert page.seen == [("wait_heading", 2000)]
+    assert expect_error(page) == 2700 and expect_error(page, timeout=1000) == 1000
+    timeouts.disable()
+    assert expect_error(page) == 7000
+
+
+@pytest.mark.perf
+def test_from_history_uses_max_p99_of_recent_runs(tmp_path):
+    with HistoryDB(tmp_path / "history.sqlite") as db:
+        for i, p99 in enumerate((0.8, 1.1, 0.9)):
+            steps = [{"step": "wait_booking_confirmed", "count": 5, "p50": 0.5, "p95": 0.7, "p99": p99,
+                      "max": p99, "total": 3}]
+            if i == 0:
+                steps.append({"step": "rare_step", "count": 1, "p50": 1, "p95": 1, "p99": 1, "max": 1, "total": 1})
+            db.add_run("pytest", pytest_samples({}, steps), environment="local", started=1000 + i)
+
+        policy = TimeoutPolicy.from_history(db, "local", min_runs=3)
+        assert policy.p99_ms == {"wait_booking_confirmed": pytest.approx(1100)}
+        assert TimeoutPolicy.from_history(db, "https://automationintesting.online").p99_ms == {}
@@ -6,22 +6,31 @@
 #  1) Мобилен navbar: да колапсира (hamburger) и да може да се отвори/навигацијата да работи
 #  2) Десктоп navbar: да е „расклопен“ (без hamburger) и навигацијата да работи директно
 #  3) Резервациска страница layout: на десктоп "Price Summary" десно од формата,
-#    а на мобилен стакнато под формата (проверка со bounding_box координати)
+#    а на мобилен стакнато под формата (perf/layout.py – матрица од viewports
+#    во една вчитана страница)
+#  4) Визуелна регресија: home/reservation на phone/tablet/desktop наспроти
+#    baseline screenshots (perf/visual.py, `--visual-update` за нови)
 #
 # Забелешки:
 #  - Користиме MainPage.open_nav() која ја скопира кликовите на <nav> (не на footer).
 #  - За layout тестот одиме директно на /reservation/1 со конкретни датуми за да се вчита стабилно UI-то.
+#  - Layout зависи од слики/фонтови → целиот фајл е "full-fidelity" (perf/routing.py
+#    ги блокира само во функционалните тестови).
 # =============================================================================
 
 import pytest
 from pages.main_page import MainPage
+from perf import layout
 
 MOBILE  = {"width": 375,  "height": 812}
 DESKTOP = {"width": 1366, "height": 800}
+LG_BREAKPOINT = 992     # Bootstrap col-lg-*: од тука формата и Price Summary се една до друга
+
+pytestmark = pytest.mark.routing_profile("full-fidelity")
 
 
 @pytest.mark.ui
-def test_navbar_collapses_on_mobile(page):
+def test_navbar_collapses_on_mobile(page, base_url):
     """
     Што тестираме:
       - На мал viewport (мобилен) горното мени се колапсира и се појавува hamburger копчето.
@@ -35,7 +44,7 @@ def test_navbar_collapses_on_mobile(page):
       - Да видиме клучен елемент од Rooms (section#rooms / „Book now“ итн.)
     """
     page.set_viewport_size(MOBILE)
-    main = MainPage(page)
+    main = MainPage(page, base_url)
     main.goto_home()
 
     assert main.nav_toggler.is_visible(), "На мобилен очекуваме hamburger копче."
@@ -48,7 +57,7 @@ def test_navbar_collapses_on_mobile(page):
 
 
 @pytest.mark.ui
-def test_navbar_is_expanded_on_desktop(page):
+def test_navbar_is_expanded_on_desktop(page, base_url):
     """
     Што тестираме:
       - На десктоп, hamburger обично не е видлив и може да се кликне директно на нав-линкот.
@@ -61,7 +70,7 @@ def test_navbar_is_expanded_on_desktop(page):
       - Да се појави Rooms секцијата.
     """
     page.set_viewport_size(DESKTOP)
-    main = MainPage(page)
+    main = MainPage(page, base_url)
     main.goto_home()
 
     # Не е критериум да НЕ постои hamburger, но ако постои, најчесто е скриен.
@@ -80,51 +89,62 @@ def test_navbar_is_expanded_on_desktop(page):
 
 
 @pytest.mark.ui
-def test_reservation_layout_mobile_vs_desktop(page):
+def test_reservation_layout_mobile_vs_desktop(page, base_url):
     """
     Што тестираме (layout):
-      - На десктоп: 'Price Summary' е десно од формата (значително поголем X).
-      - На мобилен: 'Price Summary' се стакнува под формата (значително поголем Y).
+      - На десктоп (>= 992px): 'Price Summary' е десно од формата (значително поголем X).
+      - На мобилен/таблет (< 992px): 'Price Summary' се стакнува под формата (значително поголем Y).
+      - На секој viewport двата елементи се видливи и без хоризонтален overflow.
     Како:
       1) Одиме директно на /reservation/1 со валидни датуми (за да се вчита UI стабилно).
-      2) DESKTOP viewport → спореди bounding_box на 'Price Summary' и input 'Firstname'.
-      3) MOBILE viewport + reload → повторно спореди bounding_box.
+      2) Една вчитана страница → perf/layout.snapshot ги мери елементите низ
+         цела матрица од viewports (телефони, таблети, десктоп), без reload и
+         без sleep – чека resize/reflow да се смири.
+      3) Правилата се проверуваат одеднаш врз табелата со геометрија.
     Очекување:
-      - DESKTOP: price_summary.x > firstname.x + 250 (значи десно од формата)
-      - MOBILE:  price_summary.y > firstname.y + 150 (значи под формата)
+      - DESKTOP: price.x > firstname.x + 250 (значи десно од формата)
+      - MOBILE:  price.y > firstname.y + 150 (значи под формата)
     """
-    # 1) Десктоп распоред
-    page.set_viewport_size(DESKTOP)
-    page.goto("https://automationintesting.online/reservation/1?checkin=2025-09-26&checkout=2025-09-27")
-
-    price = page.get_by_text("Price Summary").first
-    fname = page.get_by_placeholder("Firstname").first
-
-    price.wait_for(timeout=20000)
-    fname.wait_for(timeout=20000)
-
-    b_price = price.bounding_box()
-    b_fname = fname.bounding_box()
-    assert b_price and b_fname, "Не можев да ги земам координатите за елементите."
-
-    assert b_price["x"] > b_fname["x"] + 250, \
-        "На десктоп 'Price Summary' треба да е десно од формата (значително поголем X)."
-
-    # 2) Мобилен распоред (стакнато)
-    page.set_viewport_size(MOBILE)
-    page.reload()  # форсирај reflow на layout
-    # кратка пауза за да 'пресече' CSS layout-от по resize
-    page.wait_for_timeout(300)
+    page.goto(f"{base_url}/reservation/1?checkin=2025-09-26&checkout=2025-09-27")
+    elements = {"price": "text=Price Summary", "firstname": "input[placeholder='Firstname']"}
+    MainPage(page, base_url).query_elements(elements, wait=True, timeout=20000)
+
+    table = layout.snapshot(page, elements)
+    failures = table.check([
+        layout.visible("price"),
+        layout.visible("firstname"),
+        layout.inside_viewport("price"),
+        layout.inside_viewport("firstname"),
+        layout.right_of("price", "firstname", gap=250, min_width=LG_BREAKPOINT),
+        layout.below("price", "firstname", gap=150, max_width=LG_BREAKPOINT),
+    ])
+    assert not failures, "\n".join(failures) + "\n" + table.format()
 
-    price = page.get_by_text("Price Summary").first
-    fname = page.get_by_placeholder("Firstname").first
 
-    price.wait_for(timeout=20000)
-    fname.wait_for(timeout=20000)
+VISUAL_ROUTES = {
+    "home": "/",
+    "reservation": "/reservation/1?checkin=2025-09-26&checkout=2025-09-27",
+}
+VISUAL_VIEWPORTS = [v for v in layout.VIEWPORTS if v.name in ("phone", "tablet", "desktop")]
 
-    b_price = price.bounding_box()
-    b_fname = fname.bounding_box()
-    assert b_price and b_fname, "Не можев да ги земам координатите за елементите (mobile)."
 
-    assert b_price["y"] > b_fname["y"] + 150, \
-        "На мобилен 'Price Summary' треба да биде под формата (значително поголем Y)."
+@pytest.mark.ui
+@pytest.mark.visual
+@pytest.mark.parametrize("viewport", VISUAL_VIEWPORTS, ids=lambda v: v.name)
+@pytest.mark.parametrize("route", sorted(VISUAL_ROUTES))
+def test_visual_regression(page, base_url, visual_check, route, viewport):
+    """
+    Што тестираме (изглед):
+      - Screenshot од рутата на даден viewport е перцептуално ист со baseline-от
+        (perf/visual.py – phash + diff по блокови; датуми/carousel се маскирани
+        според perf/visual.json).
+    Како:
+      1) viewport → рута → клучните елементи видливи (query_elements, wait=True)
+      2) visual_check(route, viewport) – без baseline skip; --visual-update го снима
+    """
+    page.set_viewport_size({"width": viewport.width, "height": viewport.height})
+    page.goto(f"{base_url}{VISUAL_ROUTES[route]}")
+    ready = {"home": {"rooms": "section#rooms"},
+             "reservation": {"price": "text=Price Summary"}}[route]
+    MainPage(page, base_url).query_elements(ready, wait=True, timeout=20000)
+    visual_check(route, viewport.name)
@@ -0,0 +1,70 @@
+# tests/test_visual.py
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from perf.visual import VisualStore, compare_arrays, load_masks, phash
+
+
+def png(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(array.astype(np.uint8)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def page_like(height=480, width=320) -> np.ndarray:
+    """Сива „страница“: бел фон, темни ленти како текст, копче."""
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    for y in range(40, height - 40, 24):
+        image[y:y + 8, 20:width - 60] = 40
+    image[400:440, 20:140] = (13, 110, 253)
+    return image
+
+
+@pytest.mark.perf
+def test_phash_ignores_noise_and_block_diff_localizes_change():
+    base = page_like()
+    gray = base.astype(np.float32).mean(axis=2)
+    noisy = np.clip(gray + np.random.default_rng(1).normal(0, 2, gray.shape), 0, 255)
+    assert compare_arrays(gray, noisy) == (0, 0.0, None)
+
+    broken = base.copy()
+    broken[400:440, 20:140] = 255                        # копчето исчезнало
+    distance, ratio, bbox = compare_arrays(gray, broken.astype(np.float32).mean(axis=2))
+    assert 0 < ratio < 0.05
+    x, y, w, h = bbox
+    assert x <= 20 and y <= 400 and x + w >= 140 and y + h >= 440
+    assert np.count_nonzero(phash(gray) != phash(255 - gray)) > 32
+
+
+@pytest.mark.perf
+def test_store_masks_rects_and_skips_unchanged_screenshots(tmp_path, monkeypatch):
+    base = page_like()
+    missing = VisualStore(tmp_path / "baselines", tmp_path / "cache.json").compare("home-phone", png(base))
+    assert missing.source == "missing" and not missing.passed
+    assert not (tmp_path / "baselines").exists()
+
+    updating = VisualStore(tmp_path / "baselines", tmp_path / "cache.json", update=True)
+    assert updating.compare("home-phone", png(base)).source == "new-baseline"
+    store = VisualStore(tmp_path / "baselines", tmp_path / "cache.json")
+    assert store.compare("home-phone", png(base)).source == "identical"
+
+    dated = base.copy()
+    dated[10:30, 200:300] = 0                            # датум во header-от
+    assert not store.compare("home-phone", png(dated)).passed
+    result = store.compare("home-phone", png(dated), rects=[[200, 10, 100, 20]])
+    assert result.passed and result.source == "compared"
+    store.save_cache()
+
+    mask = [[200, 10, 100, 20]]
+    store = VisualStore(tmp_path / "baselines", tmp_path / "cache.json", max_distance=5)
+    assert store.compare("home-phone", png(dated), rects=mask).source == "compared"       # други прагови
+    store = VisualStore(tmp_path / "baselines", tmp_path / "cache.json")
+    assert store.compare("home-phone", png(dated), rects=[[200, 10, 100, 30]]).source == "compared"
+
+    store = VisualStore(tmp_path / "baselines", tmp_path / "cache.json")
+    monkeypatch.setattr("perf.visual.decode_png", lambda data: pytest.fail("decoded a cached screenshot"))
+    assert store.compare("home-phone", png(dated), rects=mask).source == "cache"
+    assert set(load_masks()) >= {"home", "reservation"}